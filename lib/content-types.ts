@@ -72,6 +72,8 @@ export interface ContentCollection<T extends BaseContentItem> {
   metadata: {
     /** Available categories for filtering */
     categories: string[];
+    /** Precomputed item count per category (item IDs per category are in facets.json) */
+    categoryCounts?: Record<string, number>;
   };
 }
 
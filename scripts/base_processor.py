@@ -6,14 +6,42 @@ Shared base class for all content processing scripts following DRY principles.
 Implements Single Responsibility Principle by providing unified content processing functionality.
 """
 
-import json
+import argparse
 import os
 import sys
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
+from operator import attrgetter
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Set, Union
-import yaml
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple, Type, Union
+from build_cache import BuildCache, FileResult, FingerprintBuilder, DEFAULT_CACHE_DIR
+from build_logging import (
+    ITEM, NORMAL, QUIET, VERBOSE, WARNING_PREVIEW_LIMIT, configure_logging, flush_logs, get_logger,
+    show_item_detail, write_report,
+)
+from catalog_records import CatalogRecord
+from category_facets import category_counts
+from content_source import ContentSource, SourceError, open_content_source
+from content_watcher import ContentWatcher, WatchTarget, DEFAULT_DEBOUNCE_SECONDS
+from item_index import ItemIndex, normalize_item_path
+from json_stream import CollectionReader, CollectionWriter
+from output_writer import (
+    COMPRESSION_FORMATS, OutputEncoding, ShardingOptions, format_savings, format_size, serialize,
+    to_columnar, write_encoded, write_sharded_output,
+)
+from parallel_processing import process_in_pool, resolve_jobs
+from processing_context import ProcessingContext
+from profiling import DEFAULT_PROFILE_DIR, DEFAULT_SLOWEST_FILES, TRACE_KEYS, ProfileOptions, RunProfiler
+from read_ahead import DEFAULT_PREFETCH_DEPTH, DEFAULT_PREFETCH_MB, ReadAhead, ReadAheadOptions, ReadAheadStats
+from source_document import SourceDocument
+from validation_rules import ERROR, WARNING, CompiledRules, DiagnosticLog, RuleSet
+from yaml_loader import YAML_BACKEND, load_yaml
+
+
+logger = get_logger("processor")
+# Diagnostics list source files by name
+source_name = attrgetter("name")
 
 
 class CategoryManager:
@@ -36,52 +64,6 @@ class CategoryManager:
         
         return sorted(categories)
     
-    @staticmethod
-    def validate_categories(categories: List[str]) -> Dict[str, Any]:
-        """Validate category list and return validation result."""
-        errors = []
-        warnings = []
-        
-        if not isinstance(categories, list):
-            errors.append("Categories must be a list")
-            return {"valid": False, "errors": errors, "warnings": warnings}
-        
-        unique_categories = set()
-        duplicates = set()
-        
-        for i, category in enumerate(categories):
-            if not isinstance(category, str):
-                errors.append(f"Category at index {i} is not a string: {type(category)}")
-                continue
-                
-            trimmed = category.strip()
-            if not trimmed:
-                errors.append(f"Category at index {i} is empty or whitespace-only")
-                continue
-                
-            if trimmed in unique_categories:
-                duplicates.add(trimmed)
-            else:
-                unique_categories.add(trimmed)
-                
-            # Check for whitespace issues
-            if trimmed != category:
-                warnings.append(f"Category '{category}' has leading/trailing whitespace")
-                
-            # Check for consistent casing
-            if trimmed.lower() == trimmed or trimmed.upper() == trimmed:
-                warnings.append(f"Category '{category}' should use Title Case")
-        
-        if duplicates:
-            errors.append(f"Duplicate categories found: {', '.join(sorted(duplicates))}")
-        
-        return {
-            "valid": len(errors) == 0,
-            "errors": errors,
-            "warnings": warnings,
-            "normalized": sorted(unique_categories)
-        }
-    
     @staticmethod
     def normalize_categories(categories: List[str]) -> List[str]:
         """Normalize categories by removing duplicates, trimming, and sorting."""
@@ -120,6 +102,15 @@ class BaseContentProcessor(ABC):
     - Dependency Inversion: Depends on abstractions
     """
     
+    # Bump when processing logic changes to invalidate incremental build caches
+    PROCESSOR_VERSION = "1.0.0"
+    # Slotted record type for processed and existing items (see catalog_records)
+    record_type: Optional[Type[CatalogRecord]] = None
+    # Catalog path prefix of item paths (e.g. '.krci-ai/tasks'); None for items
+    # without a path field, which are then identified by extract_item_id.
+    # Also the expected path prefix in the validation rules.
+    path_prefix: Optional[str] = None
+    
     def __init__(self, content_type: str, source_extensions: List[str] = None):
         """
         Initialize the processor.
@@ -134,6 +125,68 @@ class BaseContentProcessor(ABC):
         self.processed_items = []
         self.errors = []
         self.warnings = []
+        self.cache: Optional[BuildCache] = None
+        self.jobs = 1
+        self.sharding = ShardingOptions()
+        self.encoding = OutputEncoding()
+        self.deterministic = False
+        # Timestamp used by create_metadata; None means "now"
+        self.generated_at: Optional[str] = None
+        # Newest source mtime of the current run (deterministic mode)
+        self.source_epoch: Optional[float] = None
+        # Previous output, used to keep generatedAt stable when nothing changed
+        self.previous_generated_at: Optional[str] = None
+        self.previous_fingerprint: Optional[str] = None
+        # Whether processors record cross-references; only the dependency graph
+        # of build-catalog uses them, so standalone runs skip collecting them
+        self.collect_references = False
+        # References collected while processing the current file (see add_reference)
+        self.current_references: Dict[str, List[str]] = {}
+        # Item key (see item_key) -> references of every valid item from the last run
+        self.item_references: Dict[str, Dict[str, List[str]]] = {}
+        # Counters for the current file and totals for the last run (see record_stat)
+        self.current_stats: Dict[str, float] = {}
+        self.run_stats: Dict[str, float] = {}
+        # Resolved locations of the current run, shared by all hooks (see create_context)
+        self.context: Optional[ProcessingContext] = None
+        # Open view of the file being processed, shared by all steps (see open_document)
+        self.current_document: Optional[SourceDocument] = None
+        # Where source files are read from: the file system, an archive or a git ref (see --source)
+        self.source = ContentSource()
+        # Read-ahead settings, the prefetched (path, bytes) of the file being
+        # processed and the read-ahead totals of the last run
+        self.read_ahead = ReadAheadOptions()
+        self.prefetched: Optional[Tuple[Path, bytes]] = None
+        self.read_ahead_stats: Optional[ReadAheadStats] = None
+        # Profiling settings and the timings of the current run
+        self.profile = ProfileOptions()
+        self.profiler: Optional[RunProfiler] = None
+        # Per-file outcomes of the last run, whether per-item lines are shown,
+        # the JSON report of the last run and where to write it (see --report)
+        self.item_log: List[Dict[str, str]] = []
+        self.show_items = True
+        self.last_report: Optional[Dict[str, Any]] = None
+        self.report_file: Optional[Path] = None
+        # Compiled validation rules (see get_validation_rules) and the findings of the last run
+        self.validator: Optional[CompiledRules] = None
+        self.diagnostics = DiagnosticLog(source_name)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle only configuration; run state stays in the parent process."""
+        state = self.__dict__.copy()
+        state.update(cache=None, processed_items=[], errors=[], warnings=[], item_references={},
+                     run_stats={}, current_document=None, prefetched=None, read_ahead_stats=None,
+                     profiler=None, item_log=[],
+                     last_report=None, validator=None, diagnostics=DiagnosticLog(source_name))
+        return state
+    
+    def enable_cache(self, cache_dir: Path = None) -> None:
+        """Enable the incremental build cache for subsequent runs."""
+        signature = f"{type(self).__name__}:{self.PROCESSOR_VERSION}"
+        if self.collect_references:
+            # Cached results without references cannot feed the dependency graph
+            signature += ":references"
+        self.cache = BuildCache(cache_dir or DEFAULT_CACHE_DIR, self.content_type, signature)
     
     @abstractmethod
     def find_source_directory(self, project_root: Path = None) -> Path:
@@ -150,43 +203,106 @@ class BaseContentProcessor(ABC):
         """Create the output JSON structure."""
         pass
     
-    def discover_files(self, source_dir: Path) -> List[Path]:
-        """Discover all processable files in the source directory."""
-        if not source_dir.exists():
-            raise ProcessingError(f"Source directory does not exist: {source_dir}")
+    def discover_files(self, source_dir: Path) -> Iterator[Path]:
+        """
+        Discover all processable files in the source directory.
         
-        files = []
-        for extension in self.source_extensions:
-            pattern = f"*{extension}"
-            files.extend(source_dir.rglob(pattern))
+        Walks the tree once, honoring .krciignore files, and yields paths in
+        sorted order as they are found.
+        """
+        if not self.source.exists(source_dir):
+            raise ProcessingError(f"Source directory does not exist: {source_dir}")
         
-        # Sort for consistent ordering
-        return sorted(files)
+        return self.source.iter_files(source_dir, self.source_extensions)
     
-    def load_existing_data(self, output_file: Path) -> Dict[str, Dict[str, Any]]:
-        """Load existing data to preserve manual fields."""
+    def load_existing_data(self, output_file: Path) -> ItemIndex:
+        """
+        Load existing data to preserve manual fields.
+        
+        Items are indexed by item_key (their catalog path where they have
+        one) with ids and path stems as aliases; duplicate keys are reported
+        as warnings and only the first item is kept.
+        """
+        existing = ItemIndex()
         if not output_file.exists():
-            return {}
+            return existing
         
         try:
-            with open(output_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            existing = {}
-            items_key = self.get_items_key()
+            # Stream the items so the previous document is never held whole
+            reader = CollectionReader(output_file, self.get_items_key())
+            items_fingerprint = FingerprintBuilder()
             
-            for item in data.get(items_key, []):
-                # Use extract_item_id to get the correct key for matching
-                item_key = self.extract_item_id(item)
+            for item in reader:
+                items_fingerprint.add(item)
+                item_key = self.item_key(item)
                 if item_key:
-                    existing[item_key] = item
+                    existing.add(item_key, self.as_record(item), self.item_aliases(item))
             
-            print(f"📖 Loaded existing data for {len(existing)} {self.content_type}")
+            self.remember_previous_output(reader.rest, items_fingerprint)
+            
+            for key in existing.collisions:
+                self.warnings.append(f"{output_file.name}: Duplicate existing entries for '{key}', "
+                                     f"keeping the first")
+            logger.info(f"📖 Loaded existing data for {len(existing)} {self.content_type}")
             return existing
             
         except Exception as e:
-            print(f"⚠ Could not load existing file: {e}")
-            return {}
+            logger.warning(f"⚠ Could not load existing file: {e}")
+            return ItemIndex()
+    
+    def as_record(self, item: Any) -> Any:
+        """
+        Convert a plain item dict into this processor's slotted record type.
+        
+        Records take less memory than dicts and serialize identically; items
+        that are already records, or processors without a record type, pass
+        through unchanged.
+        """
+        if self.record_type is not None and type(item) is dict:
+            return self.record_type.from_dict(item)
+        return item
+    
+    def item_key(self, item: Dict[str, Any]) -> Optional[str]:
+        """Identity of an existing item: its normalized catalog path, else its id."""
+        if self.path_prefix is not None and item.get('path'):
+            return normalize_item_path(str(item['path']))
+        return self.extract_item_id(item)
+    
+    def item_aliases(self, item: Dict[str, Any]) -> List[str]:
+        """Other names an existing item can be matched by (id and path stem)."""
+        aliases = [self.extract_item_id(item)]
+        if item.get('path'):
+            aliases.append(Path(str(item['path'])).stem)
+        return [alias for alias in aliases if alias]
+    
+    def source_key(self, file_path: Path) -> str:
+        """Identity of the item a source file produces, matching item_key."""
+        if self.path_prefix is not None:
+            return normalize_item_path(self.relative_source_path(file_path, self.path_prefix))
+        return file_path.stem
+    
+    def match_existing(self, existing: ItemIndex, files: List[Path],
+                       live_keys: Optional[Set[str]] = None) -> List[Optional[str]]:
+        """
+        Key of the existing item for each source file, or None for new files.
+        
+        Files match by path first. The id/stem alias (moved files, items
+        without a path) is only followed to an item that no live source
+        claims by path, and to each such item at most once, so a new file
+        never takes over a same-named file's curated fields in another folder.
+        
+        Args:
+            live_keys: Keys of every current source file; defaults to those of `files`
+        """
+        keys = [self.source_key(file_path) for file_path in files]
+        claimed = set(keys if live_keys is None else live_keys)
+        matched = []
+        for file_path, key in zip(files, keys):
+            resolved = existing.resolve(key, file_path.stem, claimed)
+            if resolved is not None and resolved != key:
+                claimed.add(resolved)
+            matched.append(resolved)
+        return matched
     
     def extract_item_id(self, item: Dict[str, Any]) -> Optional[str]:
         """Extract item ID from various possible fields."""
@@ -202,56 +318,150 @@ class BaseContentProcessor(ABC):
         """Get the key name for items in the JSON structure."""
         return self.content_type.lower()
     
-    def validate_item(self, item: Dict[str, Any], file_path: Path) -> bool:
-        """Validate a processed item."""
-        required_fields = self.get_required_fields()
-        missing_fields = []
-        
-        for field in required_fields:
-            if field not in item or not item[field]:
-                missing_fields.append(field)
-        
-        if missing_fields:
-            error_msg = f"{file_path.name}: Missing required fields: {', '.join(missing_fields)}"
-            self.errors.append(error_msg)
-            return False
+    def get_validation_rules(self) -> RuleSet:
+        """Declarative validation rules for this content type."""
+        return RuleSet(required_fields=tuple(self.get_required_fields()), path_prefix=self.path_prefix)
+    
+    def validate_batch(self, batch: List[Tuple[Path, Dict[str, Any]]]) -> List[bool]:
+        """
+        Validate (source file, item) pairs in one pass with the compiled rules.
         
-        # Validate categories if present
-        if 'categories' in item:
-            validation_result = self.category_manager.validate_categories(item['categories'])
-            if not validation_result['valid']:
-                for error in validation_result['errors']:
-                    self.errors.append(f"{file_path.name}: Category error - {error}")
-            
-            for warning in validation_result['warnings']:
-                self.warnings.append(f"{file_path.name}: Category warning - {warning}")
-            
-            # Normalize categories
-            item['categories'] = validation_result['normalized']
+        Findings go to self.diagnostics, deduplicated by rule and message;
+        categories are normalized in place.
         
-        return True
+        Returns:
+            Whether each item is valid, in batch order
+        """
+        if self.validator is None:
+            self.validator = self.get_validation_rules().compile()
+        return self.validator.validate(batch, self.diagnostics)
+    
+    def validate_results(self, outcomes: List[Tuple[Path, FileResult]]) -> None:
+        """Validate the items of all successfully processed files, setting result.valid."""
+        checked = [(file_path, result) for file_path, result in outcomes if result.failure is None]
+        valid = self.validate_batch([(file_path, result.item) for file_path, result in checked])
+        for (_, result), item_valid in zip(checked, valid):
+            result.valid = item_valid
+    
+    def report_diagnostics(self) -> None:
+        """Add the rendered validation diagnostics to the run's warnings and errors."""
+        self.warnings.extend(self.diagnostics.rendered(WARNING))
+        self.errors.extend(self.diagnostics.rendered(ERROR))
     
     def get_required_fields(self) -> List[str]:
         """Get list of required fields for validation."""
         return ['id', 'name', 'description']
     
     def create_metadata(self, items: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Create metadata for the content collection."""
-        categories = self.category_manager.extract_categories(items)
+        """Create metadata for the content collection, including per-category item counts."""
+        counts = category_counts(items)
         
         return {
             f"total{self.content_type.title()}": len(items),
-            "categories": categories,
-            "generatedAt": datetime.now().isoformat() + "Z",
+            "categories": list(counts),
+            "categoryCounts": counts,
+            "generatedAt": self.generated_at or datetime.now().isoformat() + "Z",
             "version": "1.0.0"
         }
     
+    def content_fingerprint(self, data: Dict[str, Any]) -> str:
+        """Fingerprint an output structure, ignoring its generatedAt timestamp."""
+        items_key = self.get_items_key()
+        items_fingerprint = FingerprintBuilder()
+        for item in data.get(items_key, []):
+            items_fingerprint.add(item)
+        rest = {key: value for key, value in data.items() if key != items_key}
+        return self.finish_fingerprint(items_fingerprint, rest)
+    
+    @staticmethod
+    def finish_fingerprint(items_fingerprint: FingerprintBuilder, rest: Dict[str, Any]) -> str:
+        """Complete an item-by-item fingerprint with the other top-level values."""
+        metadata = dict(rest.get("metadata") or {})
+        metadata.pop("generatedAt", None)
+        items_fingerprint.add({**rest, "metadata": metadata})
+        return items_fingerprint.hexdigest()
+    
+    def remember_previous_output(self, rest: Dict[str, Any], items_fingerprint: FingerprintBuilder) -> None:
+        """
+        Record what the previous output contained, for deterministic builds.
+        
+        Args:
+            rest: Top-level values other than the items (metadata)
+            items_fingerprint: Fingerprint of the previous items, in order
+        """
+        self.previous_generated_at = (rest.get("metadata") or {}).get("generatedAt")
+        self.previous_fingerprint = self.finish_fingerprint(items_fingerprint, rest)
+    
+    def record_source_mtimes(self, files: Iterable[Path]) -> None:
+        """Track the newest source modification time seen in this run."""
+        for file_path in files:
+            try:
+                mtime = self.source.stat(file_path).st_mtime
+            except OSError:
+                continue
+            if self.source_epoch is None or mtime > self.source_epoch:
+                self.source_epoch = mtime
+    
+    def deterministic_timestamp(self) -> Optional[str]:
+        """
+        Derive generatedAt from the sources instead of the wall clock.
+        
+        SOURCE_DATE_EPOCH (reproducible-builds convention) takes precedence,
+        otherwise the newest source file mtime is used.
+        """
+        epoch = os.environ.get("SOURCE_DATE_EPOCH")
+        if epoch is None and self.source_epoch is None:
+            return None
+        seconds = int(epoch) if epoch is not None else int(self.source_epoch)
+        timestamp = datetime.fromtimestamp(seconds, tz=timezone.utc).replace(tzinfo=None)
+        return timestamp.isoformat() + "Z"
+    
+    def previous_epoch(self) -> Optional[float]:
+        """The generatedAt of the previous output as an epoch, or None if it has none."""
+        if not self.previous_generated_at:
+            return None
+        try:
+            value = datetime.fromisoformat(self.previous_generated_at.rstrip("Z"))
+        except ValueError:
+            return None
+        return value.replace(tzinfo=timezone.utc).timestamp()
+    
     def write_output(self, output_file: Path, data: Dict[str, Any]) -> None:
-        """Write the processed data to output file."""
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        """
+        Write the processed data to output file.
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        Uses pretty-printed JSON by default, streamed item by item; self.encoding
+        can switch to minified JSON, add a <name>.columnar.json sibling and
+        precompressed .gz/.br siblings, in which case byte savings are reported.
+        """
+        if self.encoding.is_default:
+            with CollectionWriter(output_file) as writer:
+                for key, value in data.items():
+                    if isinstance(value, list):
+                        writer.write_items(key, value)
+                    else:
+                        writer.write_value(key, value)
+            self.count_output_bytes(writer.size)
+            if not writer.changed:
+                logger.info(f"⏭ {output_file.name} unchanged, skipped write")
+            return
+        
+        pretty = serialize(data)
+        encoded = serialize(data, minify=True) if self.encoding.minify else pretty
+        sizes = write_encoded(output_file, encoded, self.encoding.compress)
+        
+        if self.encoding.columnar:
+            columnar_file = output_file.with_name(f"{output_file.stem}.columnar.json")
+            columnar = serialize(to_columnar(data, self.get_items_key()), minify=True)
+            sizes.update(write_encoded(columnar_file, columnar, self.encoding.compress))
+        
+        self.count_output_bytes(sum(sizes.values()))
+        logger.info(f"📦 {output_file.name}: {format_savings(len(pretty), sizes)}")
+    
+    def count_output_bytes(self, size: int) -> None:
+        """Record encoded output size for the run profile."""
+        if self.profiler is not None and self.profiler.enabled:
+            self.profiler.count("output.bytes", size)
     
     def calculate_relative_path(self, file_path: Path, source_root: Path, prefix: str = None) -> str:
         """Calculate relative path for content files."""
@@ -291,84 +501,646 @@ class BaseContentProcessor(ABC):
         """
         Main processing workflow.
         
+        Runs the full workflow and terminates the interpreter with a non-zero
+        exit code on failure, as expected by the standalone entry points.
+        """
+        try:
+            succeeded = self.run(output_file, project_root)
+        except Exception as e:
+            logger.error(f"❌ Fatal error processing {self.content_type}: {e}")
+            flush_logs()
+            sys.exit(1)
+        
+        if not succeeded:
+            sys.exit(1)
+    
+    def run(self, output_file: Path = None, project_root: Path = None,
+            files: Iterable[Path] = None) -> bool:
+        """
+        Run the processing workflow without exiting the interpreter.
+        
         This method orchestrates the entire processing workflow following
         the Template Method pattern.
+        
+        Args:
+            output_file: Output JSON file (defaults to public/data/<type>.json)
+            project_root: Root used to locate the source directory
+            files: Pre-discovered source files; skips discovery when provided
+        
+        Returns:
+            True when processing finished without errors
         """
-        try:
-            print(f"🚀 Processing KubeRocketAI {self.content_type}...")
-            
-            # Find source directory
-            source_dir = self.find_source_directory(project_root)
-            print(f"📁 Found {self.content_type} directory: {source_dir}")
-            
-            # Set default output file if not provided
-            if output_file is None:
-                output_file = Path(f"public/data/{self.content_type.lower()}.json")
-            
-            # Load existing data
+        logger.info(f"🚀 Processing KubeRocketAI {self.content_type}...")
+        self.profiler = RunProfiler(self.content_type, self.profile)
+        
+        # Resolve source directory and output once for the whole run
+        with self.profiler.phase("resolve"):
+            self.context = self.create_context(output_file, project_root)
+        source_dir = self.context.source_root
+        output_file = self.context.output_file
+        logger.info(f"📁 Found {self.content_type} directory: {source_dir}")
+        
+        # Load existing data
+        with self.profiler.phase("load-existing"):
             existing_data = self.load_existing_data(output_file)
-            
-            # Discover files
+        
+        if self.cache:
+            with self.profiler.phase("cache-load"):
+                self.cache.load(source_dir, self.source)
+        
+        # Discover files, then match them to existing items and cached results
+        if files is None:
             files = self.discover_files(source_dir)
-            print(f"📄 Found {len(files)} {self.content_type} files")
-            
-            # Process each file
-            processed_items = []
-            for file_path in files:
-                try:
-                    item_id = file_path.stem
-                    existing_item = existing_data.get(item_id)
-                    
-                    processed_item = self.process_file(file_path, existing_item)
-                    
-                    if self.validate_item(processed_item, file_path):
-                        processed_items.append(processed_item)
-                        
-                        status = "preserved" if existing_item else "new"
-                        print(f"✓ {file_path.name}: {processed_item.get('name', item_id)} ({status})")
-                    else:
-                        print(f"✗ {file_path.name}: Validation failed")
-                        
-                except Exception as e:
-                    error_msg = f"Error processing {file_path.name}: {e}"
-                    self.errors.append(error_msg)
-                    print(f"✗ {error_msg}")
-            
-            # Sort items for consistent output
-            processed_items.sort(key=lambda x: x.get('name', x.get('id', '')))
-            
-            # Create output structure
-            output_data = self.get_output_structure(processed_items)
-            
-            # Write output
+        
+        results: List[Optional[FileResult]] = []
+        pending: List[int] = []
+        with self.profiler.phase("discover"):
+            files = list(files)
+            # Matched once every source is known, so aliases skip items other files claim by path
+            existing_items = [existing_data.get(key) for key in self.match_existing(existing_data, files)]
+            for file_path, existing_item in zip(files, existing_items):
+                result = self.cache.lookup(file_path, existing_item) if self.cache else None
+                if result is None:
+                    pending.append(len(results))
+                results.append(result)
+        
+        logger.info(f"📄 Found {len(files)} {self.content_type} files")
+        self.show_items = show_item_detail(logger, len(files))
+        if self.deterministic:
+            self.record_source_mtimes(files)
+        
+        # Process the files without a cached result
+        self.read_ahead_stats = None
+        tasks = [(files[index], existing_items[index]) for index in pending]
+        with self.profiler.phase("process"):
+            for index, (file_path, existing_item), result in zip(pending, tasks, self.process_batch(tasks)):
+                results[index] = result
+                if self.cache:
+                    self.cache.store(file_path, existing_item, result)
+        
+        # Validate all processed items in one pass, cached ones included
+        self.diagnostics = DiagnosticLog(source_name)
+        with self.profiler.phase("validate"):
+            self.validate_results(list(zip(files, results)))
+        
+        # Merge results in discovery order so output is independent of --jobs
+        processed_items = []
+        self.item_references = {}
+        self.run_stats = {}
+        self.item_log = []
+        item_sources: Dict[str, Path] = {}
+        with self.profiler.phase("merge"):
+            for file_path, existing_item, result in zip(files, existing_items, results):
+                item_id = file_path.stem
+                self.warnings.extend(result.warnings)
+                self.errors.extend(result.errors)
+                self.merge_stats(result.stats)
+                self.profiler.add_file(file_path, result.stats)
+                
+                if result.valid and result.failure is None:
+                    processed_items.append(self.as_record(result.item))
+                    item_id = str(result.item.get('id', item_id))
+                    self.check_duplicate_id(item_id, file_path, item_sources)
+                    if result.references:
+                        # By path key: items in different folders may share an id
+                        self.item_references[self.item_key(result.item) or self.source_key(file_path)] = result.references
+                
+                status = "preserved" if existing_item is not None else "new"
+                self.record_item(file_path, result, status)
+        
+        self.report_diagnostics()
+        self.log_item_summary()
+        self.print_yaml_stats()
+        self.print_read_ahead_stats()
+        
+        if self.cache:
+            with self.profiler.phase("cache-save"):
+                self.cache.save()
+            logger.info(f"♻ Build cache: {self.cache.hits} reused, {self.cache.misses} processed, "
+                        f"{self.cache.removed} removed")
+        
+        succeeded = self.finalize(output_file, processed_items)
+        if self.profile.enabled:
+            self.profiler.finish()
+        
+        self.last_report = self.build_report(output_file, succeeded)
+        if self.report_file:
+            write_report(self.report_file, [self.last_report], succeeded)
+        flush_logs()
+        return succeeded
+    
+    def check_duplicate_id(self, item_id: str, file_path: Path, item_sources: Dict[str, Path]) -> None:
+        """Warn when two source files produce the same item id."""
+        other = item_sources.setdefault(item_id, file_path)
+        if other != file_path:
+            self.warnings.append(f"{self.source_key(file_path)}: Duplicate id '{item_id}' "
+                                 f"(also produced by {self.source_key(other)})")
+    
+    def record_item(self, file_path: Path, result: Optional[FileResult], status: str) -> None:
+        """
+        Record the outcome for one source file and log its per-item line.
+        
+        Args:
+            file_path: Source file
+            result: Processing result, or None if the file was removed
+            status: Outcome for valid items ('new', 'preserved', 'updated', 'removed')
+        """
+        entry = {"file": str(file_path), "status": status}
+        if result is None:
+            message = f"− {file_path.name}: removed"
+        elif result.failure is not None:
+            entry["status"] = "failed"
+            message = f"✗ {result.failure}"
+        elif result.valid:
+            entry.update(id=str(result.item.get('id', file_path.stem)), name=str(result.item.get('name', '')))
+            message = f"✓ {file_path.name}: {result.item.get('name', file_path.stem)} ({status})"
+        else:
+            entry["status"] = "invalid"
+            message = f"✗ {file_path.name}: Validation failed"
+        
+        self.item_log.append(entry)
+        if self.show_items:
+            logger.log(ITEM, message)
+    
+    def item_status_counts(self) -> Dict[str, int]:
+        """Number of items per outcome of the last run (e.g. new, preserved, invalid, failed)."""
+        counts: Dict[str, int] = {}
+        for entry in self.item_log:
+            counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+        return dict(sorted(counts.items()))
+    
+    def log_item_summary(self) -> None:
+        """Summarize per-item outcomes when the per-item lines were not shown."""
+        if self.show_items or not self.item_log:
+            return
+        counts = ", ".join(f"{count} {status}" for status, count in self.item_status_counts().items())
+        logger.info(f"📋 {len(self.item_log)} files: {counts} (per-item lines hidden; use --verbose)")
+    
+    def build_report(self, output_file: Path, succeeded: bool) -> Dict[str, Any]:
+        """Machine-readable summary of the last run (see --report)."""
+        report = {
+            "contentType": self.content_type,
+            "sourceDir": str(self.context.source_root) if self.context else None,
+            "outputFile": str(output_file),
+            "succeeded": succeeded,
+            "files": len(self.item_log),
+            "items": len(self.processed_items),
+            "statusCounts": self.item_status_counts(),
+            "warnings": list(self.warnings),
+            "errors": list(self.errors),
+            "diagnostics": self.diagnostics.to_report(),
+            "entries": self.item_log,
+        }
+        if self.cache:
+            report["cache"] = {"hits": self.cache.hits, "misses": self.cache.misses,
+                               "removed": self.cache.removed}
+        if self.read_ahead_stats:
+            report["readAhead"] = self.read_ahead_stats.to_dict()
+        return report
+    
+    def create_context(self, output_file: Path = None, project_root: Path = None) -> ProcessingContext:
+        """Resolve the source directory, project root and output file for a run."""
+        project_root = project_root or self.source.root
+        if output_file is None:
+            output_file = Path(f"public/data/{self.content_type.lower()}.json")
+        return ProcessingContext(
+            content_type=self.content_type,
+            source_root=self.find_source_directory(project_root),
+            project_root=project_root,
+            output_file=output_file,
+        )
+    
+    def relative_source_path(self, file_path: Path, prefix: str = None) -> str:
+        """Relative catalog path of a source file within the current run's source root."""
+        if self.context is None:
+            self.context = self.create_context()
+        return self.context.relative_path(file_path, prefix)
+    
+    def finalize(self, output_file: Path, processed_items: List[Dict[str, Any]]) -> bool:
+        """
+        Sort, write and report the processed items.
+        
+        Returns:
+            True when no errors were recorded
+        """
+        # Sort items for consistent output
+        with self.profiler.phase("sort"):
+            self.sort_items(processed_items)
+        self.processed_items = processed_items
+        
+        # Create output structure
+        if self.deterministic:
+            self.generated_at = self.deterministic_timestamp()
+        output_data = self.get_output_structure(processed_items)
+        
+        if (self.deterministic and self.previous_generated_at and
+                self.content_fingerprint(output_data) == self.previous_fingerprint):
+            # Content unchanged: keep the previous timestamp so the bytes match
+            output_data["metadata"]["generatedAt"] = self.previous_generated_at
+        
+        # Write output
+        with self.profiler.phase("write"):
             self.write_output(output_file, output_data)
+        if self.sharding.enabled:
+            with self.profiler.phase("shards"):
+                manifest_file = write_sharded_output(
+                    output_file, self.get_items_key(), processed_items,
+                    output_data.get("metadata", {}), self.sharding,
+                )
+            logger.info(f"🧩 Wrote sharded layout: {manifest_file}")
+        
+        # Print summary
+        self.print_summary(output_file, processed_items)
+        
+        # Print warnings and errors
+        if self.warnings:
+            logger.warning(f"\n⚠ Warnings ({len(self.warnings)}):")
+            shown = self.warnings if self.show_items else self.warnings[:WARNING_PREVIEW_LIMIT]
+            for warning in shown:
+                logger.warning(f"  - {warning}")
+            if len(shown) < len(self.warnings):
+                logger.warning(f"  ... and {len(self.warnings) - len(shown)} more (use --verbose or --report)")
+        
+        if self.errors:
+            logger.error(f"\n❌ Errors ({len(self.errors)}):")
+            for error in self.errors:
+                logger.error(f"  - {error}")
+            return False
+        
+        return True
+    
+    def sort_items(self, items: List[Dict[str, Any]]) -> None:
+        """Sort items in place into output order (by name, falling back to id)."""
+        items.sort(key=lambda x: x.get('name', x.get('id', '')))
+    
+    def patch_output(self, output_file: Path, changed_files: Iterable[Path]) -> bool:
+        """
+        Reprocess only the given source files and patch them into the output.
+        
+        Items for changed or added files are replaced, items for deleted files
+        are dropped, and every other item of the existing output is kept as is.
+        Used by watch mode for fast regeneration after single edits.
+        
+        Returns:
+            True when patching finished without errors
+        """
+        self.errors = []
+        self.warnings = []
+        self.profiler = RunProfiler(self.content_type)
+        changed_files = sorted(set(changed_files))
+        self.item_log = []
+        self.show_items = show_item_detail(logger, len(changed_files))
+        
+        if self.context is None or self.context.output_file != output_file:
+            self.context = self.create_context(output_file)
+        
+        existing_data = self.load_existing_data(output_file)
+        items = dict(existing_data.items)
+        
+        if self.deterministic:
+            surviving = [path for path in changed_files if self.source.exists(path)]
+            if surviving:
+                self.source_epoch = None
+                self.record_source_mtimes(surviving)
+            elif self.source_epoch is None:
+                # Only deletions: keep the epoch of the output being patched
+                self.source_epoch = self.previous_epoch()
+        
+        present = []
+        for file_path in changed_files:
+            if self.source.exists(file_path):
+                present.append(file_path)
+                continue
+            # Removals match by exact key only, so a deleted file never drops
+            # a different item that merely shares its stem
+            removed = items.pop(self.source_key(file_path), None)
+            if removed is not None:
+                self.item_references.pop(self.item_key(removed), None)
+                self.record_item(file_path, None, "removed")
+        
+        # An item matched through an alias (moved file, no path) is replaced,
+        # unless another source file still exists at its path
+        live_keys = None
+        if present:
+            live_keys = {self.source_key(path) for path in self.discover_files(self.context.source_root)}
+        patched = []
+        for file_path, existing_key in zip(present, self.match_existing(existing_data, present, live_keys)):
+            existing_item = existing_data.get(existing_key)
+            patched.append((file_path, self.source_key(file_path), existing_key,
+                            self.process_source_file(file_path, existing_item)))
+        
+        self.diagnostics = DiagnosticLog(source_name)
+        self.validate_results([(file_path, result) for file_path, _, _, result in patched])
+        
+        for file_path, item_key, existing_key, result in patched:
+            self.warnings.extend(result.warnings)
+            self.errors.extend(result.errors)
             
-            # Print summary
-            self.print_summary(output_file, processed_items)
-            
-            # Print warnings and errors
-            if self.warnings:
-                print(f"\n⚠ Warnings ({len(self.warnings)}):")
-                for warning in self.warnings:
-                    print(f"  - {warning}")
-            
-            if self.errors:
-                print(f"\n❌ Errors ({len(self.errors)}):")
-                for error in self.errors:
-                    print(f"  - {error}")
-                sys.exit(1)
-            
+            if result.valid and result.failure is None:
+                if existing_key is not None:
+                    replaced = items.pop(existing_key, None)
+                    if replaced is not None:
+                        self.item_references.pop(self.item_key(replaced), None)
+                items[item_key] = self.as_record(result.item)
+                # Keep the references of the dependency graph in step with the patched items
+                if result.references:
+                    self.item_references[self.item_key(result.item) or item_key] = result.references
+            status = "updated" if existing_key is not None else "new"
+            self.record_item(file_path, result, status)
+        
+        self.report_diagnostics()
+        self.log_item_summary()
+        succeeded = self.finalize(output_file, list(items.values()))
+        flush_logs()
+        return succeeded
+    
+    def process_batch(self, tasks: List[tuple]) -> List[FileResult]:
+        """
+        Process (file_path, existing_item) pairs, on a process pool when jobs > 1.
+        
+        A sequential run reads the following files on background threads
+        (see --prefetch), so parsing overlaps with file-system latency.
+        """
+        jobs = min(resolve_jobs(self.jobs), len(tasks))
+        if jobs > 1:
+            logger.info(f"⚙ Processing {len(tasks)} {self.content_type} files with {jobs} workers")
+            return process_in_pool(self, tasks, jobs)
+        
+        if not self.read_ahead.enabled or len(tasks) < 2:
+            return [self.process_source_file(file_path, existing_item) for file_path, existing_item in tasks]
+        
+        results = []
+        with ReadAhead((file_path for file_path, _ in tasks), self.read_ahead, self.source.read_bytes) as read_ahead:
+            for file_path, existing_item in tasks:
+                data = read_ahead.take(file_path)
+                self.prefetched = (file_path, data) if data is not None else None
+                try:
+                    results.append(self.process_source_file(file_path, existing_item))
+                finally:
+                    self.prefetched = None
+        self.read_ahead_stats = read_ahead.stats
+        return results
+    
+    def prefetched_bytes(self, file_path: Path) -> Optional[bytes]:
+        """Content of the file being processed if read ahead, else None."""
+        if self.prefetched is not None and self.prefetched[0] == file_path:
+            return self.prefetched[1]
+        return None
+    
+    def process_source_file(self, file_path: Path, existing_item: Dict[str, Any] = None) -> FileResult:
+        """
+        Process one file, capturing the diagnostics it produced.
+        
+        Diagnostics are moved out of self.warnings/self.errors into the result,
+        so results from the cache, the current process and worker processes are
+        all merged the same way. Items are validated afterwards, as a batch
+        (see validate_batch).
+        """
+        warnings_mark = len(self.warnings)
+        errors_mark = len(self.errors)
+        self.current_references = {}
+        self.current_stats = {}
+        profiling = self.profile.enabled
+        if profiling:
+            started = time.perf_counter()
+            cpu_started = time.process_time()
+        
+        try:
+            item = self.process_file(file_path, existing_item)
+            valid = True
+            failure = None
         except Exception as e:
-            print(f"❌ Fatal error processing {self.content_type}: {e}")
-            sys.exit(1)
+            item = None
+            valid = False
+            failure = f"Error processing {file_path.name}: {e}"
+        finally:
+            self.close_document()
+        
+        # Per-file timings are only collected for --profile runs
+        if profiling:
+            self.record_stat("time.process", time.perf_counter() - started)
+            self.record_stat("cpu.file", time.process_time() - cpu_started)
+            self.record_stat("trace.start", started)
+            self.record_stat("trace.pid", os.getpid())
+        
+        warnings = self.warnings[warnings_mark:]
+        errors = self.errors[errors_mark:]
+        if failure is not None:
+            errors.append(failure)
+        del self.warnings[warnings_mark:]
+        del self.errors[errors_mark:]
+        
+        references, self.current_references = self.current_references, {}
+        stats, self.current_stats = self.current_stats, {}
+        return FileResult(item=item, valid=valid, warnings=warnings, errors=errors,
+                          references=references, failure=failure, stats=stats)
+    
+    def open_document(self, file_path: Path) -> SourceDocument:
+        """
+        Get the shared, lazily read view of the file being processed.
+        
+        Every step handling the same file reads through one open handle;
+        it is closed when processing of that file finishes.
+        """
+        if self.current_document is None or self.current_document.path != file_path:
+            self.close_document()
+            self.current_document = SourceDocument(file_path, self.prefetched_bytes(file_path), self.source.open)
+        return self.current_document
+    
+    def close_document(self) -> None:
+        """Close the current file and record how much of it was read."""
+        if self.current_document is not None:
+            self.current_document.close()
+            if self.profile.enabled:
+                self.record_stat("io.bytes_read", self.current_document.bytes_read)
+            self.current_document = None
+    
+    def record_stat(self, key: str, amount: float = 1) -> None:
+        """Add to a counter for the file being processed; merged into run_stats."""
+        self.current_stats[key] = self.current_stats.get(key, 0) + amount
+    
+    def merge_stats(self, stats: Dict[str, float]) -> None:
+        """Accumulate per-file counters into the run totals."""
+        for key, amount in stats.items():
+            if key not in TRACE_KEYS:
+                self.run_stats[key] = self.run_stats.get(key, 0) + amount
+    
+    def print_yaml_stats(self) -> None:
+        """Report which YAML parsing paths were taken in this run."""
+        parts = []
+        documents = self.run_stats.get("yaml.documents", 0)
+        if documents:
+            parts.append(f"{documents:g} documents via {YAML_BACKEND}")
+        frontmatter = self.run_stats.get("yaml.frontmatter", 0)
+        if frontmatter:
+            parts.append(f"{frontmatter:g} frontmatter-only reads via {YAML_BACKEND}")
+        if parts:
+            logger.info(f"🧾 YAML: {', '.join(parts)}")
+    
+    def print_read_ahead_stats(self) -> None:
+        """Report how much was read ahead and how long processing waited for it."""
+        stats = self.read_ahead_stats
+        if stats is None:
+            return
+        logger.info(f"📥 Read-ahead: {stats.files} files ({format_size(stats.bytes)}), "
+                    f"{stats.ready} ready, {stats.waited} waited {stats.wait_seconds * 1000:.1f} ms, "
+                    f"peak {format_size(stats.peak_bytes)}")
+    
+    def add_reference(self, kind: str, target: Any) -> None:
+        """
+        Record that the file being processed references other content.
+        
+        Args:
+            kind: Referenced content type ('tasks', 'templates', 'data', 'agents')
+            target: Reference as written in the source (name, file name or path)
+        """
+        if not isinstance(target, str) or not target.strip():
+            return
+        targets = self.current_references.setdefault(kind, [])
+        if target.strip() not in targets:
+            targets.append(target.strip())
     
     def print_summary(self, output_file: Path, items: List[Dict[str, Any]]) -> None:
         """Print processing summary."""
         categories = self.category_manager.extract_categories(items)
         
-        print(f"\n✅ Generated {output_file} with {len(items)} {self.content_type}")
+        logger.info(f"\n✅ Generated {output_file} with {len(items)} {self.content_type}")
         if categories:
-            print(f"📊 Categories: {', '.join(categories)}")
+            logger.info(f"📊 Categories: {', '.join(categories)}")
+
+
+def add_processing_arguments(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    """Register the command line options shared by all processor entry points."""
+    parser.add_argument("--source", type=Path, default=None,
+                        help="Read content from this directory, tar/zip archive or git repository "
+                             "instead of the project root, without extracting it")
+    parser.add_argument("--ref", default=None,
+                        help="With a git repository as --source, the commit, branch or tag to read "
+                             "(default: HEAD for bare repositories)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Reuse results for unchanged files from the on-disk build cache")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR,
+                        help=f"Directory for the incremental build cache (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Worker processes for file processing (default: 1, 0 = one per CPU)")
+    parser.add_argument("--prefetch", type=int, default=DEFAULT_PREFETCH_DEPTH,
+                        help="Files read ahead on background threads while processing sequentially, "
+                             "for slow or network file systems (default: 0 = off, e.g. 16)")
+    parser.add_argument("--prefetch-mb", type=int, default=DEFAULT_PREFETCH_MB,
+                        help="Memory cap for read-ahead file contents in MB (default: %(default)s)")
+    parser.add_argument("--shard-size", type=int, default=0,
+                        help="Also write <output>/manifest.json plus shards of N items each")
+    parser.add_argument("--shard-by-category", action="store_true",
+                        help="Also write <output>/manifest.json plus one shard per category")
+    parser.add_argument("--minify", action="store_true",
+                        help="Write minified JSON instead of pretty-printed JSON")
+    parser.add_argument("--columnar", action="store_true",
+                        help="Also write <name>.columnar.json with keys stored once and interned categories")
+    parser.add_argument("--compress", default="",
+                        help=f"Comma-separated precompressed siblings to write: {', '.join(COMPRESSION_FORMATS)}")
+    parser.add_argument("--deterministic", action="store_true",
+                        help="Derive generatedAt from SOURCE_DATE_EPOCH or source mtimes and "
+                             "keep it when content is unchanged")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and patch the output whenever source files change")
+    parser.add_argument("--debounce-ms", type=int, default=int(DEFAULT_DEBOUNCE_SECONDS * 1000),
+                        help="Quiet period before regenerating in watch mode (default: %(default)s)")
+    parser.add_argument("--poll", action="store_true",
+                        help="Use the polling watcher instead of inotify")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("--verbose", "-v", action="store_true",
+                           help="Log every item, even for large runs")
+    verbosity.add_argument("--quiet", "-q", action="store_true",
+                           help="Only log warnings and errors")
+    parser.add_argument("--report", type=Path, default=None,
+                        help="Write a JSON build report (per-item outcomes, warnings, errors) to this file")
+    parser.add_argument("--profile", action="store_true",
+                        help="Report per-phase and per-file timings and write a JSON profile")
+    parser.add_argument("--profile-dir", type=Path, default=DEFAULT_PROFILE_DIR,
+                        help=f"Directory for profile files (default: {DEFAULT_PROFILE_DIR})")
+    parser.add_argument("--profile-top", type=int, default=DEFAULT_SLOWEST_FILES,
+                        help="Number of slowest files to report (default: %(default)s)")
+    parser.add_argument("--chrome-trace", action="store_true",
+                        help="With --profile, also write <type>.trace.json for chrome://tracing")
+    parser.add_argument("--cprofile", action="store_true",
+                        help="With --profile, also write a cProfile dump <type>.prof (main process only)")
+    return parser
+
+
+def configure_processor(processor: BaseContentProcessor, args: argparse.Namespace,
+                        source: ContentSource = None) -> BaseContentProcessor:
+    """
+    Apply parsed command line options to a processor.
+    
+    Processors built together (see CatalogBuilder) share one opened source;
+    otherwise the processor opens its own from --source/--ref.
+    """
+    configure_logging(VERBOSE if args.verbose else QUIET if args.quiet else NORMAL)
+    processor.source = source or open_source(args)
+    if args.watch and not processor.source.watchable:
+        raise ProcessingError(f"--watch needs a directory source, not {processor.source.label}")
+    processor.report_file = args.report
+    if args.incremental:
+        processor.enable_cache(args.cache_dir)
+    processor.jobs = args.jobs
+    processor.deterministic = args.deterministic
+    processor.read_ahead = ReadAheadOptions(depth=args.prefetch, max_bytes=args.prefetch_mb * 1024 * 1024)
+    processor.sharding = ShardingOptions(shard_size=args.shard_size, by_category=args.shard_by_category)
+    
+    compressions = [value.strip() for value in args.compress.split(",") if value.strip()]
+    unknown = [value for value in compressions if value not in COMPRESSION_FORMATS]
+    if unknown:
+        raise ProcessingError(f"Unknown compression formats: {', '.join(unknown)}")
+    processor.encoding = OutputEncoding(minify=args.minify, columnar=args.columnar, compress=compressions)
+    processor.profile = ProfileOptions(enabled=args.profile, directory=args.profile_dir,
+                                       chrome_trace=args.chrome_trace, cprofile=args.cprofile,
+                                       slowest=args.profile_top)
+    return processor
+
+
+def open_source(args: argparse.Namespace) -> ContentSource:
+    """Open the content source selected by --source/--ref."""
+    try:
+        return open_content_source(args.source, args.ref)
+    except SourceError as e:
+        raise ProcessingError(str(e))
+
+
+def run_cli(processor: BaseContentProcessor, output_file: Path, argv: List[str] = None) -> None:
+    """Standard entry point used by the process-*.py scripts."""
+    parser = argparse.ArgumentParser(
+        description=f"Process KubeRocketAI {processor.content_type} into JSON for Next.js consumption."
+    )
+    parser.add_argument("--output", type=Path, default=output_file,
+                        help=f"Output JSON file (default: {output_file})")
+    add_processing_arguments(parser)
+    args = parser.parse_args(argv)
+    
+    configure_processor(processor, args)
+    if not args.watch:
+        processor.process_all(args.output)
+        return
+    
+    # In watch mode a failed initial build is reported but does not stop watching
+    try:
+        processor.run(args.output)
+    except Exception as e:
+        logger.error(f"❌ Fatal error processing {processor.content_type}: {e}")
+    
+    target = WatchTarget(processor, processor.find_source_directory(), args.output)
+    watch(args, [target])
+
+
+def watch(args: argparse.Namespace, targets: List[WatchTarget],
+          on_change: Callable[[List[WatchTarget]], None] = None) -> None:
+    """
+    Run the debounced watch loop for the given targets.
+    
+    on_change is called with the targets regenerated by each batch of changes
+    (build-catalog uses it to refresh its catalog-wide outputs).
+    """
+    ContentWatcher(targets, debounce=args.debounce_ms / 1000, force_polling=args.poll,
+                   on_change=on_change).run()
 
 
 class FileBasedProcessor(BaseContentProcessor):
@@ -377,24 +1149,60 @@ class FileBasedProcessor(BaseContentProcessor):
     Provides common functionality for processing markdown and YAML files.
     """
     
+    def read_frontmatter(self, file_path: Path) -> Dict[str, Any]:
+        """
+        Parse the YAML frontmatter block of a markdown file, if any.
+        
+        Only the frontmatter is read; the markdown body is never loaded.
+        """
+        if file_path.suffix != '.md':
+            return {}
+        
+        started = time.perf_counter() if self.profile.enabled else None
+        try:
+            frontmatter = self.open_document(file_path).frontmatter()
+        except Exception as e:
+            raise ProcessingError(f"Invalid frontmatter in {file_path.name}: {e}")
+        finally:
+            if started is not None:
+                self.record_stat("time.yaml", time.perf_counter() - started)
+        
+        if frontmatter is None:
+            return {}
+        self.record_stat("yaml.frontmatter")
+        return frontmatter
+    
+    def collect_dependencies(self, file_path: Path) -> None:
+        """
+        Record frontmatter `dependencies` (data/templates/tasks) as references.
+        
+        Best effort: a file whose frontmatter cannot be parsed is still
+        processed, with a warning and no references.
+        """
+        try:
+            frontmatter = self.read_frontmatter(file_path)
+        except ProcessingError as e:
+            self.warnings.append(f"{file_path.name}: No dependencies recorded: {e}")
+            return
+        
+        dependencies = frontmatter.get('dependencies') or {}
+        if not isinstance(dependencies, dict):
+            self.warnings.append(f"{file_path.name}: Frontmatter 'dependencies' should be a mapping")
+            return
+        
+        for kind, targets in dependencies.items():
+            for target in self.safe_list(targets):
+                self.add_reference(str(kind), target)
+    
     def extract_description_from_file(self, file_path: Path) -> str:
-        """Extract description from file content."""
+        """
+        Extract description from file content.
+        
+        Streams the file, skipping frontmatter and fenced code, and stops at
+        the first meaningful line within the first few lines of the body.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Look for meaningful content in first 10 lines
-            for line in lines[:10]:
-                line = line.strip()
-                # Skip empty lines, markdown headers, and XML-style tags
-                if (line and
-                    not line.startswith('#') and
-                    not line.startswith('<') and
-                    not line.startswith('Purpose:') and
-                    len(line) > 20):  # Only meaningful sentences
-                    return line
-            
-            return ""
+            return self.open_document(file_path).description()
         except Exception:
             return ""
 
@@ -406,9 +1214,20 @@ class YAMLBasedProcessor(BaseContentProcessor):
     """
     
     def load_yaml_file(self, file_path: Path) -> Dict[str, Any]:
-        """Load and parse YAML file."""
+        """Load and parse YAML file (libyaml CSafeLoader when available)."""
+        started = time.perf_counter() if self.profile.enabled else None
+        content = self.prefetched_bytes(file_path)
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f) or {}
+            if content is None:
+                content = self.source.read_bytes(file_path)
+            if started is not None:
+                self.record_stat("io.bytes_read", len(content))
+            data = load_yaml(content.decode('utf-8')) or {}
         except Exception as e:
-            raise ProcessingError(f"Failed to parse YAML file {file_path}: {e}")
\ No newline at end of file
+            raise ProcessingError(f"Failed to parse YAML file {file_path}: {e}")
+        finally:
+            if started is not None:
+                self.record_stat("time.yaml", time.perf_counter() - started)
+        
+        self.record_stat("yaml.documents")
+        return data
\ No newline at end of file
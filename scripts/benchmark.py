@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+Processor Benchmark
+
+Generates synthetic .krci-ai trees at configurable scales and times each
+BaseContentProcessor phase (discover, load-existing, process, validate, sort,
+write) plus a full end-to-end run, writing machine-readable results that can
+be compared across runs to catch regressions in the catalog build.
+
+Usage:
+    python scripts/benchmark.py --scale 100 --scale 10000 --output bench.json
+    python scripts/benchmark.py --scale 10000 --compare bench.json --threshold 15
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Ensure local imports work when run from project root
+sys.path.insert(0, str(Path(__file__).parent))
+
+from base_processor import BaseContentProcessor
+from build_logging import QUIET, configure_logging, flush_logs
+from catalog_builder import PROCESSOR_REGISTRY, load_processor
+from yaml_loader import YAML_BACKEND
+
+
+BENCHMARK_VERSION = 1
+CORPUS_VERSION = 1
+CORPUS_MARKER = ".benchmark-corpus.json"
+PHASES = ["discover", "load-existing", "process", "validate", "sort", "write"]
+
+CATEGORIES = [
+    "Analysis", "Architecture", "Development", "Documentation", "Management",
+    "Marketing", "Product", "Security", "Testing", "Operations",
+]
+WORDS = (
+    "agent architecture backlog catalog component delivery deployment design "
+    "document framework guidance implementation integration interface metric "
+    "milestone platform principle process product quality release requirement "
+    "review roadmap security service stakeholder strategy template testing "
+    "validation workflow"
+).split()
+
+
+class CorpusGenerator:
+    """
+    Writes a synthetic project tree: .krci-ai/{agents,tasks,templates,data}
+    plus the public/data/*.json files of a previous build.
+
+    Content mirrors the real layout: agent YAML with identity, principles and
+    task-executing commands; tasks with frontmatter dependencies on generated
+    data and templates; data files ranging from notes to large reference
+    dumps. Output is fully determined by the seed.
+    """
+
+    def __init__(self, root: Path, scale: int, seed: int = 0, existing_ratio: float = 0.9):
+        self.root = root
+        self.scale = scale
+        self.seed = seed
+        self.existing_ratio = existing_ratio
+        self.random = random.Random(seed)
+
+    @property
+    def marker(self) -> Dict[str, Any]:
+        return {"version": CORPUS_VERSION, "scale": self.scale, "seed": self.seed,
+                "existingRatio": self.existing_ratio}
+
+    def is_current(self) -> bool:
+        """Check whether the root already holds the corpus this generator would write."""
+        try:
+            return json.loads((self.root / CORPUS_MARKER).read_text()) == self.marker
+        except (OSError, ValueError):
+            return False
+
+    def sentence(self, words: int) -> str:
+        text = " ".join(self.random.choice(WORDS) for _ in range(words))
+        return text[0].upper() + text[1:] + "."
+
+    def paragraph(self, sentences: int) -> str:
+        return " ".join(self.sentence(self.random.randint(8, 20)) for _ in range(sentences))
+
+    def categories(self) -> List[str]:
+        return sorted(self.random.sample(CATEGORIES, self.random.randint(1, 3)))
+
+    def item_id(self, kind: str, index: int) -> str:
+        return f"{self.random.choice(WORDS)}-{kind}-{index:06d}"
+
+    def generate(self) -> None:
+        if self.root.exists():
+            shutil.rmtree(self.root)
+        content = self.root / ".krci-ai"
+        output = self.root / "public" / "data"
+        output.mkdir(parents=True)
+
+        data_ids = [self.item_id("data", i) for i in range(self.scale)]
+        template_ids = [self.item_id("template", i) for i in range(self.scale)]
+        task_ids = [self.item_id("task", i) for i in range(self.scale)]
+        agent_ids = [self.item_id("agent", i) for i in range(self.scale)]
+
+        existing: Dict[str, List[Dict[str, Any]]] = {key: [] for key in PROCESSOR_REGISTRY}
+        for index, data_id in enumerate(data_ids):
+            path = self.write_data(content / "data", data_id, index)
+            existing["data"].append(self.existing_entry(data_id, f".krci-ai/data/{path}"))
+        for template_id in template_ids:
+            self.write_template(content / "templates", template_id)
+            existing["templates"].append(self.existing_entry(template_id, f".krci-ai/templates/{template_id}.md"))
+        for task_id in task_ids:
+            self.write_task(content / "tasks", task_id, data_ids, template_ids)
+            existing["tasks"].append(self.existing_entry(task_id, f".krci-ai/tasks/{task_id}.md"))
+        for agent_id in agent_ids:
+            self.write_agent(content / "agents", agent_id, task_ids)
+            entry = self.existing_entry(f"{agent_id}-v1", None)
+            entry.update(filename=agent_id, whenToUse=self.sentence(12))
+            existing["agents"].append(entry)
+
+        for key, items in existing.items():
+            # Only part of the tree was built before: the rest is new content
+            kept = [item for item in items if self.random.random() < self.existing_ratio]
+            items_key = load_processor(key).get_items_key()
+            payload = {items_key: kept, "metadata": {"generatedAt": "2025-01-01T00:00:00Z"}}
+            (output / PROCESSOR_REGISTRY[key][2]).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+        (self.root / CORPUS_MARKER).write_text(json.dumps(self.marker))
+
+    def existing_entry(self, item_id: str, path: Optional[str]) -> Dict[str, Any]:
+        entry = {
+            "id": item_id,
+            "name": item_id.replace("-", " ").title(),
+            "description": self.sentence(15),
+            "categories": self.categories(),
+        }
+        if path:
+            entry["path"] = path
+        return entry
+
+    def write_file(self, file_path: Path, text: str) -> None:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(text, encoding="utf-8")
+
+    def write_agent(self, directory: Path, agent_id: str, task_ids: List[str]) -> None:
+        tasks = self.random.sample(task_ids, min(len(task_ids), self.random.randint(2, 8)))
+        lines = [
+            "agent:",
+            "  identity:",
+            f'    name: "{agent_id.replace("-", " ").title()}"',
+            f"    id: {agent_id}-v1",
+            '    version: "1.0.0"',
+            f'    description: "{self.sentence(18)}"',
+            f'    role: "{self.sentence(4)}"',
+            f'    goal: "{self.sentence(10)}"',
+            '    icon: "🤖"',
+            "",
+            "  activation_prompt:",
+        ]
+        lines += [f"    - {self.sentence(20)}" for _ in range(7)]
+        lines += ["", "  principles:", f'    - "SCOPE: {self.sentence(12)}"']
+        lines += [f'    - "{self.paragraph(2)}"' for _ in range(self.random.randint(5, 12))]
+        lines += ["", '  customization: ""', "", "  commands:",
+                  '    help: "Show available commands"']
+        lines += [f'    {task}: "{self.sentence(8)[:-1]} by executing task {task}"' for task in tasks]
+        lines += ['    exit: "Exit persona and return to normal mode"', "", "  tasks:"]
+        lines += [f"    - ./.krci-ai/tasks/{task}.md" for task in tasks]
+        self.write_file(directory / f"{agent_id}.yaml", "\n".join(lines) + "\n")
+
+    def markdown_body(self, title: str, sections: int) -> str:
+        parts = [f"# {title}", ""]
+        for section in range(sections):
+            parts += [f"## Section {section + 1}", "", "<instructions>", self.paragraph(4),
+                      "</instructions>", ""]
+            if self.random.random() < 0.3:
+                parts += ["```yaml", f"example: {self.sentence(6)}", "```", ""]
+            parts += [f"- {self.sentence(10)}" for _ in range(self.random.randint(2, 6))] + [""]
+        return "\n".join(parts)
+
+    def write_task(self, directory: Path, task_id: str, data_ids: List[str], template_ids: List[str]) -> None:
+        data = self.random.sample(data_ids, min(len(data_ids), self.random.randint(1, 4)))
+        templates = self.random.sample(template_ids, min(len(template_ids), self.random.randint(0, 2)))
+        frontmatter = ["---", "dependencies:", "  data:"] + [f"    - {d}.md" for d in data]
+        if templates:
+            frontmatter += ["  templates:"] + [f"    - {t}.md" for t in templates]
+        frontmatter.append("---")
+        body = self.markdown_body(task_id.replace("-", " ").title(), self.random.randint(3, 10))
+        self.write_file(directory / f"{task_id}.md", "\n".join(frontmatter) + "\n\n" + body)
+
+    def write_template(self, directory: Path, template_id: str) -> None:
+        body = self.markdown_body(template_id.replace("-", " ").title(), self.random.randint(2, 8))
+        self.write_file(directory / f"{template_id}.md", body)
+
+    def write_data(self, directory: Path, data_id: str, index: int) -> str:
+        # One file in fifty is a large reference dump
+        sections = 400 if index % 50 == 49 else self.random.randint(2, 12)
+        relative = f"{data_id}.md"
+        if index % 10 == 9:
+            relative = f"reference/{data_id}.md"
+        body = self.markdown_body(data_id.replace("-", " ").title(), sections)
+        self.write_file(directory / relative, body)
+        return relative
+
+
+def timed(phases: Dict[str, float], name: str, action: Callable[[], Any]) -> Any:
+    """Run an action and record its wall time under the phase name."""
+    started = time.perf_counter()
+    result = action()
+    phases[name] = time.perf_counter() - started
+    return result
+
+
+def time_phases(processor: BaseContentProcessor, project_root: Path, output_file: Path) -> Dict[str, Any]:
+    """
+    Time one pass through the processing phases of a processor.
+
+    The phases are the steps run() performs, executed one after another
+    (without the build cache or worker pool) so each can be timed alone.
+    """
+    phases: Dict[str, float] = {}
+    processor.context = processor.create_context(output_file, project_root)
+
+    files = timed(phases, "discover", lambda: list(processor.discover_files(processor.context.source_root)))
+    existing = timed(phases, "load-existing", lambda: processor.load_existing_data(output_file))
+
+    def process() -> List[tuple]:
+        processed = []
+        for file_path, existing_key in zip(files, processor.match_existing(existing, files)):
+            try:
+                existing_item = existing.get(existing_key)
+                processed.append((file_path, processor.process_file(file_path, existing_item)))
+            except Exception:
+                processor.errors.append(f"Error processing {file_path.name}")
+            finally:
+                processor.close_document()
+        return processed
+
+    processed = timed(phases, "process", process)
+    valid = timed(phases, "validate", lambda: processor.validate_batch(processed))
+    items = [item for (file_path, item), item_valid in zip(processed, valid) if item_valid]
+    processor.report_diagnostics()
+    timed(phases, "sort", lambda: processor.sort_items(items))
+    timed(phases, "write", lambda: processor.write_output(
+        output_file, processor.get_output_structure(items)))
+
+    return {"files": len(files), "items": len(items), "errors": len(processor.errors), "phases": phases}
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        "min": round(min(samples), 6),
+        "median": round(statistics.median(samples), 6),
+        "mean": round(statistics.fmean(samples), 6),
+    }
+
+
+def source_bytes(source_dir: Path) -> int:
+    return sum(entry.stat().st_size for entry in source_dir.rglob("*") if entry.is_file())
+
+
+def benchmark_scale(project_root: Path, scale: int, keys: List[str], repeat: int, jobs: int) -> List[Dict[str, Any]]:
+    """Benchmark every selected processor on one generated corpus."""
+    results = []
+    for key in keys:
+        output_file = project_root / "public" / "data" / PROCESSOR_REGISTRY[key][2]
+        seed_file = output_file.with_name(output_file.name + ".seed")
+        shutil.copyfile(output_file, seed_file)
+
+        samples: List[Dict[str, Any]] = []
+        end_to_end: List[float] = []
+        for _ in range(repeat):
+            # Every repetition starts from the same previous build
+            shutil.copyfile(seed_file, output_file)
+            processor = load_processor(key)
+            with contextlib.redirect_stdout(io.StringIO()):
+                samples.append(time_phases(processor, project_root, output_file))
+                flush_logs()
+
+            shutil.copyfile(seed_file, output_file)
+            processor = load_processor(key)
+            processor.jobs = jobs
+            with contextlib.redirect_stdout(io.StringIO()):
+                started = time.perf_counter()
+                processor.run(output_file, project_root)
+                end_to_end.append(time.perf_counter() - started)
+
+        shutil.copyfile(seed_file, output_file)
+        seed_file.unlink()
+
+        first = samples[0]
+        phases = {phase: summarize([sample["phases"][phase] for sample in samples]) for phase in PHASES}
+        results.append({
+            "scale": scale,
+            "contentType": key,
+            "files": first["files"],
+            "items": first["items"],
+            "errors": first["errors"],
+            "sourceBytes": source_bytes(processor.find_source_directory(project_root)),
+            "phases": phases,
+            "phaseTotal": summarize([sum(sample["phases"].values()) for sample in samples]),
+            "endToEnd": summarize(end_to_end),
+        })
+        print(f"  {key:<10} {first['files']:>7} files  "
+              + "  ".join(f"{phase} {phases[phase]['median'] * 1000:.1f}ms" for phase in PHASES)
+              + f"  run {statistics.median(end_to_end) * 1000:.1f}ms")
+    return results
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Compare median phase times against a previous results file.
+
+    Returns:
+        Descriptions of the phases that got slower than the threshold (percent);
+        changes below one millisecond are ignored as noise
+    """
+    previous = {(run["scale"], run["contentType"]): run for run in baseline.get("runs", [])}
+    regressions = []
+
+    print(f"\n📊 Comparison with baseline ({baseline.get('createdAt', 'unknown date')}):")
+    for run in results["runs"]:
+        old = previous.get((run["scale"], run["contentType"]))
+        if old is None:
+            print(f"  {run['contentType']} @ {run['scale']}: no baseline")
+            continue
+        for phase in PHASES + ["endToEnd"]:
+            new_time = (run["endToEnd"] if phase == "endToEnd" else run["phases"][phase])["median"]
+            old_time = (old["endToEnd"] if phase == "endToEnd" else old["phases"][phase])["median"]
+            change = (new_time - old_time) / old_time * 100 if old_time else 0.0
+            marker = ""
+            if change > threshold and new_time - old_time > 0.001:
+                marker = "  ⚠ regression"
+                regressions.append(f"{run['contentType']} @ {run['scale']} {phase}: {change:+.1f}%")
+            print(f"  {run['contentType']:<10} {run['scale']:>7} {phase:<14} "
+                  f"{old_time * 1000:9.1f}ms → {new_time * 1000:9.1f}ms ({change:+.1f}%){marker}")
+    return regressions
+
+
+def environment() -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpuCount": os.cpu_count(),
+        "yamlBackend": YAML_BACKEND,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the KubeRocketAI content processors on synthetic corpora.")
+    parser.add_argument("--scale", type=int, action="append",
+                        help="Files per content type; repeat for several scales (default: 100)")
+    parser.add_argument("--only", default=None,
+                        help=f"Comma-separated subset of content types: {', '.join(PROCESSOR_REGISTRY)}")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Timed repetitions per processor (default: 3)")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Worker processes for the end-to-end run (default: 1)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Random seed for the corpus generator (default: 0)")
+    parser.add_argument("--corpus-dir", type=Path, default=None,
+                        help="Keep generated corpora here and reuse them across runs (default: temporary)")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Write JSON results to this file")
+    parser.add_argument("--compare", type=Path, default=None,
+                        help="Previous JSON results to compare against; exits 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Slowdown in percent that counts as a regression (default: 10)")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    # Processor output is discarded; only warnings and errors are buffered
+    configure_logging(QUIET)
+    scales = args.scale or [100]
+    keys = [key.strip() for key in args.only.split(",")] if args.only else list(PROCESSOR_REGISTRY)
+    unknown = [key for key in keys if key not in PROCESSOR_REGISTRY]
+    if unknown:
+        print(f"❌ Unknown content types: {', '.join(unknown)}")
+        return 1
+
+    work_dir = args.corpus_dir or Path(tempfile.mkdtemp(prefix="krci-benchmark-"))
+    results = {
+        "benchmarkVersion": BENCHMARK_VERSION,
+        "createdAt": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "environment": environment(),
+        "config": {"scales": scales, "contentTypes": keys, "repeat": args.repeat,
+                   "jobs": args.jobs, "seed": args.seed},
+        "runs": [],
+    }
+
+    try:
+        for scale in scales:
+            generator = CorpusGenerator(work_dir / f"scale-{scale}", scale, args.seed)
+            if generator.is_current():
+                print(f"♻ Reusing corpus at {generator.root}")
+            else:
+                print(f"🏭 Generating {scale} files per content type in {generator.root}")
+                started = time.perf_counter()
+                generator.generate()
+                print(f"   generated in {time.perf_counter() - started:.1f}s")
+
+            print(f"⏱ Benchmarking scale {scale} ({args.repeat} repetitions)")
+            results["runs"].extend(benchmark_scale(generator.root, scale, keys, args.repeat, args.jobs))
+    finally:
+        if args.corpus_dir is None:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"\n✅ Wrote results to {args.output}")
+
+    if args.compare:
+        regressions = compare(results, json.loads(args.compare.read_text()), args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regressions over {args.threshold:g}%:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print("\n✅ No regressions")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
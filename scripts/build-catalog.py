@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Build the complete KubeRocketAI catalog (agents, tasks, templates, data) in one process.
+Shares a single interpreter and file-system scan across all content processors.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add the scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from base_processor import add_processing_arguments, watch
+from build_logging import flush_logs, get_logger
+from catalog_builder import CatalogBuilder, PROCESSOR_REGISTRY, parse_only
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build all KubeRocketAI catalog JSON files in one pass.")
+    parser.add_argument("--project-root", type=Path, default=None,
+                        help="Project root containing .krci-ai or krci-input (default: current directory; "
+                             "--source replaces it)")
+    parser.add_argument("--output-dir", type=Path, default=Path("./public/data"),
+                        help="Directory for generated JSON files (default: ./public/data)")
+    parser.add_argument("--only", default=None,
+                        help=f"Comma-separated subset of content types: {', '.join(PROCESSOR_REGISTRY)}")
+    parser.add_argument("--skip-search-index", action="store_true",
+                        help="Do not write the prebuilt search indexes")
+    parser.add_argument("--skip-graph", action="store_true",
+                        help="Do not write the dependency graph")
+    parser.add_argument("--skip-facets", action="store_true",
+                        help="Do not write the category by content type facets (facets.json)")
+    parser.add_argument("--skip-details", action="store_true",
+                        help="Do not write the per-item detail payloads (details/<type>/<id>.json)")
+    parser.add_argument("--allow-dangling", action="store_true",
+                        help="Write the dependency graph even if references cannot be resolved")
+    add_processing_arguments(parser)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    try:
+        builder = CatalogBuilder(args.project_root, args.output_dir, parse_only(args.only), args)
+        succeeded = builder.build()
+    except Exception as e:
+        get_logger().error(f"❌ Fatal error building catalog: {e}")
+        flush_logs()
+        sys.exit(1)
+
+    if args.watch:
+        watch(args, builder.watch_targets(), builder.refresh_catalog)
+    elif not succeeded:
+        sys.exit(1)
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Incremental Build Cache
+
+Persistent on-disk manifest that lets content processors reuse the processed
+item of every source file that has not changed since the previous run.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from build_logging import get_logger
+from catalog_records import to_json_value
+
+
+logger = get_logger("cache")
+
+CACHE_FORMAT_VERSION = 3
+DEFAULT_CACHE_DIR = Path(".krci-cache")
+
+
+@dataclass
+class FileResult:
+    """Processing outcome for a single source file, as recorded in the cache."""
+    item: Optional[Dict[str, Any]]
+    valid: bool
+    warnings: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    # Cross-references to other content (kind -> referenced names), see add_reference
+    references: Dict[str, List[str]] = field(default_factory=dict)
+    # Set when processing raised; failed results are never cached
+    failure: Optional[str] = None
+    # Per-file counters (e.g. which YAML path was taken); not cached
+    stats: Dict[str, float] = field(default_factory=dict)
+
+
+def hash_bytes(data: bytes) -> str:
+    """Return the hex SHA-256 digest of raw bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(file_path: Path) -> str:
+    """Return the hex SHA-256 digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fingerprint(value: Any) -> str:
+    """Return a stable hash of a JSON-serializable value (e.g. an existing item)."""
+    if value is None:
+        return ""
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=False, default=to_json_value).encode('utf-8')
+    return hash_bytes(encoded)
+
+
+class FingerprintBuilder:
+    """Incremental fingerprint of a sequence of values, fed one at a time."""
+
+    def __init__(self):
+        self.digest = hashlib.sha256()
+
+    def add(self, value: Any) -> None:
+        encoded = json.dumps(value, sort_keys=True, ensure_ascii=False, default=to_json_value)
+        self.digest.update(encoded.encode('utf-8') + b"\n")
+
+    def hexdigest(self) -> str:
+        return self.digest.hexdigest()
+
+
+class BuildCache:
+    """
+    Content-hash manifest for one content type.
+
+    Entries are keyed by the file path relative to the source directory and
+    record the file's mtime, size and SHA-256 digest, a fingerprint of the
+    existing item used for field preservation, and the processed result.
+    A stat match short-circuits hashing; a content-hash match survives touches
+    and fresh checkouts. The manifest is discarded when the processor signature
+    (class and PROCESSOR_VERSION) or the cache format changes.
+    """
+
+    def __init__(self, cache_dir: Path, content_type: str, processor_signature: str):
+        self.cache_file = Path(cache_dir) / f"{content_type}.manifest.json"
+        self.processor_signature = processor_signature
+        self.source_dir: Optional[Path] = None
+        # ContentSource the files are read through (the file system when None)
+        self.source: Any = None
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.next_entries: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, source_dir: Path, source: Any = None) -> None:
+        """Load the manifest for a source directory, optionally read through a ContentSource."""
+        self.source_dir = source_dir
+        self.source = source
+        self.entries = {}
+        self.next_entries = {}
+        self.hits = 0
+        self.misses = 0
+
+        if not self.cache_file.exists():
+            return
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except Exception as e:
+            logger.warning(f"⚠ Ignoring unreadable build cache {self.cache_file}: {e}")
+            return
+
+        if (manifest.get("format") != CACHE_FORMAT_VERSION or
+                manifest.get("processor") != self.processor_signature or
+                manifest.get("sourceDir") != str(source_dir)):
+            logger.info(f"♻ Build cache invalidated for {self.cache_file.name}")
+            return
+
+        self.entries = manifest.get("entries", {})
+
+    def cache_key(self, file_path: Path) -> str:
+        """Get the manifest key for a source file."""
+        try:
+            return file_path.relative_to(self.source_dir).as_posix()
+        except ValueError:
+            return file_path.as_posix()
+
+    def file_stat(self, file_path: Path) -> Any:
+        return self.source.stat(file_path) if self.source is not None else file_path.stat()
+
+    def file_hash(self, file_path: Path) -> str:
+        return self.source.sha256(file_path) if self.source is not None else hash_file(file_path)
+
+    def lookup(self, file_path: Path, existing_item: Optional[Dict[str, Any]]) -> Optional[FileResult]:
+        """Return the cached result for an unchanged file, or None on a miss."""
+        key = self.cache_key(file_path)
+        entry = self.entries.get(key)
+        stat = self.file_stat(file_path)
+
+        if entry is None or entry.get("existing") != fingerprint(existing_item):
+            self.misses += 1
+            return None
+
+        if entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+            if entry["size"] != stat.st_size or entry["sha256"] != self.file_hash(file_path):
+                self.misses += 1
+                return None
+            # Content unchanged (e.g. touched or re-checked out): refresh stat only
+            entry = dict(entry, mtime_ns=stat.st_mtime_ns)
+
+        self.next_entries[key] = entry
+        self.hits += 1
+        return FileResult(
+            item=entry["item"],
+            valid=entry["valid"],
+            warnings=list(entry.get("warnings", [])),
+            errors=list(entry.get("errors", [])),
+            references=entry.get("references", {}),
+        )
+
+    def store(self, file_path: Path, existing_item: Optional[Dict[str, Any]], result: FileResult) -> None:
+        """Record the processing result for a source file."""
+        if result.failure is not None:
+            return
+
+        stat = self.file_stat(file_path)
+        self.next_entries[self.cache_key(file_path)] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": self.file_hash(file_path),
+            "existing": fingerprint(existing_item),
+            "item": result.item,
+            "valid": result.valid,
+            "warnings": result.warnings,
+            "errors": result.errors,
+            "references": result.references,
+        }
+
+    @property
+    def removed(self) -> int:
+        """Number of manifest entries whose source file disappeared."""
+        return len(set(self.entries) - set(self.next_entries))
+
+    def save(self) -> None:
+        """Persist the manifest, dropping entries for deleted files."""
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        manifest = {
+            "format": CACHE_FORMAT_VERSION,
+            "processor": self.processor_signature,
+            "sourceDir": str(self.source_dir),
+            "entries": dict(sorted(self.next_entries.items())),
+        }
+
+        # Write atomically so an interrupted run never leaves a corrupt manifest
+        tmp_file = self.cache_file.with_suffix(".tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, default=to_json_value)
+        os.replace(tmp_file, self.cache_file)
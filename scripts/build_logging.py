@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Build Logging
+
+Leveled, buffered console output for the content processors and a
+machine-readable JSON build report.
+
+Console lines are collected in memory and written to stdout in blocks, so
+large builds do not pay for one unbuffered write per line on CI log pipes.
+Per-item lines use their own ITEM level: shown by default for small runs,
+summarized for large ones, and always shown with --verbose.
+"""
+
+import json
+import logging
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+LOGGER_NAME = "krci"
+# Per-item detail lines sit between DEBUG and INFO
+ITEM = 15
+logging.addLevelName(ITEM, "ITEM")
+
+QUIET = "quiet"
+NORMAL = "normal"
+VERBOSE = "verbose"
+VERBOSITY_LEVELS = {QUIET: logging.WARNING, NORMAL: ITEM, VERBOSE: logging.DEBUG}
+
+# Runs with more files than this show a summary instead of per-item lines
+ITEM_DETAIL_LIMIT = 200
+# Warnings listed before the rest are summarized (unless verbose)
+WARNING_PREVIEW_LIMIT = 20
+BUFFER_CAPACITY = 512
+
+REPORT_VERSION = 1
+
+
+class BufferedConsoleHandler(logging.Handler):
+    """
+    Collects formatted lines and writes them to stdout in blocks.
+
+    The stream is looked up at flush time, so redirecting sys.stdout (for
+    example in the benchmark harness) also redirects buffered output.
+    """
+
+    def __init__(self, capacity: int = BUFFER_CAPACITY):
+        super().__init__()
+        self.capacity = capacity
+        self.buffer: List[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.buffer.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+            return
+        if len(self.buffer) >= self.capacity:
+            self.flush()
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if self.buffer:
+                sys.stdout.write("\n".join(self.buffer) + "\n")
+                sys.stdout.flush()
+                self.buffer = []
+        finally:
+            self.release()
+
+
+def configure_logging(verbosity: str = NORMAL) -> logging.Logger:
+    """Install the buffered console handler at the level for a verbosity."""
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in list(logger.handlers):
+        handler.flush()
+        logger.removeHandler(handler)
+
+    handler = BufferedConsoleHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(VERBOSITY_LEVELS[verbosity])
+    logger.propagate = False
+    return logger
+
+
+def get_logger(name: str = None) -> logging.Logger:
+    """Get the build logger (or a child), configuring defaults on first use."""
+    logger = logging.getLogger(LOGGER_NAME)
+    if not logger.handlers:
+        configure_logging()
+    return logger.getChild(name) if name else logger
+
+
+def flush_logs() -> None:
+    """Write out all buffered console lines."""
+    for handler in logging.getLogger(LOGGER_NAME).handlers:
+        handler.flush()
+
+
+def show_item_detail(logger: logging.Logger, file_count: int) -> bool:
+    """Decide whether per-item lines are logged for a run of this size."""
+    if logger.isEnabledFor(logging.DEBUG):
+        return True
+    return logger.isEnabledFor(ITEM) and file_count <= ITEM_DETAIL_LIMIT
+
+
+def write_report(report_file: Path, collections: List[Dict[str, Any]], succeeded: bool,
+                 **extra: Any) -> None:
+    """Write the JSON build report for one or more processed collections."""
+    report = {
+        "version": REPORT_VERSION,
+        "generatedAt": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "succeeded": succeeded,
+        **extra,
+        "collections": collections,
+    }
+    report_file.parent.mkdir(parents=True, exist_ok=True)
+    report_file.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
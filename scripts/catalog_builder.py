@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Catalog Builder
+
+Runs every content processor in a single interpreter over one shared
+file-system scan of the .krci-ai tree and writes all catalog files together.
+"""
+
+import argparse
+import importlib.util
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Ensure local imports work when run from project root
+sys.path.insert(0, str(Path(__file__).parent))
+
+from base_processor import BaseContentProcessor, ProcessingError, configure_processor, open_source
+from build_cache import DEFAULT_CACHE_DIR
+from build_logging import flush_logs, get_logger, write_report
+from category_facets import FacetMatrixBuilder
+from content_source import ContentSource
+from content_watcher import WatchTarget
+from dependency_graph import DependencyGraphBuilder
+from item_details import ItemDetailsWriter
+from json_stream import CollectionReader
+from search_index import NgramIndexBuilder, SearchIndexBuilder
+
+
+logger = get_logger("catalog")
+
+SCRIPTS_DIR = Path(__file__).parent
+
+# Processor registry: key -> (script file, processor class, output file name)
+PROCESSOR_REGISTRY: Dict[str, Tuple[str, str, str]] = {
+    "agents": ("process-agents.py", "AgentProcessor", "agents.json"),
+    "tasks": ("process-tasks.py", "TaskProcessor", "tasks.json"),
+    "templates": ("process-templates.py", "TemplateProcessor", "templates.json"),
+    "data": ("process-data.py", "DataProcessor", "data.json"),
+}
+
+SEARCH_INDEX_FILE = "search-index.json"
+NGRAM_INDEX_FILE = "search-trigrams.json"
+GRAPH_FILE = "graph.json"
+FACETS_FILE = "facets.json"
+
+
+def load_processor(key: str) -> BaseContentProcessor:
+    """
+    Instantiate a processor from its entry point script.
+
+    The entry points use hyphenated file names, so they are loaded by path
+    and registered under an importable module name (e.g. 'process_agents').
+    """
+    script_name, class_name, _ = PROCESSOR_REGISTRY[key]
+    module_name = Path(script_name).stem.replace("-", "_")
+
+    module = sys.modules.get(module_name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, SCRIPTS_DIR / script_name)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+
+    return getattr(module, class_name)()
+
+
+class CatalogBuilder:
+    """
+    Builds the complete content catalog in one pass.
+
+    Responsibilities:
+    - Instantiate all registered processors once
+    - Walk the shared content root a single time and route files to processors
+    - Run every processor and write all public/data/*.json files together
+    - Run catalog-wide output stages (dependency graph, search indexes, category facets,
+      item details)
+    """
+
+    def __init__(self, project_root: Path = None, output_dir: Path = None, only: List[str] = None,
+                 options: argparse.Namespace = None):
+        # One source shared by all processors; --source replaces the project root
+        self.source = open_source(options) if options is not None else ContentSource(project_root)
+        if getattr(options, "source", None) is not None:
+            project_root = self.source.root
+        self.project_root = project_root or self.source.root
+        self.output_dir = output_dir or Path("public/data")
+        keys = only or list(PROCESSOR_REGISTRY.keys())
+
+        unknown = [key for key in keys if key not in PROCESSOR_REGISTRY]
+        if unknown:
+            raise ProcessingError(f"Unknown content types: {', '.join(unknown)}")
+
+        self.processors: Dict[str, BaseContentProcessor] = {key: load_processor(key) for key in keys}
+        self.build_search_index = not getattr(options, "skip_search_index", False)
+        self.build_graph = not getattr(options, "skip_graph", False)
+        self.build_facets = not getattr(options, "skip_facets", False)
+        self.build_details = not getattr(options, "skip_details", False)
+        self.cache_dir: Path = getattr(options, "cache_dir", None) or DEFAULT_CACHE_DIR
+        self.allow_dangling = getattr(options, "allow_dangling", False)
+        # One combined report for all collections instead of one per processor
+        self.report_file: Optional[Path] = getattr(options, "report", None)
+        self.dangling: List[str] = []
+        for processor in self.processors.values():
+            processor.collect_references = self.build_graph
+        if options is not None:
+            for processor in self.processors.values():
+                configure_processor(processor, options, self.source)
+                processor.report_file = None
+
+    def output_file_for(self, key: str) -> Path:
+        """Get the output file for a registered processor."""
+        return self.output_dir / PROCESSOR_REGISTRY[key][2]
+
+    def scan(self) -> Dict[str, List[Path]]:
+        """
+        Discover files for all processors with a single walk per content root.
+
+        Source directories that share a parent (the usual .krci-ai layout) are
+        covered by one walk of that parent; files are routed to the processor
+        owning the top-level directory they live in.
+        """
+        source_dirs: Dict[str, Path] = {}
+        for key, processor in self.processors.items():
+            source_dirs[key] = processor.find_source_directory(self.project_root)
+
+        # Group processors by the root directory their sources live under
+        roots: Dict[Path, Dict[str, str]] = {}
+        for key, source_dir in source_dirs.items():
+            roots.setdefault(source_dir.parent, {})[source_dir.name] = key
+
+        scanned: Dict[str, List[Path]] = {key: [] for key in self.processors}
+        for root, owners in roots.items():
+            suffixes = set()
+            for key in owners.values():
+                suffixes.update(self.processors[key].source_extensions)
+
+            # The walk yields sorted paths, matching BaseContentProcessor.discover_files
+            for file_path in self.source.iter_files(root, suffixes, top_level_dirs=set(owners)):
+                key = owners[file_path.relative_to(root).parts[0]]
+                if file_path.name.endswith(tuple(self.processors[key].source_extensions)):
+                    scanned[key].append(file_path)
+
+        return scanned
+
+    def build(self) -> bool:
+        """
+        Build every registered catalog and write the build report if requested.
+
+        Returns:
+            True when all processors finished without errors
+        """
+        succeeded = False
+        try:
+            succeeded = self.build_collections()
+        finally:
+            self.source.close()
+            if self.report_file:
+                self.write_report(succeeded)
+            flush_logs()
+        return succeeded
+
+    def build_collections(self) -> bool:
+        """Run every processor, then the catalog-wide stages."""
+        logger.info(f"🏗 Building KubeRocketAI catalog: {', '.join(self.processors)}")
+        scanned = self.scan()
+        logger.info(f"🔎 Scanned {sum(len(files) for files in scanned.values())} source files in one pass")
+
+        failed: List[str] = []
+        for key, processor in self.processors.items():
+            logger.info("")
+            try:
+                succeeded = processor.run(self.output_file_for(key), self.project_root, files=scanned[key])
+            except Exception as e:
+                logger.error(f"❌ Fatal error processing {processor.content_type}: {e}")
+                succeeded = False
+
+            if not succeeded:
+                failed.append(key)
+
+        logger.info("")
+        if failed:
+            logger.error(f"❌ Catalog build failed for: {', '.join(failed)}")
+            return False
+
+        if not self.write_catalog_stages(list(self.processors)):
+            logger.error("❌ Catalog build failed: dangling references (see above; --allow-dangling to accept them)")
+            return False
+
+        logger.info(f"✅ Catalog build complete: {len(self.processors)} collections written to {self.output_dir}")
+        return True
+
+    def write_catalog_stages(self, keys: List[str]) -> bool:
+        """
+        Write the enabled catalog-wide outputs after the given collections changed.
+
+        The graph, search indexes and facets span all collections and are
+        rebuilt as a whole; detail payloads are only written for `keys`.
+        Disallowed dangling references are reported but do not stop the
+        later stages, so no output is left stale.
+
+        Returns:
+            False when the dependency graph has disallowed dangling references
+        """
+        graph_valid = not self.build_graph or self.write_dependency_graph()
+
+        if self.build_search_index:
+            self.write_search_index()
+
+        if self.build_facets:
+            self.write_facets()
+
+        if self.build_details:
+            self.write_item_details(keys)
+
+        return graph_valid
+
+    def refresh_catalog(self, targets: List[WatchTarget]) -> None:
+        """Bring the catalog-wide outputs up to date after watch mode regenerated some collections."""
+        keys = [key for key, processor in self.processors.items()
+                if any(target.processor is processor for target in targets)]
+        if keys and not self.write_catalog_stages(keys):
+            logger.error("❌ Catalog-wide outputs refreshed with dangling references; fix the references above")
+
+    def collection_items(self, key: str) -> List[Dict[str, Any]]:
+        """
+        Get the items of a collection for catalog-wide stages.
+
+        Collections built in this run come from memory; collections excluded
+        via --only are read back from their existing output file.
+        """
+        processor = self.processors.get(key)
+        if processor is not None:
+            return processor.processed_items
+
+        output_file = self.output_file_for(key)
+        if not output_file.exists():
+            return []
+        return list(CollectionReader(output_file, load_processor(key).get_items_key()))
+
+    def write_dependency_graph(self) -> bool:
+        """
+        Resolve cross-references and write the dependency graph.
+
+        References are only known for collections processed in this run;
+        collections excluded via --only contribute nodes but no outgoing edges.
+
+        The graph is written either way; dangling references have no edge.
+
+        Returns:
+            False when dangling references were found and are not allowed
+        """
+        graph = DependencyGraphBuilder()
+        for key in PROCESSOR_REGISTRY:
+            processor = self.processors.get(key)
+            if processor is None:
+                graph.add_collection(key, self.collection_items(key), {})
+            else:
+                graph.add_collection(key, self.collection_items(key), processor.item_references, processor.item_key)
+
+        dangling = self.dangling = graph.link()
+        output_file = self.output_dir / GRAPH_FILE
+        size = graph.write(output_file)
+        logger.info(f"🕸 Generated {output_file}: {len(graph.nodes)} nodes, {graph.edge_count} edges, {size} bytes")
+        if dangling and not self.allow_dangling:
+            logger.error(f"❌ Dangling references ({len(dangling)}):")
+            for reference in dangling:
+                logger.error(f"  - {reference}")
+            return False
+        for reference in dangling:
+            logger.warning(f"  ⚠ {reference}")
+        return True
+
+    def write_search_index(self) -> None:
+        """Write the word and n-gram search indexes over all registered collections."""
+        word_index = SearchIndexBuilder()
+        ngram_index = NgramIndexBuilder()
+        for key in PROCESSOR_REGISTRY:
+            items = self.collection_items(key)
+            word_index.add_collection(key, items)
+            ngram_index.add_collection(key, items)
+
+        output_file = self.output_dir / SEARCH_INDEX_FILE
+        size = word_index.write(output_file)
+        logger.info(f"🔍 Generated {output_file}: {len(word_index.documents)} documents, "
+                    f"{len(word_index.postings)} terms, {size} bytes")
+
+        output_file = self.output_dir / NGRAM_INDEX_FILE
+        size = ngram_index.write(output_file)
+        logger.info(f"🔍 Generated {output_file}: {len(ngram_index.postings)} grams, {size} bytes")
+
+    def write_facets(self) -> None:
+        """Write the category by content type matrix over all registered collections."""
+        facets = FacetMatrixBuilder()
+        for key in PROCESSOR_REGISTRY:
+            facets.add_collection(key, self.collection_items(key))
+
+        output_file = self.output_dir / FACETS_FILE
+        size = facets.write(output_file)
+        logger.info(f"🏷 Generated {output_file}: {len(facets.matrix)} categories across "
+                    f"{len(facets.totals)} content types, {size} bytes")
+
+    def write_item_details(self, keys: List[str]) -> None:
+        """
+        Write a pre-rendered detail payload per item of the given collections built in this run.
+
+        Only collections whose items carry a source path (tasks, templates,
+        data) have markdown bodies; payloads of collections excluded via
+        --only are left untouched.
+        """
+        for key in keys:
+            processor = self.processors[key]
+            if processor.path_prefix is None or processor.context is None:
+                continue
+            writer = ItemDetailsWriter(self.output_dir, key, processor.context.source_root,
+                                       processor.path_prefix, self.cache_dir, self.source.read_bytes)
+            count = writer.write(processor.processed_items)
+            logger.info(f"📄 Generated {writer.directory}: {count} detail payloads "
+                        f"({writer.written} written, {writer.removed} removed, "
+                        f"{writer.cache.hits} cached renders)")
+
+    def write_report(self, succeeded: bool) -> None:
+        """Write one JSON report covering every processor of this build."""
+        collections = [processor.last_report for processor in self.processors.values() if processor.last_report]
+        write_report(self.report_file, collections, succeeded, danglingReferences=self.dangling)
+        logger.info(f"🧾 Wrote build report: {self.report_file}")
+
+    def watch_targets(self) -> List[WatchTarget]:
+        """Describe every processor for the content watcher."""
+        return [
+            WatchTarget(processor, processor.find_source_directory(self.project_root),
+                        self.output_file_for(key), self.project_root)
+            for key, processor in self.processors.items()
+        ]
+
+
+def parse_only(value: Optional[str]) -> Optional[List[str]]:
+    """Parse a comma-separated list of content types."""
+    if not value:
+        return None
+    return [part.strip() for part in value.split(",") if part.strip()]
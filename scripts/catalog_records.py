@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Catalog Records
+
+Compact, slotted records for processed catalog items, one type per content
+collection. Field names and order are the JSON keys and key order of the
+public/data/*.json items, so records serialize to exactly the same output as
+the dicts they replace.
+
+Records behave like read/write mappings (get, [], in, iteration over present
+keys), so validation, indexing and output code work on records and plain
+dicts alike. Category strings are interned, so every item in a category
+shares one string object.
+"""
+
+import sys
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+
+class _Missing:
+    """Marks a field that is absent from the item (unlike an explicit null)."""
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __reduce__(self) -> str:
+        # Unpickle as the module singleton, so identity checks keep working
+        return "MISSING"
+
+
+MISSING: Any = _Missing()
+
+
+def intern_categories(categories: Any) -> Any:
+    """Intern category strings so items share them; other values pass through."""
+    if isinstance(categories, list):
+        return [sys.intern(c) if type(c) is str else c for c in categories]
+    return categories
+
+
+class CatalogRecord:
+    """
+    Mapping-style access shared by all record types.
+
+    Keys missing from the source item are stored as MISSING and behave as
+    absent: they are skipped when iterating or serializing and get() returns
+    the default. Keys outside the record's fields are kept in `extra`.
+    """
+    __slots__ = ()
+
+    # Field names in output order, and as a set for lookups (set by @catalog_record)
+    KEYS: Tuple[str, ...] = ()
+    KEY_SET: FrozenSet[str] = frozenset()
+
+    def __post_init__(self) -> None:
+        self.categories = intern_categories(self.categories)
+
+    @classmethod
+    def from_dict(cls, item: Dict[str, Any]) -> "CatalogRecord":
+        """Build a record from a plain item dict (e.g. loaded from JSON)."""
+        known = {key: item[key] for key in cls.KEYS if key in item}
+        extra = {key: value for key, value in item.items() if key not in known}
+        return cls(**known, extra=extra or None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict in output key order, e.g. for JSON encoding."""
+        result = {}
+        for key in self.KEYS:
+            value = getattr(self, key)
+            if value is not MISSING:
+                result[key] = value
+        if self.extra:
+            result.update(self.extra)
+        return result
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self.KEY_SET:
+            value = getattr(self, key)
+            return default if value is MISSING else value
+        if self.extra:
+            return self.extra.get(key, default)
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, MISSING)
+        if value is MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self.KEY_SET:
+            setattr(self, key, intern_categories(value) if key == "categories" else value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, MISSING) is not MISSING
+
+    def keys(self) -> List[str]:
+        present = [key for key in self.KEYS if getattr(self, key) is not MISSING]
+        return present + list(self.extra or ())
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return list(self.to_dict().items())
+
+
+def catalog_record(cls: type) -> type:
+    """Turn a record class into a slotted dataclass and record its key order."""
+    record = dataclass(slots=True)(cls)
+    record.KEYS = tuple(f.name for f in fields(record) if f.name != "extra")
+    record.KEY_SET = frozenset(record.KEYS)
+    return record
+
+
+# Field names are the JSON keys (hence camelCase), in output key order.
+
+@catalog_record
+class AgentRecord(CatalogRecord):
+    id: Any = MISSING
+    filename: Any = MISSING
+    name: Any = MISSING
+    role: Any = MISSING
+    description: Any = MISSING
+    goal: Any = MISSING
+    icon: Any = MISSING
+    categories: Any = MISSING
+    scope: Any = MISSING
+    whenToUse: Any = MISSING
+    commandCount: Any = MISSING
+    taskCount: Any = MISSING
+    commands: Any = MISSING
+    version: Any = MISSING
+    extra: Optional[Dict[str, Any]] = field(default=None, repr=False)
+
+
+@catalog_record
+class TaskRecord(CatalogRecord):
+    id: Any = MISSING
+    name: Any = MISSING
+    description: Any = MISSING
+    categories: Any = MISSING
+    path: Any = MISSING
+    extra: Optional[Dict[str, Any]] = field(default=None, repr=False)
+
+
+@catalog_record
+class TemplateRecord(CatalogRecord):
+    id: Any = MISSING
+    path: Any = MISSING
+    name: Any = MISSING
+    description: Any = MISSING
+    categories: Any = MISSING
+    extra: Optional[Dict[str, Any]] = field(default=None, repr=False)
+
+
+@catalog_record
+class DataRecord(CatalogRecord):
+    id: Any = MISSING
+    name: Any = MISSING
+    description: Any = MISSING
+    categories: Any = MISSING
+    path: Any = MISSING
+    extra: Optional[Dict[str, Any]] = field(default=None, repr=False)
+
+
+def to_json_value(value: Any) -> Any:
+    """json `default` hook: encodes records as their plain dicts."""
+    if isinstance(value, CatalogRecord):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
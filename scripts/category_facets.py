@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Category Facets
+
+Precomputed category facets so the content hub can render category tabs,
+badges and filtered counts without scanning every item on each filter change:
+per-collection item counts per category (kept in collection metadata), and a
+catalog-wide category by content type matrix with the item ids per category
+(facets.json, fetched only where filtering needs them).
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+from output_writer import encode_json, write_if_changed
+
+
+FACETS_VERSION = 1
+
+
+def item_categories(item: Any, category_field: str = "categories") -> List[str]:
+    """Trimmed, distinct category names of an item (non-strings and blanks are skipped)."""
+    categories = item.get(category_field)
+    if not isinstance(categories, list):
+        return []
+    names = []
+    for category in categories:
+        if isinstance(category, str):
+            trimmed = category.strip()
+            if trimmed and trimmed not in names:
+                names.append(trimmed)
+    return names
+
+
+def category_item_ids(items: Iterable[Any], category_field: str = "categories") -> Dict[str, List[str]]:
+    """
+    Sorted ids of the items in each category, with categories in sorted order.
+
+    An item is listed under every category it has, as the category tabs
+    filter; items without an id are skipped.
+    """
+    groups: Dict[str, List[str]] = {}
+    for item in items:
+        item_id = item.get("id")
+        if item_id is None:
+            continue
+        for category in item_categories(item, category_field):
+            groups.setdefault(category, []).append(str(item_id))
+    return {category: sorted(groups[category]) for category in sorted(groups)}
+
+
+def category_counts(items: Iterable[Any], category_field: str = "categories") -> Dict[str, int]:
+    """Item count per category of one collection, with categories in sorted order."""
+    counts: Dict[str, int] = {}
+    for item in items:
+        for category in item_categories(item, category_field):
+            counts[category] = counts.get(category, 0) + 1
+    return {category: counts[category] for category in sorted(counts)}
+
+
+class FacetMatrixBuilder:
+    """
+    Category by content type matrix over all catalog collections.
+
+    Output structure:
+    - types: content type names in registry order
+    - totals: item count per content type
+    - categories: every category of any collection, sorted
+    - counts: items per category across all content types
+    - matrix: category -> content type -> item count (zero counts omitted)
+    - items: content type -> category -> sorted item ids
+    """
+
+    def __init__(self):
+        self.totals: Dict[str, int] = {}
+        self.matrix: Dict[str, Dict[str, int]] = {}
+        self.items: Dict[str, Dict[str, List[str]]] = {}
+
+    def add_collection(self, content_type: str, items: Iterable[Any]) -> None:
+        items = list(items)
+        for category, count in category_counts(items).items():
+            self.matrix.setdefault(category, {})[content_type] = count
+        self.totals[content_type] = len(items)
+        self.items[content_type] = category_item_ids(items)
+
+    def build(self) -> Dict[str, Any]:
+        types = list(self.totals)
+        categories = sorted(self.matrix)
+        matrix = {
+            category: {key: self.matrix[category][key] for key in types if key in self.matrix[category]}
+            for category in categories
+        }
+        return {
+            "version": FACETS_VERSION,
+            "types": types,
+            "totals": self.totals,
+            "categories": categories,
+            "counts": {category: sum(row.values()) for category, row in matrix.items()},
+            "matrix": matrix,
+            "items": self.items,
+        }
+
+    def write(self, output_file: Path) -> int:
+        """Write the minified facets (unless unchanged) and return their size in bytes."""
+        encoded = encode_json(self.build())
+        write_if_changed(output_file, encoded)
+        return len(encoded)
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Content Sources
+
+Where the processors read .krci-ai content from. A source answers the few
+questions processing asks (does a directory exist, which files are below it,
+what are a file's bytes and stat) for one of:
+
+- a directory on disk (the default: the current directory)
+- a tar or zip archive, read member by member without extracting it
+- a git repository at a ref, read with ls-tree and cat-file without a checkout
+
+Archive and git sources expose their content under a virtual project root
+(e.g. /ci/framework.tar.gz/.krci-ai/tasks/review.md), so source paths stay
+unique and readable in logs, reports and catalog paths.
+"""
+
+import calendar
+import io
+import posixpath
+import subprocess
+import tarfile
+import threading
+import zipfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from build_cache import hash_bytes, hash_file
+from file_discovery import IgnoreRules, SourceTree, iter_source_files
+
+
+TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+ZIP_SUFFIXES = (".zip",)
+DEFAULT_GIT_REF = "HEAD"
+# Top-level archive directories that hold content themselves, never a wrapper to strip
+CONTENT_ROOT_NAMES = {".krci-ai", "krci-input", "agents", "tasks", "templates", "data"}
+
+
+class SourceError(Exception):
+    """A content source cannot be opened or read."""
+    pass
+
+
+class SourceStat(NamedTuple):
+    """The os.stat_result fields the build cache and deterministic builds use."""
+    st_mtime_ns: int
+    st_size: int
+
+    @property
+    def st_mtime(self) -> float:
+        return self.st_mtime_ns / 1e9
+
+
+class ContentSource(SourceTree):
+    """
+    Read-only access to content files, addressed by path below `root`.
+
+    The directory implementation forwards to the file system; subclasses
+    answer from an index of their members.
+    """
+
+    # Whether files can change under a running process (watch mode needs it)
+    watchable = True
+
+    def __init__(self, root: Path = None):
+        self.root = Path(root) if root is not None else Path.cwd()
+
+    @property
+    def label(self) -> str:
+        return str(self.root)
+
+    def is_dir(self, path: Path) -> bool:
+        return path.is_dir()
+
+    def exists(self, path: Path) -> bool:
+        return path.exists()
+
+    def iter_files(self, root: Path, suffixes: Iterable[str], top_level_dirs: Optional[Set[str]] = None) -> Iterator[Path]:
+        """Source files below root in sorted order, honoring .krciignore (see iter_source_files)."""
+        return iter_source_files(root, suffixes, top_level_dirs, tree=self)
+
+    def read_bytes(self, path: Path) -> bytes:
+        return path.read_bytes()
+
+    def open(self, path: Path) -> BinaryIO:
+        return open(path, 'rb')
+
+    def stat(self, path: Path) -> Any:
+        return path.stat()
+
+    def sha256(self, path: Path) -> str:
+        return hash_file(path)
+
+    def close(self) -> None:
+        pass
+
+
+class IndexedSource(ContentSource, ABC):
+    """
+    A source whose members are listed once up front.
+
+    Members are kept by their path relative to the root; directories are
+    implied by member paths. Reads are serialized, as archive and git readers
+    are not thread safe (read-ahead calls read_bytes from worker threads).
+    """
+
+    watchable = False
+
+    def __init__(self, root: Path):
+        super().__init__(root)
+        self.members: Optional[Dict[str, Any]] = None
+        self.stats: Dict[str, SourceStat] = {}
+        self.directories: Dict[str, List[Tuple[str, bool]]] = {}
+        self.lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Worker processes re-open the source on first use
+        state = self.__dict__.copy()
+        state.update(members=None, stats={}, directories={}, lock=None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    @abstractmethod
+    def list_members(self) -> Iterable[Tuple[str, SourceStat, Any]]:
+        """(relative path, stat, handle) of every regular file."""
+        pass
+
+    @abstractmethod
+    def read_member(self, handle: Any) -> bytes:
+        """Content of the member behind a handle from list_members."""
+        pass
+
+    def index(self) -> Dict[str, Any]:
+        if self.members is None:
+            with self.lock:
+                if self.members is None:
+                    self.build_index()
+        return self.members
+
+    def build_index(self) -> None:
+        members: Dict[str, Any] = {}
+        children: Dict[str, Set[Tuple[str, bool]]] = {"": set()}
+        for name, stat, handle in self.list_members():
+            name = safe_member_path(name)
+            if name is None or name in members:
+                continue
+            members[name] = handle
+            self.stats[name] = stat
+            parent, _, leaf = name.rpartition("/")
+            new_directory = parent not in children
+            children.setdefault(parent, set()).add((leaf, False))
+            # Register each newly seen directory with its parent, up to a known one
+            while parent and new_directory:
+                grandparent, _, directory = parent.rpartition("/")
+                new_directory = grandparent not in children
+                children.setdefault(grandparent, set()).add((directory, True))
+                parent = grandparent
+        self.directories = {directory: sorted(entries) for directory, entries in children.items()}
+        self.members = members
+
+    def relative(self, path: Path) -> Optional[str]:
+        try:
+            relative = path.relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+        return "" if relative == "." else relative
+
+    def member(self, path: Path) -> Any:
+        relative = self.relative(path)
+        handle = self.index().get(relative) if relative is not None else None
+        if handle is None:
+            raise FileNotFoundError(f"No such file in {self.label}: {path}")
+        return handle
+
+    def is_dir(self, path: Path) -> bool:
+        self.index()
+        return self.relative(path) in self.directories
+
+    def exists(self, path: Path) -> bool:
+        relative = self.relative(path)
+        return relative in self.index() or relative in self.directories
+
+    def list_dir(self, directory: Path) -> List[Tuple[str, bool]]:
+        self.index()
+        return self.directories.get(self.relative(directory), [])
+
+    def load_ignore(self, ignore_file: Path) -> Optional[IgnoreRules]:
+        if not self.exists(ignore_file) or self.is_dir(ignore_file):
+            return None
+        return IgnoreRules.parse(ignore_file, self.read_bytes(ignore_file).decode("utf-8").splitlines())
+
+    def read_bytes(self, path: Path) -> bytes:
+        handle = self.member(path)
+        with self.lock:
+            return self.read_member(handle)
+
+    def open(self, path: Path) -> BinaryIO:
+        return io.BytesIO(self.read_bytes(path))
+
+    def stat(self, path: Path) -> SourceStat:
+        self.member(path)
+        return self.stats[self.relative(path)]
+
+    def sha256(self, path: Path) -> str:
+        return hash_bytes(self.read_bytes(path))
+
+
+def safe_member_path(name: str) -> Optional[str]:
+    """Normalized relative member path, or None for absolute or escaping paths."""
+    name = name.replace("\\", "/")
+    if name.startswith("/"):
+        return None
+    normalized = posixpath.normpath(name)
+    if normalized in (".", "") or normalized == ".." or normalized.startswith("../"):
+        return None
+    return normalized
+
+
+def strip_wrapper(names: List[str]) -> str:
+    """
+    The single top-level directory all members share, e.g. 'krci-ai-main/'
+    of a release tarball, or '' when there is none (or it is a content root).
+    """
+    tops = {name.split("/", 1)[0] for name in names}
+    if len(tops) != 1 or not all("/" in name for name in names):
+        return ""
+    top = tops.pop()
+    return "" if top in CONTENT_ROOT_NAMES else f"{top}/"
+
+
+class ArchiveSource(IndexedSource):
+    """
+    A tar (optionally compressed) or zip archive read in place.
+
+    Zip and uncompressed tar members are read on demand. Compressed tars
+    cannot seek without decompressing again from the start, so they are read
+    once, in archive order, and their file contents are held in memory; use
+    an uncompressed tar or a zip for archives too large for that.
+
+    A single wrapping top-level directory is stripped, so release archives
+    and `git archive --prefix` output work as is.
+    """
+
+    def __init__(self, archive: Path):
+        super().__init__(archive.resolve())
+        self.archive = archive.resolve()
+        self.handle: Any = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+        state["handle"] = None
+        return state
+
+    @property
+    def is_zip(self) -> bool:
+        return self.archive.name.lower().endswith(ZIP_SUFFIXES)
+
+    @property
+    def is_streamed(self) -> bool:
+        """Whether the archive is a compressed tar, read in one forward pass."""
+        return not self.is_zip and not self.archive.name.lower().endswith(".tar")
+
+    def opened(self) -> Any:
+        """The random-access handle of a zip or uncompressed tar."""
+        if self.handle is None:
+            try:
+                self.handle = zipfile.ZipFile(self.archive) if self.is_zip else tarfile.open(self.archive, "r:")
+            except (OSError, tarfile.TarError, zipfile.BadZipFile) as e:
+                raise SourceError(f"Cannot open archive {self.archive}: {e}")
+        return self.handle
+
+    def stream_members(self) -> List[Tuple[str, tarfile.TarInfo, bytes]]:
+        """Every regular file of a compressed tar with its content, in archive order."""
+        entries = []
+        try:
+            with tarfile.open(self.archive, "r|*") as archive:
+                for info in archive:
+                    if info.isreg():
+                        entries.append((info.name, info, archive.extractfile(info).read()))
+        except (OSError, EOFError, tarfile.TarError) as e:
+            raise SourceError(f"Cannot read archive {self.archive}: {e}")
+        return entries
+
+    def list_members(self) -> Iterable[Tuple[str, SourceStat, Any]]:
+        if self.is_streamed:
+            # The member handle is the content itself
+            entries = [(name, info, data) for name, info, data in self.stream_members()]
+        elif self.is_zip:
+            entries = [(info.filename, info, info) for info in self.opened().infolist() if not info.is_dir()]
+        else:
+            entries = [(info.name, info, info) for info in self.opened().getmembers() if info.isreg()]
+
+        prefix = strip_wrapper([safe_member_path(name) or "" for name, _, _ in entries])
+        for name, info, handle in entries:
+            name = safe_member_path(name)
+            if name is None:
+                continue
+            if self.is_zip:
+                mtime = calendar.timegm(info.date_time + (0, 0, 0))
+                stat = SourceStat(mtime * 10 ** 9, info.file_size)
+            else:
+                stat = SourceStat(int(info.mtime) * 10 ** 9, info.size)
+            yield name[len(prefix):], stat, handle
+
+    def read_member(self, handle: Any) -> bytes:
+        if isinstance(handle, bytes):
+            return handle
+        archive = self.opened()
+        if self.is_zip:
+            return archive.read(handle)
+        return archive.extractfile(handle).read()
+
+    def close(self) -> None:
+        if self.handle is not None:
+            self.handle.close()
+            self.handle = None
+
+
+class GitSource(IndexedSource):
+    """
+    A git repository (bare or not) at a ref, read without a checkout.
+
+    The tree is listed once with `git ls-tree`; blobs are streamed through
+    one long-running `git cat-file --batch` process. Every file reports the
+    ref's commit time as its mtime, so deterministic builds are reproducible.
+    """
+
+    def __init__(self, repository: Path, ref: str = DEFAULT_GIT_REF):
+        super().__init__(Path(f"{repository.resolve()}@{ref}"))
+        self.repository = repository.resolve()
+        self.ref = ref
+        self.commit: Optional[str] = None
+        self.process: Optional[subprocess.Popen] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+        state["process"] = None
+        return state
+
+    def git(self, *args: str) -> bytes:
+        try:
+            return subprocess.run(["git", "-C", str(self.repository), *args], check=True,
+                                  stdout=subprocess.PIPE, stderr=subprocess.PIPE).stdout
+        except FileNotFoundError:
+            raise SourceError("git is not installed")
+        except subprocess.CalledProcessError as e:
+            raise SourceError(f"git {args[0]} failed for {self.label}: {e.stderr.decode(errors='replace').strip()}")
+
+    def list_members(self) -> Iterable[Tuple[str, SourceStat, Any]]:
+        self.commit = self.git("rev-parse", "--verify", f"{self.ref}^{{commit}}").decode().strip()
+        mtime = int(self.git("show", "-s", "--format=%ct", self.commit).decode().strip()) * 10 ** 9
+
+        # Entries: "<mode> <type> <object> <size>\t<path>", NUL-terminated
+        for entry in self.git("ls-tree", "-r", "-l", "-z", "--full-tree", self.commit).split(b"\0"):
+            if not entry:
+                continue
+            meta, _, name = entry.partition(b"\t")
+            mode, kind, obj, size = meta.split()
+            # Regular files only: symlinks (120000) and submodules are skipped
+            if kind == b"blob" and mode in (b"100644", b"100755"):
+                yield name.decode("utf-8"), SourceStat(mtime, int(size)), obj.decode()
+
+    def read_member(self, handle: Any) -> bytes:
+        if self.process is None:
+            self.process = subprocess.Popen(["git", "-C", str(self.repository), "cat-file", "--batch"],
+                                            stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        self.process.stdin.write(f"{handle}\n".encode())
+        self.process.stdin.flush()
+        # Reply: "<object> blob <size>\n<content>\n"
+        header = self.process.stdout.readline().split()
+        if len(header) != 3:
+            raise SourceError(f"Cannot read object {handle} from {self.label}")
+        data = self.process.stdout.read(int(header[2]))
+        self.process.stdout.read(1)
+        return data
+
+    def close(self) -> None:
+        if self.process is not None:
+            self.process.stdin.close()
+            self.process.wait()
+            self.process = None
+
+
+def is_bare_repository(path: Path) -> bool:
+    return (path / "HEAD").is_file() and (path / "objects").is_dir() and not (path / ".git").exists()
+
+
+def is_git_repository(path: Path) -> bool:
+    """A work tree (with .git) or a bare repository."""
+    return (path / ".git").exists() or is_bare_repository(path)
+
+
+def open_content_source(location: Optional[Path] = None, ref: Optional[str] = None) -> ContentSource:
+    """
+    Open the content source for a --source/--ref pair.
+
+    Without a ref, a directory is read as is (even a git work tree) and a
+    bare repository is read at HEAD; with one, the location must be a git
+    repository. Archives are recognized by suffix.
+    """
+    if location is None:
+        if ref is not None:
+            raise SourceError("--ref needs a git repository as --source")
+        return ContentSource()
+
+    location = Path(location)
+    if ref is not None:
+        if not is_git_repository(location):
+            raise SourceError(f"Not a git repository: {location}")
+        return GitSource(location, ref)
+    if is_bare_repository(location):
+        return GitSource(location, DEFAULT_GIT_REF)
+
+    if location.is_dir():
+        return ContentSource(location)
+    if location.name.lower().endswith(TAR_SUFFIXES + ZIP_SUFFIXES):
+        if not location.is_file():
+            raise SourceError(f"Archive not found: {location}")
+        return ArchiveSource(location)
+    raise SourceError(f"Unsupported content source: {location} (expected a directory, "
+                      f"a {'/'.join(TAR_SUFFIXES + ZIP_SUFFIXES)} archive or a git repository with --ref)")
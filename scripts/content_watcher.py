@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Content Watcher
+
+Watch mode for the content processors: monitors the .krci-ai source
+directories, debounces bursts of edits and patches only the affected items
+into the existing public/data/*.json files.
+
+Uses Linux inotify through ctypes when available and falls back to a
+polling stat loop elsewhere, so no third-party dependency is required.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from build_logging import flush_logs, get_logger
+from file_discovery import is_source_file, iter_source_files
+
+
+logger = get_logger("watch")
+
+DEFAULT_DEBOUNCE_SECONDS = 0.2
+DEFAULT_POLL_INTERVAL_SECONDS = 0.5
+
+# inotify event masks (see inotify(7))
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+EVENT_HEADER = struct.Struct("iIII")
+
+
+@dataclass
+class ChangeBatch:
+    """Debounced set of changes reported by a watcher."""
+    paths: Set[Path] = field(default_factory=set)
+    # Directories created, moved or removed: the files below them are unknown
+    rescan_dirs: Set[Path] = field(default_factory=set)
+    # Set when no individual path can be trusted (event queue overflow)
+    full_rescan: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.paths) or bool(self.rescan_dirs) or self.full_rescan
+
+    def merge(self, other: "ChangeBatch") -> None:
+        self.paths |= other.paths
+        self.rescan_dirs |= other.rescan_dirs
+        self.full_rescan = self.full_rescan or other.full_rescan
+
+
+@dataclass
+class WatchTarget:
+    """A processor together with the directory it reads and the file it writes."""
+    processor: object
+    source_dir: Path
+    output_file: Path
+    project_root: Optional[Path] = None
+
+
+class InotifyWatcher:
+    """Recursive directory watcher on top of the Linux inotify API."""
+
+    def __init__(self, roots: List[Path]):
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.watches: Dict[int, Path] = {}
+        for root in roots:
+            self.add_tree(root)
+
+    @staticmethod
+    def available() -> bool:
+        """Check whether inotify can be used on this platform."""
+        if not sys.platform.startswith("linux"):
+            return False
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        try:
+            return hasattr(ctypes.CDLL(libc_name), "inotify_init1")
+        except OSError:
+            return False
+
+    def add_tree(self, directory: Path) -> None:
+        """Watch a directory and all of its subdirectories."""
+        for dirpath, _, _ in os.walk(directory):
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(dirpath), WATCH_MASK)
+            if wd >= 0:
+                self.watches[wd] = Path(dirpath)
+
+    def wait(self, timeout: Optional[float]) -> ChangeBatch:
+        """Block up to timeout seconds and return the changes observed."""
+        batch = ChangeBatch()
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return batch
+
+        buffer = os.read(self.fd, 64 * 1024)
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+            offset += EVENT_HEADER.size
+            name = buffer[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                batch.full_rescan = True
+                continue
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+
+            directory = self.watches.get(wd)
+            if directory is None:
+                continue
+            path = directory / os.fsdecode(name) if name else directory
+
+            if mask & IN_ISDIR or mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                if mask & (IN_CREATE | IN_MOVED_TO) and path.is_dir():
+                    self.add_tree(path)
+                batch.rescan_dirs.add(path)
+            else:
+                batch.paths.add(path)
+
+        return batch
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Portable fallback that compares stat snapshots of the source trees."""
+
+    def __init__(self, targets: List[WatchTarget], interval: float = DEFAULT_POLL_INTERVAL_SECONDS):
+        self.targets = targets
+        self.interval = interval
+        self.snapshot = self.take_snapshot()
+
+    def take_snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        for target in self.targets:
+            if not target.source_dir.exists():
+                continue
+            for file_path in iter_source_files(target.source_dir, target.processor.source_extensions):
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    continue
+                snapshot[file_path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def wait(self, timeout: Optional[float]) -> ChangeBatch:
+        """Sleep for one poll interval (bounded by timeout) and diff the trees."""
+        time.sleep(self.interval if timeout is None else min(self.interval, timeout))
+
+        current = self.take_snapshot()
+        changed = {path for path, state in current.items() if self.snapshot.get(path) != state}
+        removed = set(self.snapshot) - set(current)
+        self.snapshot = current
+        return ChangeBatch(paths=changed | removed)
+
+    def close(self) -> None:
+        pass
+
+
+class ContentWatcher:
+    """
+    Debounced regeneration loop.
+
+    Collects change events until no new event arrives for the debounce
+    interval, routes changed paths to the processor owning them and patches
+    that processor's output. Directory-level changes trigger a full run of
+    the processors owning those directories instead. on_change, if given, is
+    called with the regenerated targets after each batch, for outputs that
+    derive from several collections.
+    """
+
+    def __init__(self, targets: List[WatchTarget], debounce: float = DEFAULT_DEBOUNCE_SECONDS,
+                 force_polling: bool = False, on_change: Callable[[List[WatchTarget]], None] = None):
+        self.targets = targets
+        self.debounce = debounce
+        self.on_change = on_change
+
+        if not force_polling and InotifyWatcher.available():
+            self.backend = InotifyWatcher([target.source_dir for target in targets])
+            self.backend_name = "inotify"
+        else:
+            self.backend = PollingWatcher(targets)
+            self.backend_name = "polling"
+
+    def next_batch(self) -> ChangeBatch:
+        """Wait for changes and return them once edits have settled."""
+        batch = ChangeBatch()
+        while not batch:
+            batch = self.backend.wait(None)
+
+        while True:
+            more = self.backend.wait(self.debounce)
+            if not more:
+                return batch
+            batch.merge(more)
+
+    def route(self, batch: ChangeBatch) -> Dict[int, Set[Path]]:
+        """Map changed paths to the index of the target that owns them."""
+        routed: Dict[int, Set[Path]] = {}
+        for path in batch.paths:
+            for index, target in enumerate(self.targets):
+                if is_source_file(path, target.source_dir, target.processor.source_extensions):
+                    routed.setdefault(index, set()).add(path)
+                    break
+        return routed
+
+    def owns(self, target: WatchTarget, directory: Path) -> bool:
+        """Check whether a directory is, contains or lies within a target's source tree."""
+        return (directory == target.source_dir or target.source_dir in directory.parents or
+                directory in target.source_dir.parents)
+
+    def apply(self, batch: ChangeBatch) -> None:
+        """Regenerate the outputs affected by a batch of changes."""
+        started = time.perf_counter()
+
+        rebuild = [
+            index for index, target in enumerate(self.targets)
+            if batch.full_rescan or any(self.owns(target, directory) for directory in batch.rescan_dirs)
+        ]
+        routed = {index: paths for index, paths in self.route(batch).items() if index not in rebuild}
+        if not rebuild and not routed:
+            return
+
+        for index in rebuild:
+            target = self.targets[index]
+            logger.info(f"🔄 Directory change detected, rebuilding {target.processor.content_type}")
+            target.processor.errors = []
+            target.processor.warnings = []
+            target.processor.run(target.output_file, target.project_root)
+
+        for index, paths in sorted(routed.items()):
+            target = self.targets[index]
+            target.processor.patch_output(target.output_file, paths)
+
+        if self.on_change is not None:
+            self.on_change([self.targets[index] for index in sorted(set(rebuild) | set(routed))])
+
+        logger.info(f"⏱ Regenerated in {time.perf_counter() - started:.2f}s")
+        flush_logs()
+
+    def run(self) -> None:
+        """Watch until interrupted."""
+        watched = ", ".join(str(target.source_dir) for target in self.targets)
+        logger.info(f"\n👀 Watching {watched} ({self.backend_name}); press Ctrl+C to stop")
+
+        try:
+            while True:
+                flush_logs()
+                batch = self.next_batch()
+                try:
+                    self.apply(batch)
+                except Exception as e:
+                    logger.error(f"❌ Regeneration failed: {e}")
+                    flush_logs()
+        except KeyboardInterrupt:
+            logger.info("\n👋 Watch mode stopped")
+        finally:
+            self.backend.close()
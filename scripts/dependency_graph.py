@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Dependency Graph Builder
+
+Resolves the cross-references collected by the processors (task frontmatter
+`dependencies`, agent `tasks` and task-executing `commands`) into a compact,
+integer-indexed graph with forward and reverse edges.
+"""
+
+from pathlib import PurePosixPath
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from output_writer import encode_json, write_if_changed
+
+
+GRAPH_VERSION = 1
+SOURCE_SUFFIXES = ('.md', '.yaml', '.yml', '.json')
+
+
+def normalize_reference(kind: str, target: str) -> str:
+    """
+    Reduce a reference to a path key relative to its content directory.
+
+    './.krci-ai/tasks/create-pitch-deck.md', 'tasks/create-pitch-deck.md' and
+    'create-pitch-deck' (kind 'tasks') all become 'create-pitch-deck'.
+    """
+    value = target.strip().replace('\\', '/')
+    for prefix in ('{project_root}/', './', '/'):
+        if value.startswith(prefix):
+            value = value[len(prefix):]
+    for prefix in ('.krci-ai/', 'krci-input/.krci-ai/', f'{kind}/'):
+        if value.startswith(prefix):
+            value = value[len(prefix):]
+    if value.endswith(SOURCE_SUFFIXES):
+        value = str(PurePosixPath(value).with_suffix(''))
+    return value
+
+
+class DependencyGraphBuilder:
+    """
+    Builds the catalog dependency graph.
+
+    Nodes are catalog items in collection order and item output order, the
+    same numbering the search indexes use. References resolve first by path
+    relative to the content directory, then by unique file stem.
+
+    Output structure:
+    - types: content type names; nodes reference them by position
+    - nodes: [typeIndex, itemId] pairs; a node id is the list position
+    - forward: per node, ascending ids of the nodes it depends on
+    - reverse: per node, ascending ids of the nodes that depend on it
+    """
+
+    def __init__(self):
+        self.types: List[str] = []
+        self.nodes: List[List[Any]] = []
+        self.path_index: Dict[str, Dict[str, int]] = {}
+        self.stem_index: Dict[str, Dict[str, List[int]]] = {}
+        self.pending: List[Tuple[int, str, str]] = []
+        self.forward: List[Set[int]] = []
+        self.reverse: List[Set[int]] = []
+        self.dangling: List[str] = []
+
+    def add_collection(self, content_type: str, items: List[Dict[str, Any]],
+                       references: Dict[str, Dict[str, List[str]]],
+                       item_key: Callable[[Dict[str, Any]], Optional[str]] = None) -> None:
+        """
+        Register the items of one collection and their outgoing references.
+
+        `references` are keyed by `item_key(item)`, the processor's item
+        identity (the catalog path where items have one); by id by default.
+        """
+        item_key = item_key or (lambda item: item.get("id"))
+        type_index = len(self.types)
+        self.types.append(content_type)
+        paths = self.path_index.setdefault(content_type, {})
+        stems = self.stem_index.setdefault(content_type, {})
+
+        for item in items:
+            node_id = len(self.nodes)
+            item_id = item.get("id", "")
+            self.nodes.append([type_index, item_id])
+            self.forward.append(set())
+            self.reverse.append(set())
+
+            keys = {item_id, item.get("filename") or ""}
+            if item.get("path"):
+                keys.add(normalize_reference(content_type, item["path"]))
+            for key in filter(None, keys):
+                paths.setdefault(key, node_id)
+                stem = PurePosixPath(key).name
+                if node_id not in stems.setdefault(stem, []):
+                    stems[stem].append(node_id)
+
+            for kind, targets in (references.get(item_key(item)) or {}).items():
+                for target in targets:
+                    self.pending.append((node_id, kind, target))
+
+    def resolve(self, kind: str, target: str) -> Optional[int]:
+        """Resolve one reference to a node id, or None if it is dangling."""
+        key = normalize_reference(kind, target)
+        node_id = self.path_index.get(kind, {}).get(key)
+        if node_id is not None:
+            return node_id
+
+        candidates = self.stem_index.get(kind, {}).get(PurePosixPath(key).name, [])
+        return candidates[0] if len(candidates) == 1 else None
+
+    def link(self) -> List[str]:
+        """
+        Resolve all pending references into edges.
+
+        Returns:
+            Human-readable descriptions of dangling references
+        """
+        self.dangling = []
+        for source, kind, target in self.pending:
+            if kind not in self.path_index:
+                self.dangling.append(f"{self.describe(source)}: unknown reference kind '{kind}' ({target})")
+                continue
+
+            node_id = self.resolve(kind, target)
+            if node_id is None:
+                self.dangling.append(f"{self.describe(source)}: missing {kind} dependency '{target}'")
+                continue
+
+            self.forward[source].add(node_id)
+            self.reverse[node_id].add(source)
+
+        self.pending = []
+        return self.dangling
+
+    def describe(self, node_id: int) -> str:
+        type_index, item_id = self.nodes[node_id]
+        return f"{self.types[type_index]}/{item_id}"
+
+    @property
+    def edge_count(self) -> int:
+        return sum(len(targets) for targets in self.forward)
+
+    def build(self) -> Dict[str, Any]:
+        return {
+            "version": GRAPH_VERSION,
+            "types": self.types,
+            "nodes": self.nodes,
+            "forward": [sorted(targets) for targets in self.forward],
+            "reverse": [sorted(sources) for sources in self.reverse],
+        }
+
+    def write(self, output_file) -> int:
+        """Write the minified graph (unless unchanged) and return its size in bytes."""
+        encoded = encode_json(self.build())
+        write_if_changed(output_file, encoded)
+        return len(encoded)
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+File Discovery
+
+Single-pass, streaming discovery of content source files using os.scandir,
+with suffix filtering and .krciignore support. The same walk runs over any
+other tree (e.g. an archive index) through the SourceTree interface.
+"""
+
+import os
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+
+IGNORE_FILE_NAME = ".krciignore"
+
+
+class IgnoreRules:
+    """
+    Ignore patterns loaded from one .krciignore file.
+
+    Supports a practical subset of .gitignore syntax:
+    - Blank lines and lines starting with '#' are skipped
+    - Patterns without '/' match a file or directory name at any depth
+    - Patterns containing '/' match the path relative to the ignore file
+    - A trailing '/' restricts the pattern to directories
+    - A leading '!' re-includes a previously ignored path
+    """
+
+    def __init__(self, base_dir: Path, patterns: List[Tuple[str, bool, bool, bool]]):
+        self.base_dir = base_dir
+        # (pattern, anchored, directory_only, negated)
+        self.patterns = patterns
+
+    @classmethod
+    def load(cls, ignore_file: Path) -> Optional["IgnoreRules"]:
+        """Parse an ignore file, returning None when it is absent or empty."""
+        try:
+            with open(ignore_file, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return None
+        return cls.parse(ignore_file, lines)
+
+    @classmethod
+    def parse(cls, ignore_file: Path, lines: Iterable[str]) -> Optional["IgnoreRules"]:
+        """Parse the lines of an ignore file, returning None when there are no patterns."""
+        patterns = []
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+
+            negated = line.startswith('!')
+            if negated:
+                line = line[1:]
+
+            directory_only = line.endswith('/')
+            line = line.strip('/') if directory_only else line.lstrip('/')
+            anchored = '/' in line
+            if line:
+                patterns.append((line, anchored, directory_only, negated))
+
+        return cls(ignore_file.parent, patterns) if patterns else None
+
+    def match(self, path: Path, is_dir: bool) -> Optional[bool]:
+        """
+        Check a path against the rules.
+
+        Returns:
+            True if ignored, False if explicitly re-included, None if no rule applies
+        """
+        try:
+            relative = path.relative_to(self.base_dir).as_posix()
+        except ValueError:
+            return None
+
+        result = None
+        for pattern, anchored, directory_only, negated in self.patterns:
+            if directory_only and not is_dir:
+                continue
+            target = relative if anchored else path.name
+            if fnmatchcase(target, pattern):
+                result = not negated
+        return result
+
+
+def is_ignored(path: Path, is_dir: bool, rules: List[IgnoreRules]) -> bool:
+    """Apply stacked ignore rules; deeper ignore files take precedence."""
+    ignored = False
+    for rule_set in rules:
+        decision = rule_set.match(path, is_dir)
+        if decision is not None:
+            ignored = decision
+    return ignored
+
+
+class SourceTree:
+    """
+    Directory listing and ignore-file access for a walk; the default reads the file system.
+
+    Other content sources (archives, git trees) override both methods.
+    """
+
+    def list_dir(self, directory: Path) -> List[Tuple[str, bool]]:
+        """(name, is_dir) of the entries of a directory, sorted by name."""
+        with os.scandir(directory) as iterator:
+            return sorted((entry.name, entry.is_dir()) for entry in iterator
+                          if entry.is_dir() or entry.is_file())
+
+    def load_ignore(self, ignore_file: Path) -> Optional[IgnoreRules]:
+        return IgnoreRules.load(ignore_file)
+
+
+FILE_SYSTEM = SourceTree()
+
+
+def iter_source_files(root: Path, suffixes: Iterable[str],
+                      top_level_dirs: Optional[Set[str]] = None,
+                      ignore_file_name: str = IGNORE_FILE_NAME,
+                      tree: SourceTree = FILE_SYSTEM) -> Iterator[Path]:
+    """
+    Walk a directory tree once and yield matching files as they are found.
+
+    Entries are visited depth-first in name order, which yields paths in the
+    same order as sorted() over the full list, without building it first.
+
+    Args:
+        root: Directory to walk
+        suffixes: File suffixes to include (e.g. {'.md', '.yaml'})
+        top_level_dirs: If given, only descend into these directories of root
+        ignore_file_name: Name of per-directory ignore files
+        tree: Tree to walk (the file system by default)
+
+    When walking a single content directory, the ignore file in its parent is
+    honored as well, so one .krci-ai/.krciignore applies whether a processor
+    walks its own subdirectory or the catalog builder walks all of .krci-ai.
+    """
+    suffix_tuple = tuple(sorted(set(suffixes)))
+
+    base_rules: List[IgnoreRules] = []
+    if top_level_dirs is None:
+        parent_rules = tree.load_ignore(root.parent / ignore_file_name)
+        if parent_rules:
+            base_rules.append(parent_rules)
+
+    yield from _walk(tree, root, suffix_tuple, top_level_dirs, ignore_file_name, base_rules)
+
+
+def _walk(tree: SourceTree, directory: Path, suffixes: Tuple[str, ...], top_level_dirs: Optional[Set[str]],
+          ignore_file_name: str, rules: List[IgnoreRules]) -> Iterator[Path]:
+    local_rules = tree.load_ignore(directory / ignore_file_name)
+    if local_rules:
+        rules = rules + [local_rules]
+
+    for name, is_dir in tree.list_dir(directory):
+        path = directory / name
+        if is_dir:
+            if top_level_dirs is not None and name not in top_level_dirs:
+                continue
+            if not is_ignored(path, True, rules):
+                yield from _walk(tree, path, suffixes, None, ignore_file_name, rules)
+        elif top_level_dirs is not None:
+            # Files directly in root belong to no content directory
+            continue
+        elif name.endswith(suffixes) and name != ignore_file_name:
+            if not is_ignored(path, False, rules):
+                yield path
+
+
+def is_source_file(path: Path, root: Path, suffixes: Iterable[str],
+                   ignore_file_name: str = IGNORE_FILE_NAME) -> bool:
+    """
+    Check whether a single path would be yielded by iter_source_files(root, ...).
+
+    Used to classify change events without re-walking the tree.
+    """
+    if not path.name.endswith(tuple(suffixes)) or path.name == ignore_file_name:
+        return False
+
+    try:
+        parts = path.relative_to(root).parts
+    except ValueError:
+        return False
+
+    rules: List[IgnoreRules] = []
+    parent_rules = IgnoreRules.load(root.parent / ignore_file_name)
+    if parent_rules:
+        rules.append(parent_rules)
+
+    # Every ancestor directory below root must itself be included
+    directory = root
+    for name in parts[:-1]:
+        local_rules = IgnoreRules.load(directory / ignore_file_name)
+        if local_rules:
+            rules.append(local_rules)
+        directory = directory / name
+        if is_ignored(directory, True, rules):
+            return False
+
+    local_rules = IgnoreRules.load(directory / ignore_file_name)
+    if local_rules:
+        rules.append(local_rules)
+
+    return not is_ignored(path, False, rules)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Item Detail Payloads
+
+Writes one static detail file per catalog item (details/<collection>/<id>.json)
+holding the item's markdown body pre-rendered to HTML, its heading outline and
+the instruction tags stripped from it. List pages keep only card-level fields;
+detail pages fetch a single small, cacheable payload instead of rendering raw
+markdown at runtime.
+
+Rendering is cached by source content hash, so unchanged files are not
+re-rendered on the next build.
+"""
+
+import io
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+
+from build_cache import hash_bytes
+from build_logging import get_logger
+from markdown_render import RENDERER_VERSION, render_markdown
+from output_writer import encode_json, write_if_changed
+from yaml_loader import read_frontmatter_block
+
+
+logger = get_logger("details")
+
+DETAILS_DIR = "details"
+UNSAFE_FILE_CHARS = re.compile(r"[^\w.-]+")
+
+
+def detail_file_name(item_id: str) -> str:
+    """File name of an item's detail payload; ids are kept unless unsafe in a path."""
+    name = UNSAFE_FILE_CHARS.sub("-", item_id).strip(".-")
+    return f"{name or 'item'}.json"
+
+
+def markdown_body(text: str) -> str:
+    """Markdown text without its frontmatter block."""
+    stream = io.StringIO(text)
+    if read_frontmatter_block(stream) is None:
+        return text
+    return stream.read()
+
+
+class RenderCache:
+    """
+    Rendered bodies by SHA-256 of the source bytes, persisted per collection.
+
+    Entries are only kept for sources seen in the current build, and the
+    whole cache is discarded when the renderer version changes.
+    """
+
+    def __init__(self, cache_dir: Path, collection: str):
+        self.cache_file = Path(cache_dir) / f"details-{collection}.json"
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.next_entries: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def load(self) -> None:
+        if not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except Exception as e:
+            logger.warning(f"⚠ Ignoring unreadable render cache {self.cache_file}: {e}")
+            return
+        if cached.get("renderer") == RENDERER_VERSION:
+            self.entries = cached.get("entries", {})
+
+    def render(self, source: bytes) -> Dict[str, Any]:
+        """Rendered html, outline and instruction tags of a markdown source."""
+        digest = hash_bytes(source)
+        entry = self.entries.get(digest) or self.next_entries.get(digest)
+        if entry is None:
+            self.misses += 1
+            document = render_markdown(markdown_body(source.decode("utf-8")))
+            entry = {"html": document.html, "outline": document.outline,
+                     "instructionTags": document.instruction_tags}
+        else:
+            self.hits += 1
+        self.next_entries[digest] = entry
+        return dict(entry, sourceHash=digest)
+
+    def save(self) -> None:
+        if self.next_entries == self.entries:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_suffix(".tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({"renderer": RENDERER_VERSION, "entries": dict(sorted(self.next_entries.items()))},
+                      f, ensure_ascii=False)
+        os.replace(tmp_file, self.cache_file)
+
+
+class ItemDetailsWriter:
+    """
+    Writes the detail payloads of one collection.
+
+    Items are matched to their source file through the catalog path: the part
+    after the collection's path prefix is relative to its source directory.
+    Payload files of items that no longer exist are removed.
+    """
+
+    def __init__(self, output_dir: Path, collection: str, source_dir: Path, path_prefix: str, cache_dir: Path,
+                 reader: Callable[[Path], bytes] = Path.read_bytes):
+        self.collection = collection
+        self.directory = output_dir / DETAILS_DIR / collection
+        self.source_dir = source_dir
+        # Reads source files (ContentSource.read_bytes for archive or git sources)
+        self.reader = reader
+        self.path_prefix = path_prefix.rstrip("/") + "/"
+        self.cache = RenderCache(cache_dir, collection)
+        self.written = 0
+        self.unchanged = 0
+        self.removed = 0
+
+    def source_file(self, item: Any) -> Optional[Path]:
+        path = item.get("path")
+        if not isinstance(path, str) or not path.startswith(self.path_prefix):
+            return None
+        return self.source_dir / path[len(self.path_prefix):]
+
+    def write(self, items: Iterable[Any]) -> int:
+        """
+        Write a payload per item with a readable source file.
+
+        Returns:
+            Number of payloads in the collection
+        """
+        self.cache.load()
+        names: Set[str] = set()
+
+        for item in items:
+            item_id = item.get("id")
+            source_file = self.source_file(item)
+            if not item_id or source_file is None:
+                continue
+            name = detail_file_name(str(item_id))
+            if name in names:
+                logger.warning(f"⚠ Duplicate detail file {self.collection}/{name} for {item.get('path')}; keeping the first")
+                continue
+            try:
+                source = self.reader(source_file)
+            except OSError as e:
+                logger.warning(f"⚠ Cannot read {source_file} for detail payload: {e}")
+                continue
+            names.add(name)
+
+            payload = {
+                "id": item_id,
+                "collection": self.collection,
+                "name": item.get("name"),
+                "path": item.get("path"),
+                **self.cache.render(source),
+            }
+            if write_if_changed(self.directory / name, encode_json(payload)):
+                self.written += 1
+            else:
+                self.unchanged += 1
+
+        self.remove_stale(names)
+        self.cache.save()
+        return len(names)
+
+    def remove_stale(self, names: Set[str]) -> None:
+        if not self.directory.exists():
+            return
+        for stale in self.directory.glob("*.json"):
+            if stale.name not in names:
+                stale.unlink()
+                self.removed += 1
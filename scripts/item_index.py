@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Item Index
+
+Identity index over the items of a previous output, used to find the existing
+(curated) item for each source file. Items are keyed by their normalized
+catalog path, so same-named files in different folders never shadow each
+other; ids and file stems are kept as aliases for items whose path changed
+or that were written without one.
+"""
+
+import posixpath
+from typing import AbstractSet, Any, Dict, Iterable, Iterator, List, Optional, Set
+
+
+def normalize_item_path(path: str) -> str:
+    """Canonical catalog path: forward slashes, no '.', '..' or repeated separators."""
+    return posixpath.normpath(path.replace("\\", "/"))
+
+
+class ItemIndex:
+    """
+    Existing items by identity key, with an alias table.
+
+    A key that occurs twice is a collision: the first item is kept and the
+    collision is recorded instead of silently overwriting it. An alias shared
+    by several items is ambiguous and no longer matches anything, so lookups
+    never pick an arbitrary one of them.
+    """
+
+    def __init__(self):
+        self.items: Dict[str, Any] = {}
+        self.aliases: Dict[str, str] = {}
+        self.ambiguous: Set[str] = set()
+        # Keys that occurred more than once, in the order they were seen
+        self.collisions: List[str] = []
+
+    def add(self, key: str, item: Any, aliases: Iterable[str] = ()) -> bool:
+        """
+        Index an item under its key and aliases.
+
+        Returns:
+            False if the key was already taken (the item is not indexed)
+        """
+        if key in self.items:
+            self.collisions.append(key)
+            return False
+
+        self.items[key] = item
+        for alias in aliases:
+            if not alias or alias in self.ambiguous:
+                continue
+            current = self.aliases.setdefault(alias, key)
+            if current != key:
+                del self.aliases[alias]
+                self.ambiguous.add(alias)
+        return True
+
+    def resolve(self, key: str, alias: Optional[str] = None,
+                claimed: AbstractSet[str] = frozenset()) -> Optional[str]:
+        """
+        Key of the item matching `key`, else the item the alias uniquely names.
+
+        An alias never resolves to a key in `claimed` (e.g. the path of a
+        source file that still exists), so it cannot take over that item.
+        """
+        if key in self.items:
+            return key
+        if alias is not None:
+            target = self.aliases.get(alias)
+            if target is not None and target not in claimed:
+                return target
+        return None
+
+    def find(self, key: str, alias: Optional[str] = None,
+             claimed: AbstractSet[str] = frozenset()) -> Optional[Any]:
+        resolved = self.resolve(key, alias, claimed)
+        return self.items[resolved] if resolved is not None else None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.items.get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.items
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.items)
+
+    def values(self) -> Iterable[Any]:
+        return self.items.values()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+JSON Streaming
+
+Streaming access to catalog collection files ({"<items>": [...], "metadata": {...}})
+so neither reading the previous output nor writing the new one needs the whole
+document in memory.
+
+CollectionWriter emits items one at a time, byte-identical to
+json.dump(indent=2, ensure_ascii=False), and only replaces the output file when
+the content changed. CollectionReader yields the items of an existing file one
+by one; the other top-level values (metadata) are available once the items
+have been read.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator
+
+from catalog_records import to_json_value
+
+
+READ_CHUNK_SIZE = 64 * 1024
+WRITE_BUFFER_SIZE = 64 * 1024
+INDENT = "  "
+WHITESPACE = " \t\n\r"
+VALUE_END = WHITESPACE + ",]}"
+KEY_END = WHITESPACE + ":"
+
+
+class CollectionWriter:
+    """
+    Writes a pretty-printed collection file incrementally.
+
+    Top-level entries are written in call order; list entries are written
+    item by item. Output goes to a temporary file next to the target and
+    replaces it on close only when the bytes differ, so unchanged files keep
+    their mtime (as with output_writer.write_if_changed).
+
+    Usage:
+        with CollectionWriter(output_file) as writer:
+            writer.write_items("tasks", items)
+            writer.write_value("metadata", metadata)
+    """
+
+    def __init__(self, output_file: Path):
+        self.output_file = output_file
+        self.temp_file = output_file.with_name(f".{output_file.name}.tmp")
+        self.encoder = json.JSONEncoder(indent=len(INDENT), ensure_ascii=False, default=to_json_value)
+        self.digest = hashlib.sha256()
+        self.size = 0
+        self.entries = 0
+        self.changed = False
+        self.stream = None
+
+    def __enter__(self) -> "CollectionWriter":
+        self.output_file.parent.mkdir(parents=True, exist_ok=True)
+        self.stream = open(self.temp_file, "wb", buffering=WRITE_BUFFER_SIZE)
+        self.write("{")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.stream.close()
+            self.temp_file.unlink(missing_ok=True)
+
+    def write(self, text: str) -> None:
+        data = text.encode("utf-8")
+        self.stream.write(data)
+        self.digest.update(data)
+        self.size += len(data)
+
+    def encode(self, value: Any, level: int) -> str:
+        """Encode a value as it appears nested `level` levels deep."""
+        # Newlines only occur between tokens (strings escape them), so
+        # re-indenting the standalone encoding gives the nested form
+        return self.encoder.encode(value).replace("\n", "\n" + INDENT * level)
+
+    def begin_entry(self, key: str) -> None:
+        self.write(("," if self.entries else "") + f"\n{INDENT}{self.encode(key, 1)}: ")
+        self.entries += 1
+
+    def write_value(self, key: str, value: Any) -> None:
+        """Write a top-level entry in one piece (e.g. metadata)."""
+        self.begin_entry(key)
+        self.write(self.encode(value, 1))
+
+    def write_items(self, key: str, items: Iterable[Any]) -> int:
+        """
+        Write a top-level list entry one item at a time.
+
+        Returns:
+            Number of items written
+        """
+        self.begin_entry(key)
+        count = 0
+        for item in items:
+            self.write(("," if count else "[") + f"\n{INDENT * 2}{self.encode(item, 2)}")
+            count += 1
+        self.write(f"\n{INDENT}]" if count else "[]")
+        return count
+
+    def close(self) -> bool:
+        """
+        Finish the document and move it into place if its content changed.
+
+        Returns:
+            True if the output file was replaced
+        """
+        self.write("\n}" if self.entries else "}")
+        self.stream.close()
+
+        self.changed = not same_content(self.output_file, self.size, self.digest.hexdigest())
+        if self.changed:
+            os.replace(self.temp_file, self.output_file)
+        else:
+            self.temp_file.unlink()
+        return self.changed
+
+
+def same_content(file_path: Path, size: int, digest: str) -> bool:
+    """Check whether a file holds exactly the content with this size and SHA-256."""
+    try:
+        if file_path.stat().st_size != size:
+            return False
+        existing = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b""):
+                existing.update(chunk)
+    except OSError:
+        return False
+    return existing.hexdigest() == digest
+
+
+class CollectionReader:
+    """
+    Iterates the items of a collection file without loading the whole file.
+
+    Iterating yields the elements of the `items_key` list in file order.
+    Every other top-level entry is decoded whole into `rest`, which is
+    complete once iteration has finished (metadata follows the items).
+    """
+
+    def __init__(self, input_file: Path, items_key: str, chunk_size: int = READ_CHUNK_SIZE):
+        self.input_file = input_file
+        self.items_key = items_key
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.rest: Dict[str, Any] = {}
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.stream = None
+
+    def __iter__(self) -> Iterator[Any]:
+        with open(self.input_file, "r", encoding="utf-8") as self.stream:
+            self.buffer, self.pos, self.eof = "", 0, False
+            yield from self.read_document()
+
+    def read_document(self) -> Iterator[Any]:
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.decode_value(KEY_END)
+            if not isinstance(key, str):
+                raise self.error("Expecting property name")
+            self.expect(":")
+            if key == self.items_key and self.peek() == "[":
+                yield from self.read_items()
+            else:
+                self.rest[key] = self.decode_value()
+            if self.expect(",}") == "}":
+                return
+
+    def read_items(self) -> Iterator[Any]:
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.decode_value()
+            if self.expect(",]") == "]":
+                return
+
+    def fill(self) -> bool:
+        """Read more text; grows the read size with the pending value so retries stay linear."""
+        if self.eof:
+            return False
+        if self.pos:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        chunk = self.stream.read(max(self.chunk_size, len(self.buffer)))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer += chunk
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of file)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, allowed: str) -> str:
+        char = self.peek()
+        if not char or char not in allowed:
+            raise self.error(f"Expecting one of {allowed!r}")
+        self.pos += 1
+        return char
+
+    def decode_value(self, ends: str = VALUE_END) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Most likely a value cut off at the end of the buffer
+                if self.fill():
+                    continue
+                raise
+            # Valid JSON continues with whitespace or a delimiter; anything else
+            # (or the buffer end) means a number was cut off, e.g. "12." of "12.5"
+            if (end == len(self.buffer) or self.buffer[end] not in ends) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(f"{message} in {self.input_file.name}", self.buffer, self.pos)
+
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Markdown Rendering
+
+Small, dependency-free markdown to HTML renderer for the item detail pages.
+It covers the markdown used by .krci-ai content: ATX headings, paragraphs,
+lists, fenced code, block quotes, tables, rules and inline code, emphasis and
+links. Raw HTML is escaped, never passed through.
+
+XML-style instruction tags on lines of their own (e.g. <user_clarification>)
+are stripped before rendering; their content is kept. The renderer is fully
+deterministic, so the same source always produces the same bytes.
+"""
+
+import html
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+# Bump when rendering output changes to invalidate render caches
+RENDERER_VERSION = "2"
+
+FENCE = re.compile(r"^ {0,3}(`{3,}|~{3,})\s*([^`\s]*)")
+HEADING = re.compile(r"^ {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$")
+RULE = re.compile(r"^ {0,3}([-*_])(?:[ \t]*\1){2,}[ \t]*$")
+QUOTE = re.compile(r"^ {0,3}> ?(.*)$")
+LIST_ITEM = re.compile(r"^( *)([-*+]|\d{1,9}[.)])(?:[ \t]+(.*))?$")
+TABLE_DELIMITER = re.compile(r"^ {0,3}\|?\s*:?-+:?\s*(?:\|\s*:?-+:?\s*)*\|?\s*$")
+INSTRUCTION_TAG = re.compile(r"^\s*<(/?)([a-z][a-z0-9_-]*)>\s*$")
+
+CODE_SPAN = re.compile(r"(`+)(.+?)\1", re.S)
+IMAGE = re.compile(r'!\[([^\]]*)\]\(([^)\s]+)(?:\s+&quot;(.*?)&quot;)?\)')
+LINK = re.compile(r'\[([^\]]+)\]\(([^)\s]+)(?:\s+&quot;(.*?)&quot;)?\)')
+AUTOLINK = re.compile(r"&lt;((?:https?|mailto):[^\s&]+)&gt;")
+STRONG = re.compile(r"\*\*(?=\S)(.+?)(?<=\S)\*\*|__(?=\S)(.+?)(?<=\S)__")
+EMPHASIS = re.compile(r"(?<![\w*])\*(?=[^\s*])(.+?)(?<=[^\s*])\*(?![\w*])|(?<!\w)_(?=[^\s_])(.+?)(?<=[^\s_])_(?!\w)")
+TAGS = re.compile(r"<[^>]+>")
+SAFE_URL = re.compile(r"^(?:https?:|mailto:|#|/|\.{0,2}/|[^:]*$)", re.I)
+
+
+@dataclass
+class RenderedDocument:
+    """HTML body, heading outline and the instruction tags that were stripped."""
+    html: str
+    outline: List[Dict[str, object]] = field(default_factory=list)
+    instruction_tags: List[str] = field(default_factory=list)
+
+
+def strip_instruction_tags(lines: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    Blank out lines that hold only an XML-style tag, outside fenced code.
+
+    Returns:
+        The cleaned lines and the distinct tag names in order of appearance
+    """
+    cleaned = []
+    tags: List[str] = []
+    fence: Optional[str] = None
+    for line in lines:
+        match = FENCE.match(line)
+        if fence is None and match:
+            fence = match.group(1)
+        elif fence is not None and line.strip().startswith(fence[0] * len(fence)) and not line.strip().strip(fence[0]):
+            fence = None
+        elif fence is None:
+            tag = INSTRUCTION_TAG.match(line)
+            if tag:
+                if tag.group(2) not in tags:
+                    tags.append(tag.group(2))
+                cleaned.append("")
+                continue
+        cleaned.append(line)
+    return cleaned, tags
+
+
+def plain_text(rendered: str) -> str:
+    """Text content of rendered inline HTML."""
+    return html.unescape(TAGS.sub("", rendered)).strip()
+
+
+class MarkdownRenderer:
+    """Renders one document; heading ids are unique within it."""
+
+    def __init__(self):
+        self.outline: List[Dict[str, object]] = []
+        self.slugs: Dict[str, int] = {}
+
+    def render(self, text: str) -> RenderedDocument:
+        lines, tags = strip_instruction_tags(text.expandtabs(4).splitlines())
+        body = "\n".join(block for _, block in self.blocks(lines))
+        return RenderedDocument(html=body, outline=self.outline, instruction_tags=tags)
+
+    # Block level
+
+    def blocks(self, lines: List[str]) -> List[Tuple[str, str]]:
+        """Render lines into (kind, html) blocks."""
+        blocks: List[Tuple[str, str]] = []
+        index = 0
+        while index < len(lines):
+            line = lines[index]
+            if not line.strip():
+                index += 1
+                continue
+
+            fence = FENCE.match(line)
+            if fence:
+                index = self.fenced_code(lines, index, fence, blocks)
+                continue
+
+            heading = HEADING.match(line)
+            if heading:
+                blocks.append(("heading", self.heading(len(heading.group(1)), heading.group(2) or "")))
+                index += 1
+                continue
+
+            if RULE.match(line):
+                blocks.append(("rule", "<hr />"))
+                index += 1
+                continue
+
+            if QUOTE.match(line):
+                quoted = []
+                while index < len(lines) and lines[index].strip():
+                    match = QUOTE.match(lines[index])
+                    quoted.append(match.group(1) if match else lines[index])
+                    index += 1
+                inner = "\n".join(block for _, block in self.blocks(quoted))
+                blocks.append(("quote", f"<blockquote>\n{inner}\n</blockquote>"))
+                continue
+
+            if self.is_table(lines, index):
+                index = self.table(lines, index, blocks)
+                continue
+
+            if LIST_ITEM.match(line):
+                index = self.list_block(lines, index, blocks)
+                continue
+
+            paragraph = [line.strip()]
+            index += 1
+            while index < len(lines) and lines[index].strip() and not self.starts_block(lines, index):
+                paragraph.append(lines[index].strip())
+                index += 1
+            blocks.append(("paragraph", f"<p>{self.inline(chr(10).join(paragraph))}</p>"))
+        return blocks
+
+    def starts_block(self, lines: List[str], index: int) -> bool:
+        """Whether a line interrupts a paragraph."""
+        line = lines[index]
+        return bool(FENCE.match(line) or HEADING.match(line) or RULE.match(line) or QUOTE.match(line)
+                    or LIST_ITEM.match(line) or self.is_table(lines, index))
+
+    def fenced_code(self, lines: List[str], index: int, fence: re.Match, blocks: List[Tuple[str, str]]) -> int:
+        marker = fence.group(1)
+        language = fence.group(2)
+        code = []
+        index += 1
+        while index < len(lines):
+            stripped = lines[index].strip()
+            if stripped.startswith(marker) and not stripped.strip(marker[0]):
+                index += 1
+                break
+            code.append(lines[index])
+            index += 1
+        attribute = f' class="language-{html.escape(language)}"' if language else ""
+        body = html.escape("\n".join(code) + "\n" if code else "", quote=False)
+        blocks.append(("code", f"<pre><code{attribute}>{body}</code></pre>"))
+        return index
+
+    def heading(self, level: int, text: str) -> str:
+        rendered = self.inline(text.strip())
+        title = plain_text(rendered)
+        slug = self.slug(title)
+        self.outline.append({"level": level, "text": title, "id": slug})
+        return f'<h{level} id="{slug}">{rendered}</h{level}>'
+
+    def slug(self, title: str) -> str:
+        """GitHub-style anchor: lower case, punctuation dropped, spaces to hyphens, deduplicated."""
+        base = re.sub(r"[^\w\- ]", "", title.lower()).strip().replace(" ", "-") or "section"
+        count = self.slugs.get(base, 0)
+        self.slugs[base] = count + 1
+        return base if count == 0 else f"{base}-{count}"
+
+    def is_table(self, lines: List[str], index: int) -> bool:
+        return ("|" in lines[index] and index + 1 < len(lines)
+                and "-" in lines[index + 1] and bool(TABLE_DELIMITER.match(lines[index + 1])))
+
+    def table(self, lines: List[str], index: int, blocks: List[Tuple[str, str]]) -> int:
+        header = split_row(lines[index])
+        alignments = [alignment(cell) for cell in split_row(lines[index + 1])]
+        index += 2
+        rows = []
+        while index < len(lines) and lines[index].strip() and "|" in lines[index]:
+            rows.append(split_row(lines[index]))
+            index += 1
+
+        def cells(row: List[str], tag: str) -> str:
+            rendered = []
+            for column in range(len(header)):
+                align = alignments[column] if column < len(alignments) else None
+                style = f' style="text-align: {align}"' if align else ""
+                text = row[column] if column < len(row) else ""
+                rendered.append(f"<{tag}{style}>{self.inline(text)}</{tag}>")
+            return "<tr>" + "".join(rendered) + "</tr>"
+
+        body = "\n".join(cells(row, "td") for row in rows)
+        table = f"<table>\n<thead>\n{cells(header, 'th')}\n</thead>\n"
+        table += f"<tbody>\n{body}\n</tbody>\n</table>" if rows else "</table>"
+        blocks.append(("table", table))
+        return index
+
+    def list_block(self, lines: List[str], index: int, blocks: List[Tuple[str, str]]) -> int:
+        first = LIST_ITEM.match(lines[index])
+        indent = len(first.group(1))
+        ordered = first.group(2)[0].isdigit()
+        items: List[List[str]] = []
+        loose = False
+
+        while index < len(lines):
+            match = LIST_ITEM.match(lines[index])
+            if not match or len(match.group(1)) != indent or match.group(2)[0].isdigit() != ordered:
+                break
+            content_indent = indent + len(match.group(2)) + 1
+            item = [match.group(3) or ""]
+            index += 1
+            while index < len(lines):
+                line = lines[index]
+                if not line.strip():
+                    # A blank line continues the item only if indented content follows
+                    following = next((l for l in lines[index + 1:] if l.strip()), None)
+                    if following is None or len(following) - len(following.lstrip()) < content_indent:
+                        next_item = LIST_ITEM.match(following or "")
+                        # Only a following item of the same list makes it loose
+                        if (next_item and len(next_item.group(1)) == indent
+                                and next_item.group(2)[0].isdigit() == ordered):
+                            loose = True
+                        break
+                    loose = True
+                    item.append("")
+                    index += 1
+                    continue
+                line_indent = len(line) - len(line.lstrip())
+                if line_indent >= content_indent:
+                    item.append(line[content_indent:])
+                elif line_indent <= indent and self.starts_block(lines, index):
+                    break
+                else:
+                    item.append(line.strip())  # Lazy continuation
+                index += 1
+            items.append(item)
+            while index < len(lines) and not lines[index].strip():
+                if index + 1 < len(lines) and LIST_ITEM.match(lines[index + 1]):
+                    index += 1
+                else:
+                    break
+
+        rendered = []
+        for item in items:
+            item_blocks = self.blocks(item)
+            parts = []
+            for kind, block in item_blocks:
+                if kind == "paragraph" and not loose:
+                    block = block[len("<p>"):-len("</p>")]
+                parts.append(block)
+            rendered.append(f"<li>{chr(10).join(parts)}</li>")
+
+        tag = "ol" if ordered else "ul"
+        start = int(first.group(2)[:-1]) if ordered else 1
+        attribute = f' start="{start}"' if start != 1 else ""
+        blocks.append(("list", f"<{tag}{attribute}>\n" + "\n".join(rendered) + f"\n</{tag}>"))
+        return index
+
+    # Inline level
+
+    def inline(self, text: str) -> str:
+        """Render inline markup; code spans are taken literally."""
+        parts = []
+        position = 0
+        for match in CODE_SPAN.finditer(text):
+            parts.append(self.inline_text(text[position:match.start()]))
+            parts.append(f"<code>{html.escape(match.group(2).strip(), quote=False)}</code>")
+            position = match.end()
+        parts.append(self.inline_text(text[position:]))
+        return "".join(parts)
+
+    def inline_text(self, text: str) -> str:
+        text = html.escape(text)
+        text = IMAGE.sub(lambda m: image(m.group(1), m.group(2), m.group(3)) or m.group(0), text)
+        text = LINK.sub(lambda m: link(m.group(1), m.group(2), m.group(3)) or m.group(0), text)
+        text = AUTOLINK.sub(lambda m: link(m.group(1), m.group(1), None) or m.group(0), text)
+        text = STRONG.sub(lambda m: f"<strong>{m.group(1) or m.group(2)}</strong>", text)
+        text = EMPHASIS.sub(lambda m: f"<em>{m.group(1) or m.group(2)}</em>", text)
+        return text
+
+
+def split_row(line: str) -> List[str]:
+    row = line.strip()
+    if row.startswith("|"):
+        row = row[1:]
+    if row.endswith("|") and not row.endswith("\\|"):
+        row = row[:-1]
+    return [cell.strip().replace("\\|", "|") for cell in re.split(r"(?<!\\)\|", row)]
+
+
+def alignment(cell: str) -> Optional[str]:
+    if cell.startswith(":") and cell.endswith(":"):
+        return "center"
+    if cell.endswith(":"):
+        return "right"
+    if cell.startswith(":"):
+        return "left"
+    return None
+
+
+def link(text: str, url: str, title: Optional[str]) -> Optional[str]:
+    # URLs were HTML-escaped with the text; unsafe schemes (javascript:) are left as text
+    if not SAFE_URL.match(html.unescape(url)):
+        return None
+    title_attribute = f' title="{title}"' if title else ""
+    return f'<a href="{url}"{title_attribute}>{text}</a>'
+
+
+def image(alt: str, url: str, title: Optional[str]) -> Optional[str]:
+    if not SAFE_URL.match(html.unescape(url)):
+        return None
+    title_attribute = f' title="{title}"' if title else ""
+    return f'<img src="{url}" alt="{alt}"{title_attribute} />'
+
+
+def render_markdown(text: str) -> RenderedDocument:
+    """Render a markdown body (without frontmatter)."""
+    return MarkdownRenderer().render(text)
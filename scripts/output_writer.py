@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Output Writer
+
+Encodes catalog collections (pretty, minified, columnar, precompressed) and
+writes alternative layouts next to the monolithic public/data/<type>.json
+file, so pages can load only the slice they display.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from build_logging import get_logger
+from catalog_records import to_json_value
+
+try:
+    import brotli
+except ImportError:  # Optional: only needed for .br output
+    brotli = None
+
+
+logger = get_logger("output")
+
+SHARD_MANIFEST_NAME = "manifest.json"
+SHARD_FILE_PATTERN = re.compile(r"^(shard-\d+|category-[a-z0-9-]+)\.json$")
+UNCATEGORIZED_SHARD = "uncategorized"
+COMPRESSION_FORMATS = ("gzip", "brotli")
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "brotli": ".br"}
+
+
+@dataclass
+class ShardingOptions:
+    """Sharded layout settings; shard_size 0 with by_category False disables sharding."""
+    shard_size: int = 0
+    by_category: bool = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.by_category or self.shard_size > 0
+
+
+@dataclass
+class OutputEncoding:
+    """Encoding settings for catalog output files."""
+    minify: bool = False
+    columnar: bool = False
+    compress: List[str] = field(default_factory=list)
+
+    @property
+    def is_default(self) -> bool:
+        return not (self.minify or self.columnar or self.compress)
+
+
+def serialize(data: Any, minify: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON; the pretty form matches json.dump(indent=2)."""
+    if minify:
+        return encode_json(data)
+    return json.dumps(data, indent=2, ensure_ascii=False, default=to_json_value).encode("utf-8")
+
+
+def to_columnar(data: Dict[str, Any], items_key: str) -> Dict[str, Any]:
+    """
+    Convert a collection into a columnar layout.
+
+    Keys are stored once in "columns" and each item becomes a row of values
+    in column order (null where an item lacks a key). Category strings are
+    interned into "categoryTable" and rows hold their integer ids.
+    """
+    items = data.get(items_key, [])
+
+    columns: List[str] = []
+    for item in items:
+        for key in item:
+            if key not in columns:
+                columns.append(key)
+
+    category_table = sorted({
+        category for item in items
+        for category in item.get("categories") or [] if isinstance(category, str)
+    })
+    category_ids = {category: index for index, category in enumerate(category_table)}
+
+    rows = []
+    for item in items:
+        row = []
+        for column in columns:
+            value = item.get(column)
+            if column == "categories" and isinstance(value, list):
+                value = [category_ids[c] if isinstance(c, str) else c for c in value]
+            row.append(value)
+        rows.append(row)
+
+    columnar = {key: value for key, value in data.items() if key != items_key}
+    columnar[items_key] = {"columns": columns, "categoryTable": category_table, "rows": rows}
+    # Keep the items first, as in the row-oriented file
+    return {items_key: columnar.pop(items_key), **columnar}
+
+
+def write_if_changed(output_file: Path, data: bytes) -> bool:
+    """
+    Write bytes unless the file already holds exactly the same content.
+
+    Leaving identical files untouched keeps their mtime, so downstream build
+    caches, git status and CDN ETags see no change.
+
+    Returns:
+        True if the file was written
+    """
+    try:
+        if output_file.stat().st_size == len(data) and output_file.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.write_bytes(data)
+    return True
+
+
+def compress(data: bytes, compression: str) -> Optional[bytes]:
+    """Compress deterministically; returns None when the codec is unavailable."""
+    if compression == "gzip":
+        # mtime=0 keeps the gzip header, and therefore the bytes, reproducible
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if compression == "brotli":
+        if brotli is None:
+            return None
+        return brotli.compress(data, quality=11)
+    raise ValueError(f"Unknown compression format: {compression}")
+
+
+def write_encoded(output_file: Path, data: bytes, compressions: List[str]) -> Dict[str, int]:
+    """
+    Write a file plus its precompressed siblings (e.g. tasks.json.gz).
+
+    Siblings get the same mtime as the file they were derived from, so
+    Last-Modified/ETag headers stay consistent across encodings. Files whose
+    content is unchanged are not rewritten.
+
+    Returns:
+        Encoded size per file name
+    """
+    write_if_changed(output_file, data)
+    sizes = {output_file.name: len(data)}
+
+    stat = output_file.stat()
+    for compression in compressions:
+        compressed = compress(data, compression)
+        if compressed is None:
+            logger.warning(f"⚠ Skipping {compression} for {output_file.name}: install the 'brotli' package")
+            continue
+        sibling = output_file.with_name(output_file.name + COMPRESSION_SUFFIXES[compression])
+        if write_if_changed(sibling, compressed) or sibling.stat().st_mtime_ns != stat.st_mtime_ns:
+            os.utime(sibling, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        sizes[sibling.name] = len(compressed)
+
+    return sizes
+
+
+def format_size(size: int) -> str:
+    """Human-readable byte count."""
+    if size < 1024:
+        return f"{size} B"
+    return f"{size / 1024:.1f} KB"
+
+
+def format_savings(baseline: int, sizes: Dict[str, int]) -> str:
+    """Describe each written size relative to the pretty-printed baseline."""
+    parts = []
+    for name, size in sizes.items():
+        saved = (1 - size / baseline) * 100 if baseline else 0.0
+        parts.append(f"{name} {format_size(size)} (-{saved:.0f}%)")
+    return f"baseline {format_size(baseline)} → " + ", ".join(parts)
+
+
+def encode_json(data: Any) -> bytes:
+    """Encode data as minified UTF-8 JSON."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=to_json_value).encode("utf-8")
+
+
+def content_hash(data: bytes) -> str:
+    """Short content hash used for cache busting and change detection."""
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def slugify(value: str) -> str:
+    """Build a file-name-safe slug from a category name."""
+    return re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-") or UNCATEGORIZED_SHARD
+
+
+def split_fixed(items: List[Dict[str, Any]], shard_size: int) -> List[Tuple[str, Dict[str, Any], List[Dict[str, Any]]]]:
+    """Split items into consecutive shards of at most shard_size items."""
+    shards = []
+    for index, start in enumerate(range(0, len(items), shard_size)):
+        shards.append((f"shard-{index:03d}.json", {}, items[start:start + shard_size]))
+    return shards
+
+
+def split_by_category(items: List[Dict[str, Any]]) -> List[Tuple[str, Dict[str, Any], List[Dict[str, Any]]]]:
+    """
+    Split items into one shard per category.
+
+    Items with several categories appear in each of their shards, matching
+    how the category tabs filter; items without categories share one shard.
+    """
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for item in items:
+        categories = [c for c in item.get("categories") or [] if isinstance(c, str) and c.strip()]
+        for category in categories or [None]:
+            groups.setdefault(category, []).append(item)
+
+    shards = []
+    used_names = set()
+    for category in sorted(groups, key=lambda c: (c is None, c or "")):
+        slug = slugify(category) if category is not None else UNCATEGORIZED_SHARD
+        name = f"category-{slug}.json"
+        suffix = 2
+        while name in used_names:
+            name = f"category-{slug}-{suffix}.json"
+            suffix += 1
+        used_names.add(name)
+        shards.append((name, {"category": category}, groups[category]))
+    return shards
+
+
+def write_sharded_output(output_file: Path, items_key: str, items: List[Dict[str, Any]],
+                         metadata: Dict[str, Any], options: ShardingOptions) -> Path:
+    """
+    Write a manifest plus shards into a directory named after the output file.
+
+    For public/data/tasks.json this produces public/data/tasks/manifest.json
+    and public/data/tasks/shard-000.json, ... (or category-<slug>.json).
+    Shard files left over from a previous layout are removed.
+
+    Returns:
+        Path of the written manifest
+    """
+    shard_dir = output_file.with_suffix("")
+    shard_dir.mkdir(parents=True, exist_ok=True)
+
+    if options.by_category:
+        shards = split_by_category(items)
+    else:
+        shards = split_fixed(items, options.shard_size)
+
+    manifest_shards = []
+    written = set()
+    for name, extra, shard_items in shards:
+        encoded = encode_json({items_key: shard_items})
+        write_if_changed(shard_dir / name, encoded)
+        written.add(name)
+        manifest_shards.append({
+            "file": name,
+            **extra,
+            "count": len(shard_items),
+            "bytes": len(encoded),
+            "hash": content_hash(encoded),
+        })
+
+    for stale in shard_dir.iterdir():
+        if SHARD_FILE_PATTERN.match(stale.name) and stale.name not in written:
+            stale.unlink()
+
+    manifest = {
+        "collection": items_key,
+        "total": len(items),
+        "shardBy": "category" if options.by_category else "size",
+        "shardSize": None if options.by_category else options.shard_size,
+        "categories": metadata.get("categories", []),
+        "shards": manifest_shards,
+        "metadata": metadata,
+    }
+    manifest_file = shard_dir / SHARD_MANIFEST_NAME
+    write_if_changed(manifest_file, encode_json(manifest))
+    return manifest_file
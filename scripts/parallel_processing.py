@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Parallel Processing
+
+Fans BaseContentProcessor.process_file out across worker processes while
+returning results in submission order, so merged output and diagnostics are
+identical to a sequential run.
+"""
+
+import importlib.util
+import os
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Processor instance owned by the current worker process
+_worker_processor = None
+
+
+def _init_worker(module_name: str, module_file: Optional[str], payload: bytes) -> None:
+    """
+    Rebuild the processor inside a worker process.
+
+    Processors live in hyphenated entry point scripts that may have been loaded
+    by path (see catalog_builder.load_processor), so the defining module is
+    imported by file before the pickled processor is restored.
+    """
+    global _worker_processor
+
+    if module_name not in sys.modules and module_file:
+        spec = importlib.util.spec_from_file_location(module_name, module_file)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+
+    _worker_processor = pickle.loads(payload)
+
+
+def _process_in_worker(task: Tuple[Path, Optional[Dict[str, Any]]]):
+    """Process one file with the worker's processor."""
+    file_path, existing_item = task
+    return _worker_processor.process_source_file(file_path, existing_item)
+
+
+def resolve_jobs(jobs: int) -> int:
+    """Resolve a --jobs value; 0 means one worker per available CPU."""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def process_in_pool(processor, tasks: List[Tuple[Path, Optional[Dict[str, Any]]]], jobs: int) -> Iterable:
+    """
+    Process files on a pool of worker processes.
+
+    Args:
+        processor: Configured BaseContentProcessor to replicate in each worker
+        tasks: (file_path, existing_item) pairs in processing order
+        jobs: Number of worker processes
+
+    Returns:
+        FileResult objects in the same order as tasks
+    """
+    module_name = type(processor).__module__
+    module = sys.modules.get(module_name)
+    module_file = getattr(module, "__file__", None)
+    payload = pickle.dumps(processor)
+
+    # A few chunks per worker keeps IPC overhead low while balancing uneven files
+    chunksize = max(1, len(tasks) // (jobs * 4))
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(module_name, module_file, payload),
+    ) as executor:
+        return list(executor.map(_process_in_worker, tasks, chunksize=chunksize))
@@ -4,6 +4,7 @@ Process KubeRocketAI agent YAML files into JSON format for Next.js consumption.
 Refactored to use base processor following DRY and SOLID principles.
 """
 
+import re
 import sys
 from pathlib import Path
 from typing import Dict, Any, List
@@ -11,7 +12,12 @@ from typing import Dict, Any, List
 # Add the scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from base_processor import YAMLBasedProcessor, ProcessingError
+from base_processor import YAMLBasedProcessor, ProcessingError, run_cli
+from catalog_records import AgentRecord
+
+
+# Commands name the task they run, e.g. "... by executing task create-pitch-deck"
+TASK_COMMAND_PATTERN = re.compile(r"executing task ([\w-]+(?:[./][\w-]+)*)")
 
 
 class AgentProcessor(YAMLBasedProcessor):
@@ -26,6 +32,8 @@ class AgentProcessor(YAMLBasedProcessor):
     - Dependency Inversion: Depends on base abstractions
     """
     
+    record_type = AgentRecord
+    
     def __init__(self):
         """Initialize agent processor."""
         super().__init__(content_type="agents", source_extensions=[".yaml", ".yml"])
@@ -33,7 +41,7 @@ class AgentProcessor(YAMLBasedProcessor):
     def find_source_directory(self, project_root: Path = None) -> Path:
         """Find the agents source directory."""
         if project_root is None:
-            project_root = Path.cwd()
+            project_root = self.source.root
         
         # Search for agents directory in common locations
         search_paths = [
@@ -43,12 +51,12 @@ class AgentProcessor(YAMLBasedProcessor):
         ]
         
         for path in search_paths:
-            if path.exists() and path.is_dir():
+            if self.source.is_dir(path):
                 return path
         
         raise ProcessingError(f"Could not find agents directory in: {search_paths}")
     
-    def process_file(self, file_path: Path, existing_data: Dict[str, Any] = None) -> Dict[str, Any]:
+    def process_file(self, file_path: Path, existing_data: Dict[str, Any] = None) -> AgentRecord:
         """Process a single agent YAML file."""
         agent_yaml = self.load_yaml_file(file_path)
         
@@ -58,9 +66,23 @@ class AgentProcessor(YAMLBasedProcessor):
         agent_data = agent_yaml["agent"]
         filename = file_path.stem
         
+        if self.collect_references:
+            self.collect_task_references(agent_data)
+        
         return self.extract_agent_persona(agent_data, existing_data, filename)
     
-    def extract_agent_persona(self, agent_data: Dict[str, Any], existing_agent: Dict[str, Any] = None, filename: str = "") -> Dict[str, Any]:
+    def collect_task_references(self, agent_data: Dict[str, Any]) -> None:
+        """Record the tasks an agent lists or executes from its commands."""
+        for task in self.safe_list(agent_data.get("tasks", [])):
+            self.add_reference("tasks", task)
+        
+        commands = agent_data.get("commands", {})
+        if isinstance(commands, dict):
+            for description in commands.values():
+                for task in TASK_COMMAND_PATTERN.findall(str(description)):
+                    self.add_reference("tasks", task)
+    
+    def extract_agent_persona(self, agent_data: Dict[str, Any], existing_agent: Dict[str, Any] = None, filename: str = "") -> AgentRecord:
         """Extract key persona information from agent YAML structure."""
         identity = agent_data.get("identity", {})
         commands = agent_data.get("commands", {})
@@ -85,22 +107,22 @@ class AgentProcessor(YAMLBasedProcessor):
         # Generate ID if not present
         agent_id = identity.get("id") or self.generate_id(identity.get("name", filename))
         
-        return {
-            "id": agent_id,
-            "filename": filename,
-            "name": self.safe_string(identity.get("name"), filename.replace("-", " ").title()),
-            "role": self.safe_string(identity.get("role"), "AI Assistant"),
-            "description": self.safe_string(identity.get("description")),
-            "goal": self.safe_string(identity.get("goal")),
-            "icon": self.safe_string(identity.get("icon"), "🤖"),
-            "categories": self.category_manager.normalize_categories(categories),
-            "scope": scope,
-            "whenToUse": when_to_use,
-            "commandCount": self.count_commands(commands),
-            "taskCount": len(self.safe_list(tasks)),
-            "commands": self.filter_commands(commands),
-            "version": self.safe_string(identity.get("version"), "1.0.0"),
-        }
+        return AgentRecord(
+            id=agent_id,
+            filename=filename,
+            name=self.safe_string(identity.get("name"), filename.replace("-", " ").title()),
+            role=self.safe_string(identity.get("role"), "AI Assistant"),
+            description=self.safe_string(identity.get("description")),
+            goal=self.safe_string(identity.get("goal")),
+            icon=self.safe_string(identity.get("icon"), "🤖"),
+            categories=self.category_manager.normalize_categories(categories),
+            scope=scope,
+            whenToUse=when_to_use,
+            commandCount=self.count_commands(commands),
+            taskCount=len(self.safe_list(tasks)),
+            commands=self.filter_commands(commands),
+            version=self.safe_string(identity.get("version"), "1.0.0"),
+        )
     
     def extract_scope_from_principles(self, principles: List[str]) -> str:
         """Extract scope from principles list."""
@@ -157,4 +179,4 @@ if __name__ == "__main__":
     output_file = Path("./public/data/agents.json")
     
     processor = AgentProcessor()
-    processor.process_all(output_file)
+    run_cli(processor, output_file)
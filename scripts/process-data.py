@@ -11,7 +11,8 @@ from typing import Dict, Any, List
 # Add the scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from base_processor import FileBasedProcessor, ProcessingError
+from base_processor import FileBasedProcessor, ProcessingError, run_cli
+from catalog_records import DataRecord
 
 
 class DataProcessor(FileBasedProcessor):
@@ -26,6 +27,9 @@ class DataProcessor(FileBasedProcessor):
     - Dependency Inversion: Depends on base abstractions
     """
     
+    record_type = DataRecord
+    path_prefix = ".krci-ai/data"
+    
     def __init__(self):
         """Initialize data processor."""
         super().__init__(content_type="dataFiles", source_extensions=[".md", ".yaml", ".yml"])
@@ -33,7 +37,7 @@ class DataProcessor(FileBasedProcessor):
     def find_source_directory(self, project_root: Path = None) -> Path:
         """Find the data source directory."""
         if project_root is None:
-            project_root = Path.cwd()
+            project_root = self.source.root
         
         # Search for data directory in common locations
         search_paths = [
@@ -43,24 +47,24 @@ class DataProcessor(FileBasedProcessor):
         ]
         
         for path in search_paths:
-            if path.exists() and path.is_dir():
+            if self.source.is_dir(path):
                 return path
         
         raise ProcessingError(f"Could not find data directory in: {search_paths}")
     
-    def process_file(self, file_path: Path, existing_data: Dict[str, Any] = None) -> Dict[str, Any]:
+    def process_file(self, file_path: Path, existing_data: Dict[str, Any] = None) -> DataRecord:
         """Process a single data file."""
         data_id = file_path.stem
         
         # Calculate relative path with proper prefix
-        path = self.calculate_relative_path(file_path, self.find_source_directory(), ".krci-ai/data")
+        path = self.relative_source_path(file_path, self.path_prefix)
         
         if existing_data:
             return self.create_data_from_existing(data_id, path, existing_data, file_path)
         else:
             return self.create_new_data_entry(data_id, path, file_path)
     
-    def create_new_data_entry(self, data_id: str, path: str, file_path: Path) -> Dict[str, Any]:
+    def create_new_data_entry(self, data_id: str, path: str, file_path: Path) -> DataRecord:
         """Create a new data entry with auto-generated values."""
         # Generate user-friendly name from filename
         name = data_id.replace('-', ' ').replace('_', ' ').title()
@@ -73,15 +77,15 @@ class DataProcessor(FileBasedProcessor):
         # Assign default categories based on data file patterns
         categories = self.infer_categories_from_name(data_id)
         
-        return {
-            "id": data_id,
-            "name": name,
-            "description": description,
-            "categories": self.category_manager.normalize_categories(categories),
-            "path": path
-        }
+        return DataRecord(
+            id=data_id,
+            name=name,
+            description=description,
+            categories=self.category_manager.normalize_categories(categories),
+            path=path
+        )
     
-    def create_data_from_existing(self, data_id: str, path: str, existing_data: Dict[str, Any], file_path: Path) -> Dict[str, Any]:
+    def create_data_from_existing(self, data_id: str, path: str, existing_data: Dict[str, Any], file_path: Path) -> DataRecord:
         """Create data entry from existing data with validation and fallbacks."""
         name = existing_data.get("name", "").strip()
         description = existing_data.get("description", "").strip()
@@ -103,13 +107,13 @@ class DataProcessor(FileBasedProcessor):
             categories = self.infer_categories_from_name(data_id)
             self.warnings.append(f"{data_id}: Auto-assigned categories {categories} - please verify")
         
-        return {
-            "id": data_id,
-            "name": name,
-            "description": description,
-            "categories": self.category_manager.normalize_categories(categories),
-            "path": path
-        }
+        return DataRecord(
+            id=data_id,
+            name=name,
+            description=description,
+            categories=self.category_manager.normalize_categories(categories),
+            path=path
+        )
     
     def infer_categories_from_name(self, data_id: str) -> List[str]:
         """Infer likely categories based on data file name patterns."""
@@ -144,23 +148,6 @@ class DataProcessor(FileBasedProcessor):
         """Get required fields for data file validation."""
         return ["id", "name", "description", "categories", "path"]
     
-    def validate_item(self, item: Dict[str, Any], file_path: Path) -> bool:
-        """Enhanced validation for data file items."""
-        # First run base validation
-        if not super().validate_item(item, file_path):
-            return False
-        
-        # Data-specific validation
-        if not item.get("path"):
-            self.errors.append(f"{file_path.name}: Missing path field")
-            return False
-        
-        # Ensure path starts with .krci-ai/data
-        if not item.get("path", "").startswith(".krci-ai/data"):
-            self.warnings.append(f"{file_path.name}: Path should start with '.krci-ai/data'")
-        
-        return True
-    
     def get_items_key(self) -> str:
         """Override to return the correct key for data files."""
         return "dataFiles"
@@ -171,4 +158,4 @@ if __name__ == "__main__":
     output_file = Path("./public/data/data.json")
     
     processor = DataProcessor()
-    processor.process_all(output_file)
+    run_cli(processor, output_file)
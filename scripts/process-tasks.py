@@ -13,7 +13,8 @@ from typing import Dict, Any, List
 # Ensure local imports work when run from project root
 sys.path.insert(0, str(Path(__file__).parent))
 
-from base_processor import FileBasedProcessor, ProcessingError
+from base_processor import FileBasedProcessor, ProcessingError, run_cli
+from catalog_records import TaskRecord
 
 
 class TaskProcessor(FileBasedProcessor):
@@ -27,13 +28,16 @@ class TaskProcessor(FileBasedProcessor):
     - Do not infer categories; only normalize if present
     """
 
+    record_type = TaskRecord
+    path_prefix = ".krci-ai/tasks"
+
     def __init__(self):
         super().__init__(content_type="tasks", source_extensions=[".md", ".yaml", ".yml", ".json"])
 
     def find_source_directory(self, project_root: Path = None) -> Path:
         """Find the tasks source directory."""
         if project_root is None:
-            project_root = Path.cwd()
+            project_root = self.source.root
 
         search_paths = [
             project_root / "krci-input" / ".krci-ai" / "tasks",
@@ -42,17 +46,21 @@ class TaskProcessor(FileBasedProcessor):
         ]
 
         for path in search_paths:
-            if path.exists() and path.is_dir():
+            if self.source.is_dir(path):
                 return path
 
         raise ProcessingError(f"Could not find tasks directory in: {search_paths}")
 
-    def process_file(self, file_path: Path, existing_data: Dict[str, Any] = None) -> Dict[str, Any]:
+    def process_file(self, file_path: Path, existing_data: Dict[str, Any] = None) -> TaskRecord:
         """Process a single task file."""
         task_id = file_path.stem
 
         # Calculate relative path with proper prefix
-        path = self.calculate_relative_path(file_path, self.find_source_directory(), ".krci-ai/tasks")
+        path = self.relative_source_path(file_path, self.path_prefix)
+
+        # Record frontmatter dependencies for the catalog dependency graph
+        if self.collect_references:
+            self.collect_dependencies(file_path)
 
         if existing_data:
             return self._create_task_from_existing(task_id, path, existing_data, file_path)
@@ -62,7 +70,7 @@ class TaskProcessor(FileBasedProcessor):
     def _humanize(self, value: str) -> str:
         return value.replace('-', ' ').replace('_', ' ').title()
 
-    def _create_new_task_entry(self, task_id: str, path: str, file_path: Path) -> Dict[str, Any]:
+    def _create_new_task_entry(self, task_id: str, path: str, file_path: Path) -> TaskRecord:
         """Create a new task entry with minimal safe defaults."""
         name = self._humanize(task_id)
 
@@ -72,17 +80,17 @@ class TaskProcessor(FileBasedProcessor):
         # Do NOT auto-infer categories for tasks; start empty and allow manual curation later
         categories: List[str] = []
 
-        return {
-            "id": task_id,
-            "name": name,
-            "description": description,
-            "categories": categories,
-            "path": path,
-        }
+        return TaskRecord(
+            id=task_id,
+            name=name,
+            description=description,
+            categories=categories,
+            path=path,
+        )
 
     def _create_task_from_existing(
         self, task_id: str, path: str, existing_data: Dict[str, Any], file_path: Path
-    ) -> Dict[str, Any]:
+    ) -> TaskRecord:
         """Create task entry from existing data with validation and conservative fallbacks."""
         name = (existing_data.get("name") or "").strip() or self._humanize(task_id)
         description = (existing_data.get("description") or "").strip()
@@ -92,13 +100,13 @@ class TaskProcessor(FileBasedProcessor):
         raw_categories = existing_data.get("categories", [])
         categories = self.category_manager.normalize_categories(raw_categories)
 
-        return {
-            "id": task_id,
-            "name": name,
-            "description": description,
-            "categories": categories,
-            "path": path,
-        }
+        return TaskRecord(
+            id=task_id,
+            name=name,
+            description=description,
+            categories=categories,
+            path=path,
+        )
 
     def get_output_structure(self, items: List[Dict[str, Any]]) -> Dict[str, Any]:
         return {
@@ -109,23 +117,9 @@ class TaskProcessor(FileBasedProcessor):
     def get_required_fields(self) -> List[str]:
         return ["id", "name", "description", "path"]
 
-    def validate_item(self, item: Dict[str, Any], file_path: Path) -> bool:
-        if not super().validate_item(item, file_path):
-            return False
-
-        if not item.get("path"):
-            self.errors.append(f"{file_path.name}: Missing path field")
-            return False
-
-        if not item.get("path", "").startswith(".krci-ai/tasks"):
-            # Non-fatal, but encourage consistency
-            self.warnings.append(f"{file_path.name}: Path should start with '.krci-ai/tasks'")
-
-        return True
-
 
 if __name__ == "__main__":
     output_file = Path("./public/data/tasks.json")
 
     processor = TaskProcessor()
-    processor.process_all(output_file)
+    run_cli(processor, output_file)
@@ -11,7 +11,8 @@ from typing import Dict, Any, List
 # Add the scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from base_processor import FileBasedProcessor, ProcessingError
+from base_processor import FileBasedProcessor, ProcessingError, run_cli
+from catalog_records import TemplateRecord
 
 
 class TemplateProcessor(FileBasedProcessor):
@@ -26,6 +27,9 @@ class TemplateProcessor(FileBasedProcessor):
     - Dependency Inversion: Depends on base abstractions
     """
     
+    record_type = TemplateRecord
+    path_prefix = ".krci-ai/templates"
+    
     def __init__(self):
         """Initialize template processor."""
         super().__init__(content_type="templates", source_extensions=[".md", ".yaml", ".yml", ".json"])
@@ -33,7 +37,7 @@ class TemplateProcessor(FileBasedProcessor):
     def find_source_directory(self, project_root: Path = None) -> Path:
         """Find the templates source directory."""
         if project_root is None:
-            project_root = Path.cwd()
+            project_root = self.source.root
         
         # Search for templates directory in common locations
         search_paths = [
@@ -43,17 +47,17 @@ class TemplateProcessor(FileBasedProcessor):
         ]
         
         for path in search_paths:
-            if path.exists() and path.is_dir():
+            if self.source.is_dir(path):
                 return path
         
         raise ProcessingError(f"Could not find templates directory in: {search_paths}")
     
-    def process_file(self, file_path: Path, existing_data: Dict[str, Any] = None) -> Dict[str, Any]:
+    def process_file(self, file_path: Path, existing_data: Dict[str, Any] = None) -> TemplateRecord:
         """Process a single template file."""
         template_id = file_path.stem
         
         # Calculate relative path with proper prefix
-        path = self.calculate_relative_path(file_path, self.find_source_directory(), ".krci-ai/templates")
+        path = self.relative_source_path(file_path, self.path_prefix)
         
         # For templates, we require existing data for name, description, and categories
         # as these can't be reliably extracted from file content
@@ -63,7 +67,7 @@ class TemplateProcessor(FileBasedProcessor):
         
         return self.create_template_from_existing(template_id, path, existing_data)
     
-    def create_new_template_entry(self, template_id: str, path: str, file_path: Path) -> Dict[str, Any]:
+    def create_new_template_entry(self, template_id: str, path: str, file_path: Path) -> TemplateRecord:
         """Create a new template entry with auto-generated values."""
         # Generate user-friendly name from filename
         name = template_id.replace('-', ' ').replace('_', ' ').title()
@@ -76,15 +80,15 @@ class TemplateProcessor(FileBasedProcessor):
         # Assign default categories based on common template patterns
         categories = self.infer_categories_from_name(template_id)
         
-        return {
-            "id": template_id,
-            "path": path,
-            "name": name,
-            "description": description,
-            "categories": self.category_manager.normalize_categories(categories)
-        }
+        return TemplateRecord(
+            id=template_id,
+            path=path,
+            name=name,
+            description=description,
+            categories=self.category_manager.normalize_categories(categories)
+        )
     
-    def create_template_from_existing(self, template_id: str, path: str, existing_data: Dict[str, Any]) -> Dict[str, Any]:
+    def create_template_from_existing(self, template_id: str, path: str, existing_data: Dict[str, Any]) -> TemplateRecord:
         """Create template entry from existing data with validation."""
         name = existing_data.get("name", "").strip()
         description = existing_data.get("description", "").strip()
@@ -103,13 +107,13 @@ class TemplateProcessor(FileBasedProcessor):
             categories = self.infer_categories_from_name(template_id)
             self.warnings.append(f"{template_id}: Auto-assigned categories {categories} - please verify")
         
-        return {
-            "id": template_id,
-            "path": path,
-            "name": name,
-            "description": description,
-            "categories": self.category_manager.normalize_categories(categories)
-        }
+        return TemplateRecord(
+            id=template_id,
+            path=path,
+            name=name,
+            description=description,
+            categories=self.category_manager.normalize_categories(categories)
+        )
     
     def infer_categories_from_name(self, template_id: str) -> List[str]:
         """Infer likely categories based on template name patterns."""
@@ -141,23 +145,6 @@ class TemplateProcessor(FileBasedProcessor):
     def get_required_fields(self) -> List[str]:
         """Get required fields for template validation."""
         return ["id", "path", "name", "description", "categories"]
-    
-    def validate_item(self, item: Dict[str, Any], file_path: Path) -> bool:
-        """Enhanced validation for template items."""
-        # First run base validation
-        if not super().validate_item(item, file_path):
-            return False
-        
-        # Template-specific validation
-        if not item.get("path"):
-            self.errors.append(f"{file_path.name}: Missing path field")
-            return False
-        
-        # Ensure path starts with .krci-ai/templates
-        if not item.get("path", "").startswith(".krci-ai/templates"):
-            self.warnings.append(f"{file_path.name}: Path should start with '.krci-ai/templates'")
-        
-        return True
 
 
 if __name__ == "__main__":
@@ -165,4 +152,4 @@ if __name__ == "__main__":
     output_file = Path("./public/data/templates.json")
     
     processor = TemplateProcessor()
-    processor.process_all(output_file)
+    run_cli(processor, output_file)
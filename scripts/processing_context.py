@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Processing Context
+
+Per-run state resolved once by BaseContentProcessor.run() and shared by every
+processing hook (and shipped to worker processes with the processor), so
+hooks never re-resolve directories or recompute path prefixes per file.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+@dataclass
+class ProcessingContext:
+    """Resolved locations for one processing run."""
+    content_type: str
+    source_root: Path
+    project_root: Path
+    output_file: Path
+    # (directory, prefix) -> catalog path prefix for files in that directory
+    directory_prefixes: Dict[Tuple[Path, Optional[str]], str] = field(default_factory=dict, repr=False)
+
+    def relative_path(self, file_path: Path, prefix: str = None) -> str:
+        """
+        Catalog path of a source file, e.g. '.krci-ai/tasks/sub/name.md'.
+
+        Same result as BaseContentProcessor.calculate_relative_path against
+        the source root, with the per-directory part computed only once.
+        """
+        key = (file_path.parent, prefix)
+        directory = self.directory_prefixes.get(key)
+        if directory is None:
+            try:
+                relative = file_path.parent.relative_to(self.source_root)
+                parts = [prefix] if prefix else []
+                if relative.parts:
+                    parts.append(str(relative))
+            except ValueError:
+                # Fallback if file is not under the source root: file name only
+                parts = [prefix] if prefix else []
+            directory = "/".join(parts)
+            self.directory_prefixes[key] = directory
+
+        return f"{directory}/{file_path.name}" if directory else file_path.name
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Run Profiling
+
+Structured instrumentation for processor runs: wall and CPU time per phase,
+per-file processing times (including files processed in worker processes),
+bytes read, YAML parse time and output bytes. Reports are printed as a
+summary and written as a JSON trace, optionally with a Chrome trace
+(chrome://tracing, Perfetto) and a cProfile dump of the main process.
+"""
+
+import cProfile
+import json
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from build_logging import get_logger
+from output_writer import format_size
+
+
+logger = get_logger("profile")
+
+PROFILE_VERSION = 1
+DEFAULT_PROFILE_DIR = Path(".krci-profile")
+DEFAULT_SLOWEST_FILES = 10
+
+# Per-file stats recorded by BaseContentProcessor.process_source_file
+FILE_TIME_KEYS = ("time.process", "time.yaml", "cpu.file")
+TRACE_KEYS = ("trace.start", "trace.pid")
+
+
+@dataclass
+class ProfileOptions:
+    """Profiling settings; nothing is reported unless enabled."""
+    enabled: bool = False
+    directory: Path = DEFAULT_PROFILE_DIR
+    chrome_trace: bool = False
+    cprofile: bool = False
+    slowest: int = DEFAULT_SLOWEST_FILES
+
+
+class RunProfiler:
+    """
+    Collects timings for one processor run.
+
+    Phases are timed in the main process with perf_counter (wall) and
+    process_time (CPU). Per-file times come from the FileResult stats, so
+    they include work done in pool workers; cache hits have no file timing.
+    """
+
+    def __init__(self, content_type: str, options: ProfileOptions = None):
+        self.content_type = content_type
+        self.options = options or ProfileOptions()
+        self.origin = time.perf_counter()
+        self.phases: List[Dict[str, Any]] = []
+        self.counters: Dict[str, float] = {}
+        self.files: List[Tuple[str, Dict[str, float]]] = []
+        self.cprofile: Optional[cProfile.Profile] = None
+        if self.options.enabled and self.options.cprofile:
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a block as a named phase."""
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            self.phases.append({
+                "name": name,
+                "start": wall_start - self.origin,
+                "wall": time.perf_counter() - wall_start,
+                "cpu": time.process_time() - cpu_start,
+            })
+
+    @property
+    def enabled(self) -> bool:
+        return self.options.enabled
+
+    def count(self, key: str, amount: float = 1) -> None:
+        self.counters[key] = self.counters.get(key, 0) + amount
+
+    def add_file(self, file_path: Path, stats: Dict[str, float]) -> None:
+        """Record the per-file stats of a processed (not cached) file; only when profiling."""
+        if stats and self.enabled:
+            self.files.append((str(file_path), stats))
+
+    def totals(self) -> Dict[str, float]:
+        totals: Dict[str, float] = {}
+        for _, stats in self.files:
+            for key, value in stats.items():
+                if key not in TRACE_KEYS:
+                    totals[key] = totals.get(key, 0) + value
+        return totals
+
+    def slowest_files(self) -> List[Dict[str, Any]]:
+        ranked = sorted(self.files, key=lambda entry: entry[1].get("time.process", 0), reverse=True)
+        return [
+            {"file": path, **{key: stats.get(key, 0) for key in FILE_TIME_KEYS},
+             "bytesRead": stats.get("io.bytes_read", 0)}
+            for path, stats in ranked[:self.options.slowest]
+        ]
+
+    def report(self) -> Dict[str, Any]:
+        totals = self.totals()
+        return {
+            "version": PROFILE_VERSION,
+            "contentType": self.content_type,
+            "pid": os.getpid(),
+            "phases": [
+                {key: round(value, 6) if isinstance(value, float) else value for key, value in phase.items()}
+                for phase in self.phases
+            ],
+            "files": {
+                "processed": len(self.files),
+                "processSeconds": round(totals.get("time.process", 0), 6),
+                "yamlSeconds": round(totals.get("time.yaml", 0), 6),
+                "cpuSeconds": round(totals.get("cpu.file", 0), 6),
+                "bytesRead": int(totals.get("io.bytes_read", 0)),
+                "yamlDocuments": int(totals.get("yaml.documents", 0)),
+                "yamlFrontmatter": int(totals.get("yaml.frontmatter", 0)),
+            },
+            "outputBytes": int(self.counters.get("output.bytes", 0)),
+            "counters": self.counters,
+            "slowest": self.slowest_files(),
+        }
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Trace Event Format: one track for phases, one per worker process."""
+        pid = os.getpid()
+        events = [
+            {"name": phase["name"], "cat": "phase", "ph": "X", "pid": pid, "tid": 0,
+             "ts": phase["start"] * 1e6, "dur": phase["wall"] * 1e6}
+            for phase in self.phases
+        ]
+        for path, stats in self.files:
+            if "trace.start" not in stats:
+                continue
+            events.append({
+                "name": Path(path).name, "cat": "file", "ph": "X", "pid": pid,
+                "tid": int(stats.get("trace.pid", pid)),
+                "ts": (stats["trace.start"] - self.origin) * 1e6,
+                "dur": stats.get("time.process", 0) * 1e6,
+                "args": {"file": path, "bytesRead": stats.get("io.bytes_read", 0)},
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def print_report(self) -> None:
+        report = self.report()
+        logger.info(f"\n⏱ Profile ({self.content_type}):")
+        for phase in report["phases"]:
+            logger.info(f"  {phase['name']:<14} wall {phase['wall'] * 1000:9.1f}ms  cpu {phase['cpu'] * 1000:9.1f}ms")
+
+        files = report["files"]
+        logger.info(f"  files: {files['processed']} processed in {files['processSeconds'] * 1000:.1f}ms "
+                    f"(YAML {files['yamlSeconds'] * 1000:.1f}ms), "
+                    f"{format_size(files['bytesRead'])} read, {format_size(report['outputBytes'])} written")
+
+        if report["slowest"]:
+            logger.info(f"  slowest {len(report['slowest'])} files:")
+            for entry in report["slowest"]:
+                logger.info(f"    {entry['time.process'] * 1000:8.2f}ms  {entry['file']}")
+
+    def finish(self) -> List[Path]:
+        """
+        Stop profiling, print the summary and write the requested files.
+
+        Returns:
+            Paths of the files written
+        """
+        if self.cprofile is not None:
+            self.cprofile.disable()
+
+        self.print_report()
+        directory = self.options.directory
+        directory.mkdir(parents=True, exist_ok=True)
+        stem = self.content_type.lower()
+
+        written = [directory / f"{stem}.profile.json"]
+        written[0].write_text(json.dumps(self.report(), indent=2) + "\n", encoding="utf-8")
+
+        if self.options.chrome_trace:
+            written.append(directory / f"{stem}.trace.json")
+            written[-1].write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+
+        if self.cprofile is not None:
+            written.append(directory / f"{stem}.prof")
+            self.cprofile.dump_stats(str(written[-1]))
+
+        logger.info(f"  wrote {', '.join(str(path) for path in written)}")
+        return written
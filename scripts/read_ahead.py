@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Read-Ahead
+
+Prefetches source file bytes on a small thread pool while the processor
+parses earlier files, so file-system latency (e.g. on network mounts) overlaps
+with parsing instead of stalling every file open. Files are handed out in
+discovery order; the number of reads in flight and the bytes held in memory
+are both bounded.
+
+Off by default: read-ahead loads whole files, while most processors only read
+frontmatter or a few body lines, so it only pays off where file-system latency
+dominates.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, Optional, Tuple
+
+from content_source import SourceError
+
+DEFAULT_PREFETCH_DEPTH = 0
+DEFAULT_PREFETCH_MB = 64
+# Reads are I/O bound; a few threads saturate most file systems
+MAX_READ_THREADS = 8
+
+
+@dataclass
+class ReadAheadOptions:
+    """Read-ahead settings; a depth of 0 disables it."""
+    depth: int = DEFAULT_PREFETCH_DEPTH
+    max_bytes: int = DEFAULT_PREFETCH_MB * 1024 * 1024
+
+    @property
+    def enabled(self) -> bool:
+        return self.depth > 0
+
+
+@dataclass
+class ReadAheadStats:
+    """How much was prefetched and how long the consumer waited for it."""
+    files: int = 0
+    bytes: int = 0
+    # Files whose bytes were ready when requested, and those that had to be waited for
+    ready: int = 0
+    waited: int = 0
+    wait_seconds: float = 0.0
+    # Most bytes held at once (read but not yet taken)
+    peak_bytes: int = 0
+    # Reads that failed; the processor opens those files itself and reports the error
+    failed: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"files": self.files, "bytes": self.bytes, "ready": self.ready, "waited": self.waited,
+                "waitSeconds": round(self.wait_seconds, 6), "peakBytes": self.peak_bytes,
+                "failed": self.failed}
+
+
+class ReadAhead:
+    """
+    Bounded, ordered prefetch of file contents.
+
+    At most `depth` reads are queued or in flight, and no new read starts
+    while the bytes already read but not taken, plus the expected size of
+    the reads in flight (the average file size so far), would exceed
+    `max_bytes`. One read is always allowed, so a single large file still
+    makes progress.
+
+    Files are read with `reader` (e.g. ContentSource.read_bytes for archive
+    or git sources); the default reads them from disk.
+
+    Usage:
+        with ReadAhead(files, options) as read_ahead:
+            for file_path in files:
+                data = read_ahead.take(file_path)  # None: read it yourself
+    """
+
+    def __init__(self, files: Iterable[Path], options: ReadAheadOptions = None,
+                 reader: Callable[[Path], bytes] = Path.read_bytes):
+        self.options = options or ReadAheadOptions()
+        self.reader = reader
+        self.files = iter(files)
+        self.pending: Deque[Tuple[Path, Future]] = deque()
+        # Reads finished but not taken, the bytes they hold, and totals of all finished reads
+        self.buffered_files = 0
+        self.buffered_bytes = 0
+        self.reads = 0
+        self.read_bytes = 0
+        self.lock = threading.Lock()
+        self.stats = ReadAheadStats()
+        self.executor: Optional[ThreadPoolExecutor] = None
+
+    def __enter__(self) -> "ReadAhead":
+        if self.options.enabled:
+            threads = min(self.options.depth, MAX_READ_THREADS)
+            self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="read-ahead")
+            self.fill()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def read(self, file_path: Path) -> Optional[bytes]:
+        """Read one file on a pool thread; errors are left to the consumer."""
+        try:
+            data = self.reader(file_path)
+        except (OSError, SourceError):
+            data = None
+        size = len(data) if data is not None else 0
+        with self.lock:
+            self.buffered_files += 1
+            self.buffered_bytes += size
+            self.reads += 1
+            self.read_bytes += size
+            self.stats.peak_bytes = max(self.stats.peak_bytes, self.buffered_bytes)
+        return data
+
+    def expected_bytes(self) -> float:
+        """Bytes held once every pending read has finished, estimated."""
+        with self.lock:
+            in_flight = len(self.pending) - self.buffered_files
+            average = self.read_bytes / self.reads if self.reads else 0
+            return self.buffered_bytes + in_flight * average
+
+    def fill(self) -> None:
+        """Start reads up to the depth and memory limits."""
+        while len(self.pending) < self.options.depth:
+            if self.pending and self.expected_bytes() >= self.options.max_bytes:
+                return
+            file_path = next(self.files, None)
+            if file_path is None:
+                return
+            self.pending.append((file_path, self.executor.submit(self.read, file_path)))
+
+    def take(self, file_path: Path) -> Optional[bytes]:
+        """
+        Get the prefetched bytes of the next file.
+
+        Returns:
+            The file content, or None if the read failed or the file is not
+            the next one in order
+        """
+        if not self.pending or self.pending[0][0] != file_path:
+            return None
+
+        _, future = self.pending.popleft()
+        if future.done():
+            self.stats.ready += 1
+        else:
+            started = time.perf_counter()
+            future.result()
+            self.stats.wait_seconds += time.perf_counter() - started
+            self.stats.waited += 1
+
+        data = future.result()
+        with self.lock:
+            self.buffered_files -= 1
+            self.buffered_bytes -= len(data) if data is not None else 0
+        if data is None:
+            self.stats.failed += 1
+        else:
+            self.stats.files += 1
+            self.stats.bytes += len(data)
+        self.fill()
+        return data
+
+    def close(self) -> None:
+        """Drop reads that were never taken."""
+        if self.executor is not None:
+            for _, future in self.pending:
+                future.cancel()
+            self.pending.clear()
+            self.executor.shutdown(wait=True)
+            self.executor = None
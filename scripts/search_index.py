@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Search Index Builder
+
+Builds compact indexes over the catalog collections so the content hub can
+answer word lookups, substring queries and category filters with postings
+intersections instead of scanning every item on each keystroke.
+"""
+
+import base64
+import re
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+from output_writer import encode_json, write_if_changed
+
+
+SEARCH_INDEX_VERSION = 1
+SEARCH_FIELDS = ["name", "description", "role", "categories"]
+NGRAM_FIELDS = ["name", "description", "whenToUse", "scope", "commands"]
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into case-folded alphanumeric tokens."""
+    return TOKEN_PATTERN.findall(text.casefold())
+
+
+def field_text(value: Any) -> str:
+    """Flatten a field value (string, list or mapping) into searchable text."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return " ".join(f"{key} {field_text(item)}" for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return " ".join(field_text(item) for item in value)
+    return str(value)
+
+
+def encode_bitset(doc_ids: Iterable[int], size: int) -> str:
+    """Encode document ids as a base64 little-endian bitset (bit i = document i)."""
+    bits = bytearray((size + 7) // 8)
+    for doc_id in doc_ids:
+        bits[doc_id >> 3] |= 1 << (doc_id & 7)
+    return base64.b64encode(bytes(bits)).decode("ascii")
+
+
+def delta_encode(doc_ids: List[int]) -> List[int]:
+    """Encode ascending document ids as gaps (first id, then differences)."""
+    previous = 0
+    encoded = []
+    for doc_id in doc_ids:
+        encoded.append(doc_id - previous)
+        previous = doc_id
+    return encoded
+
+
+def delta_decode(gaps: List[int]) -> List[int]:
+    """Decode gap-encoded postings back into ascending document ids."""
+    total = 0
+    decoded = []
+    for gap in gaps:
+        total += gap
+        decoded.append(total)
+    return decoded
+
+
+class CatalogIndexBuilder(ABC):
+    """
+    Shared document table for catalog indexes.
+
+    Document ids are assigned in collection order and item output order, so
+    every index built from the same collections uses the same numbering.
+    """
+
+    def __init__(self, fields: List[str]):
+        self.fields = fields
+        self.types: List[str] = []
+        self.documents: List[List[Any]] = []
+        self.type_ranges: Dict[str, List[int]] = {}
+
+    def add_collection(self, content_type: str, items: List[Dict[str, Any]]) -> None:
+        """Index the items of one collection in output order."""
+        type_index = len(self.types)
+        self.types.append(content_type)
+        start = len(self.documents)
+
+        for item in items:
+            doc_id = len(self.documents)
+            self.documents.append([type_index, item.get("id", "")])
+            self.index_item(doc_id, item)
+
+        self.type_ranges[content_type] = [start, len(self.documents)]
+
+    @abstractmethod
+    def index_item(self, doc_id: int, item: Dict[str, Any]) -> None:
+        """Add one item to the index."""
+        pass
+
+    def document_table(self) -> Dict[str, Any]:
+        return {
+            "fields": self.fields,
+            "types": self.types,
+            "typeRanges": self.type_ranges,
+            "documents": self.documents,
+        }
+
+    @abstractmethod
+    def build(self) -> Dict[str, Any]:
+        """Assemble the index structure with deterministic key order."""
+        pass
+
+    def write(self, output_file: Path) -> int:
+        """Write the minified index (unless unchanged) and return its size in bytes."""
+        encoded = encode_json(self.build())
+        write_if_changed(output_file, encoded)
+        return len(encoded)
+
+
+class SearchIndexBuilder(CatalogIndexBuilder):
+    """
+    Inverted word index over the catalog collections.
+
+    Output structure:
+    - types: content type names; documents reference them by position
+    - documents: [typeIndex, itemId] pairs; a document id is the list position
+    - typeRanges: [start, end) document id range per content type
+    - terms: token -> ascending document ids containing it in any search field
+    - categories: category -> base64 bitset over document ids
+    """
+
+    def __init__(self, fields: List[str] = None):
+        super().__init__(fields or SEARCH_FIELDS)
+        self.postings: Dict[str, List[int]] = {}
+        self.category_docs: Dict[str, List[int]] = {}
+
+    def index_item(self, doc_id: int, item: Dict[str, Any]) -> None:
+        tokens = set()
+        for field in self.fields:
+            tokens.update(tokenize(field_text(item.get(field))))
+        for token in tokens:
+            self.postings.setdefault(token, []).append(doc_id)
+
+        for category in item.get("categories") or []:
+            if isinstance(category, str) and category.strip():
+                self.category_docs.setdefault(category.strip(), []).append(doc_id)
+
+    def build(self) -> Dict[str, Any]:
+        size = len(self.documents)
+        return {
+            "version": SEARCH_INDEX_VERSION,
+            **self.document_table(),
+            "terms": {token: self.postings[token] for token in sorted(self.postings)},
+            "categories": {
+                category: encode_bitset(doc_ids, size)
+                for category, doc_ids in sorted(self.category_docs.items())
+            },
+        }
+
+
+class NgramIndexBuilder(CatalogIndexBuilder):
+    """
+    N-gram index answering substring queries with the same semantics as
+    lib/search-utils.ts (lower-cased `field.includes(query)` on any field).
+
+    Grams of length 1..n are indexed per field, never spanning two fields.
+    A query shorter than n looks up its own gram; a longer query intersects
+    the postings of its n-grams to get a candidate superset, and only those
+    candidates are verified with an exact substring check.
+
+    Output structure (document table as in SearchIndexBuilder):
+    - n: maximum gram length
+    - grams: gram -> gap-encoded ascending document ids (see delta_encode)
+    """
+
+    def __init__(self, fields: List[str] = None, n: int = 3):
+        super().__init__(fields or NGRAM_FIELDS)
+        self.n = n
+        self.postings: Dict[str, List[int]] = {}
+        # Lower-cased field texts kept in memory for candidate verification
+        self.texts: List[List[str]] = []
+
+    def index_item(self, doc_id: int, item: Dict[str, Any]) -> None:
+        texts = [field_text(item.get(field)).lower() for field in self.fields]
+        self.texts.append(texts)
+
+        grams = set()
+        for text in texts:
+            for size in range(1, self.n + 1):
+                for start in range(len(text) - size + 1):
+                    grams.add(text[start:start + size])
+        for gram in grams:
+            self.postings.setdefault(gram, []).append(doc_id)
+
+    def query_grams(self, query: str) -> List[str]:
+        """Grams whose postings must all contain a matching document."""
+        if len(query) <= self.n:
+            return [query]
+        return sorted({query[start:start + self.n] for start in range(len(query) - self.n + 1)})
+
+    def candidates(self, query: str) -> List[int]:
+        """Documents that contain every gram of the query (a superset of matches)."""
+        query = query.lower()
+        result = None
+        # Intersect the rarest postings first to shrink the candidate set early
+        for gram in sorted(self.query_grams(query), key=lambda g: len(self.postings.get(g, []))):
+            postings = self.postings.get(gram)
+            if not postings:
+                return []
+            result = postings if result is None else sorted(set(result).intersection(postings))
+            if not result:
+                return []
+        return list(result or [])
+
+    def search(self, query: str) -> List[int]:
+        """Reference implementation: prune with grams, then verify exactly."""
+        query = query.lower()
+        if not query:
+            return list(range(len(self.documents)))
+        return [
+            doc_id for doc_id in self.candidates(query)
+            if any(query in text for text in self.texts[doc_id])
+        ]
+
+    def build(self) -> Dict[str, Any]:
+        return {
+            "version": SEARCH_INDEX_VERSION,
+            **self.document_table(),
+            "n": self.n,
+            "grams": {gram: delta_encode(self.postings[gram]) for gram in sorted(self.postings)},
+        }
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Source Document
+
+A lazily read view of one content file shared by every step that processes
+it, so the frontmatter, the description and any other reads go through a
+single open file handle instead of reopening (and re-reading) the file.
+"""
+
+import io
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Optional
+
+from yaml_loader import load_yaml, read_frontmatter_block
+
+
+FENCE_MARKERS = ("```", "~~~")
+# Body lines examined for a description before giving up
+DESCRIPTION_SCAN_LINES = 10
+MIN_DESCRIPTION_LENGTH = 20
+
+
+def is_description_line(line: str) -> bool:
+    """Check whether a stripped line reads like a meaningful sentence."""
+    # Skip empty lines, markdown headers and XML-style tags
+    return (bool(line) and
+            not line.startswith('#') and
+            not line.startswith('<') and
+            not line.startswith('Purpose:') and
+            len(line) > MIN_DESCRIPTION_LENGTH)
+
+
+class SourceDocument:
+    """
+    One source file opened at most once and read front to back on demand.
+
+    Reads are forward-only: the frontmatter (markdown files only) is consumed
+    first, then the body is streamed line by line until a caller has what it
+    needs. Results are memoized, so repeated calls cost no further I/O.
+    """
+
+    def __init__(self, path: Path, data: Optional[bytes] = None,
+                 opener: Callable[[Path], BinaryIO] = None):
+        self.path = path
+        # Content already read ahead (see read_ahead); the file is not opened then
+        self.data = data
+        # Opens the file otherwise (ContentSource.open; the file system by default)
+        self.opener = opener
+        self.bytes_read = 0
+        self._stream: Optional[BinaryIO] = None
+        self._frontmatter_read = False
+        self._frontmatter_block: Optional[str] = None
+        self._frontmatter: Optional[Dict[str, Any]] = None
+        self._description: Optional[str] = None
+
+    @property
+    def has_frontmatter_syntax(self) -> bool:
+        return self.path.suffix == '.md'
+
+    def stream(self) -> BinaryIO:
+        if self._stream is None:
+            if self.data is not None:
+                self._stream = io.BytesIO(self.data)
+            elif self.opener is not None:
+                self._stream = self.opener(self.path)
+            else:
+                self._stream = open(self.path, 'rb')
+        return self._stream
+
+    def readline(self) -> str:
+        """Read and decode the next line; '' at end of file."""
+        line = self.stream().readline()
+        self.bytes_read += len(line)
+        return line.decode('utf-8')
+
+    def read_frontmatter_block(self) -> Optional[str]:
+        """Consume and return the raw frontmatter block, if the file has one."""
+        if not self._frontmatter_read:
+            self._frontmatter_read = True
+            if self.has_frontmatter_syntax:
+                self._frontmatter_block = read_frontmatter_block(self)
+                if self._frontmatter_block is None:
+                    # Not frontmatter after all: the body starts at the top
+                    self.stream().seek(0)
+        return self._frontmatter_block
+
+    def frontmatter(self) -> Optional[Dict[str, Any]]:
+        """
+        Parse the frontmatter mapping.
+
+        Returns:
+            The frontmatter mapping, or None if the file has no frontmatter block
+        """
+        if self._frontmatter is None:
+            block = self.read_frontmatter_block()
+            if block is None:
+                return None
+            frontmatter = load_yaml(block)
+            self._frontmatter = frontmatter if isinstance(frontmatter, dict) else {}
+        return self._frontmatter
+
+    def description(self, max_lines: int = DESCRIPTION_SCAN_LINES) -> str:
+        """
+        Find the first line that reads like a description.
+
+        Frontmatter and fenced code blocks are skipped. Reading stops at the
+        first qualifying line or after max_lines body lines, so memory and I/O
+        stay bounded however large the file is.
+        """
+        if self._description is None:
+            self.read_frontmatter_block()
+            self._description = ""
+            fence = None
+            for _ in range(max_lines):
+                raw = self.readline()
+                if not raw:
+                    break
+                line = raw.strip()
+                if fence:
+                    if line.startswith(fence):
+                        fence = None
+                    continue
+                if line.startswith(FENCE_MARKERS):
+                    fence = line[:3]
+                    continue
+                if is_description_line(line):
+                    self._description = line
+                    break
+        return self._description
+
+    def close(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
@@ -0,0 +1,102 @@
+"""
+Shared fixtures for the catalog build script tests.
+
+The scripts are run as loose modules from scripts/, so that directory is put
+on the import path. Processors are loaded through catalog_builder.load_processor,
+as their entry points have hyphenated file names.
+"""
+
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+AGENT_YAML = """\
+agent:
+  identity:
+    name: "Ada Reviewer"
+    id: reviewer-v1
+    version: "1.0.0"
+    description: "Reviews code changes"
+    role: "Code Reviewer"
+    goal: "Keep the code base healthy"
+    icon: "🔍"
+  principles:
+    - "Be precise"
+  tasks:
+    - ./.krci-ai/tasks/code-review.md
+  commands:
+    help: "Show available commands"
+    review: "Execute task code-review"
+"""
+
+CODE_REVIEW_MD = """\
+---
+dependencies:
+  data:
+    - engineering-principles.md
+  templates:
+    - review-report-template.md
+---
+
+# Code Review Task
+
+Review the changes for correctness and clarity.
+
+## Steps
+
+- Read the diff
+- Leave comments
+"""
+
+RELEASE_NOTES_MD = """\
+# Release Notes Task
+
+Summarize the changes of a release.
+"""
+
+REVIEW_TEMPLATE_MD = """\
+# Review Report
+
+<instructions>
+Fill in every section.
+</instructions>
+
+## Findings
+
+| Severity | Count |
+| --- | --- |
+| High | 0 |
+"""
+
+PRINCIPLES_MD = """\
+# Engineering Principles
+
+Prefer simple designs over clever ones.
+"""
+
+PROJECT_FILES = {
+    ".krci-ai/agents/reviewer.yaml": AGENT_YAML,
+    ".krci-ai/tasks/code-review.md": CODE_REVIEW_MD,
+    ".krci-ai/tasks/release-notes.md": RELEASE_NOTES_MD,
+    ".krci-ai/templates/review-report-template.md": REVIEW_TEMPLATE_MD,
+    ".krci-ai/data/engineering-principles.md": PRINCIPLES_MD,
+}
+
+
+def write_files(root: Path, files: Dict[str, str]) -> Path:
+    """Write a {relative path: text} mapping below root and return root."""
+    for name, text in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    return root
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """A small project with one agent, two tasks, one template and one data file."""
+    return write_files(tmp_path / "project", PROJECT_FILES)
@@ -0,0 +1,68 @@
+"""Synthetic corpus generation and benchmark comparison."""
+
+import json
+
+import pytest
+
+from benchmark import PHASES, CorpusGenerator, benchmark_scale, compare
+from catalog_builder import PROCESSOR_REGISTRY, load_processor
+
+
+@pytest.fixture(scope="module")
+def corpus(tmp_path_factory):
+    generator = CorpusGenerator(tmp_path_factory.mktemp("corpus") / "project", scale=12, seed=3)
+    generator.generate()
+    return generator
+
+
+def tree(root):
+    return {str(path.relative_to(root)): path.read_bytes() for path in sorted(root.rglob("*")) if path.is_file()}
+
+
+def test_corpus_is_determined_by_the_seed(corpus, tmp_path):
+    again = CorpusGenerator(tmp_path / "project", scale=12, seed=3)
+    again.generate()
+
+    assert tree(again.root) == tree(corpus.root)
+    assert again.is_current()
+    assert not CorpusGenerator(again.root, scale=12, seed=4).is_current()
+
+
+@pytest.mark.parametrize("key", sorted(PROCESSOR_REGISTRY))
+def test_previous_build_uses_each_processor_items_key(corpus, key):
+    output = json.loads((corpus.root / "public" / "data" / PROCESSOR_REGISTRY[key][2]).read_text())
+    items_key = load_processor(key).get_items_key()
+
+    assert list(output) == [items_key, "metadata"]
+    assert 0 < len(output[items_key]) <= 12
+
+
+@pytest.mark.parametrize("key", sorted(PROCESSOR_REGISTRY))
+def test_corpus_processes_without_errors(corpus, key, tmp_path):
+    processor = load_processor(key)
+
+    assert processor.run(tmp_path / "out.json", corpus.root)
+    assert len(processor.processed_items) == 12
+
+
+def test_benchmark_restores_the_previous_build(corpus):
+    output_file = corpus.root / "public" / "data" / PROCESSOR_REGISTRY["data"][2]
+    before = output_file.read_bytes()
+
+    [run] = benchmark_scale(corpus.root, 12, ["data"], repeat=1, jobs=1)
+
+    assert (run["contentType"], run["files"], run["errors"]) == ("data", 12, 0)
+    assert output_file.read_bytes() == before
+
+
+def timings(end_to_end, process):
+    return {"scale": 10, "contentType": "data", "endToEnd": {"median": end_to_end},
+            "phases": {phase: {"median": process if phase == "process" else 0.0} for phase in PHASES}}
+
+
+def test_compare_reports_regressions_above_threshold_and_noise_floor():
+    baseline = {"runs": [timings(1.0, 0.0001)]}
+    results = {"runs": [timings(1.5, 0.0005)]}
+
+    assert compare(results, baseline, threshold=20) == ["data @ 10 endToEnd: +50.0%"]
+    assert compare(results, baseline, threshold=60) == []
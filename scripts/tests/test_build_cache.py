@@ -0,0 +1,134 @@
+"""Incremental build cache: reuse of unchanged files and invalidation."""
+
+import json
+import os
+from pathlib import Path
+
+from build_cache import BuildCache, FileResult
+from catalog_builder import load_processor
+
+
+def make_cache(tmp_path: Path, signature: str = "TaskProcessor:1.0.0") -> BuildCache:
+    return BuildCache(tmp_path / "cache", "tasks", signature)
+
+
+def store_and_save(cache: BuildCache, file_path: Path, existing=None) -> None:
+    cache.load(file_path.parent)
+    cache.store(file_path, existing, FileResult(item={"id": file_path.stem}, valid=True))
+    cache.save()
+
+
+def test_unchanged_file_is_reused(tmp_path):
+    source = tmp_path / "task.md"
+    source.write_text("# Task\n")
+    store_and_save(make_cache(tmp_path), source)
+
+    cache = make_cache(tmp_path)
+    cache.load(tmp_path)
+    result = cache.lookup(source, None)
+
+    assert result is not None and result.item == {"id": "task"}
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_changed_content_is_a_miss(tmp_path):
+    source = tmp_path / "task.md"
+    source.write_text("# Task\n")
+    store_and_save(make_cache(tmp_path), source)
+
+    source.write_text("# Task, edited\n")
+    cache = make_cache(tmp_path)
+    cache.load(tmp_path)
+
+    assert cache.lookup(source, None) is None
+    assert cache.misses == 1
+
+
+def test_touched_file_with_same_content_is_reused(tmp_path):
+    source = tmp_path / "task.md"
+    source.write_text("# Task\n")
+    store_and_save(make_cache(tmp_path), source)
+
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    cache = make_cache(tmp_path)
+    cache.load(tmp_path)
+
+    assert cache.lookup(source, None) is not None
+    cache.save()
+    # The refreshed stat is persisted, so the next run skips hashing again
+    assert cache.next_entries["task.md"]["mtime_ns"] == source.stat().st_mtime_ns
+
+
+def test_changed_existing_item_is_a_miss(tmp_path):
+    source = tmp_path / "task.md"
+    source.write_text("# Task\n")
+    store_and_save(make_cache(tmp_path), source, existing={"id": "task", "categories": ["A"]})
+
+    cache = make_cache(tmp_path)
+    cache.load(tmp_path)
+
+    assert cache.lookup(source, {"id": "task", "categories": ["B"]}) is None
+
+
+def test_processor_signature_change_discards_cache(tmp_path):
+    source = tmp_path / "task.md"
+    source.write_text("# Task\n")
+    store_and_save(make_cache(tmp_path), source)
+
+    cache = make_cache(tmp_path, signature="TaskProcessor:2.0.0")
+    cache.load(tmp_path)
+
+    assert cache.entries == {}
+    assert cache.lookup(source, None) is None
+
+
+def test_failed_results_are_not_cached(tmp_path):
+    source = tmp_path / "task.md"
+    source.write_text("# Task\n")
+    cache = make_cache(tmp_path)
+    cache.load(tmp_path)
+    cache.store(source, None, FileResult(item=None, valid=False, failure="boom"))
+
+    assert cache.next_entries == {}
+
+
+def test_deleted_files_are_dropped_on_save(tmp_path):
+    kept, deleted = tmp_path / "kept.md", tmp_path / "deleted.md"
+    kept.write_text("# Kept\n")
+    deleted.write_text("# Deleted\n")
+    cache = make_cache(tmp_path)
+    cache.load(tmp_path)
+    for source in (kept, deleted):
+        cache.store(source, None, FileResult(item={"id": source.stem}, valid=True))
+    cache.save()
+
+    deleted.unlink()
+    cache = make_cache(tmp_path)
+    cache.load(tmp_path)
+    cache.lookup(kept, None)
+
+    assert cache.removed == 1
+
+
+def run_tasks(project: Path, tmp_path: Path):
+    processor = load_processor("tasks")
+    processor.enable_cache(tmp_path / "cache")
+    assert processor.run(tmp_path / "out" / "tasks.json", project)
+    return processor
+
+
+def test_incremental_run_reprocesses_only_edited_files(project, tmp_path):
+    # The first run creates the output whose items later runs preserve fields from
+    run_tasks(project, tmp_path)
+    run_tasks(project, tmp_path)
+    output_file = tmp_path / "out" / "tasks.json"
+    items = json.loads(output_file.read_text())["tasks"]
+
+    processor = run_tasks(project, tmp_path)
+    assert (processor.cache.hits, processor.cache.misses) == (2, 0)
+    assert json.loads(output_file.read_text())["tasks"] == items
+
+    (project / ".krci-ai/tasks/release-notes.md").write_text("# Release Notes Task\n\nEdited.\n")
+    processor = run_tasks(project, tmp_path)
+    assert (processor.cache.hits, processor.cache.misses) == (1, 1)
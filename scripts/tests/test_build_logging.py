@@ -0,0 +1,77 @@
+"""Buffered console logging, item detail levels and the JSON build report."""
+
+import json
+
+import pytest
+
+import build_logging
+from build_logging import (NORMAL, QUIET, VERBOSE, BufferedConsoleHandler, configure_logging, flush_logs,
+                           get_logger)
+from catalog_builder import load_processor
+
+
+@pytest.fixture(autouse=True)
+def restore_logging():
+    yield
+    configure_logging(NORMAL)
+
+
+def run_tasks(project, tmp_path, verbosity=NORMAL):
+    configure_logging(verbosity)
+    processor = load_processor("tasks")
+    processor.report_file = tmp_path / "report.json"
+    assert processor.run(tmp_path / "tasks.json", project)
+    flush_logs()
+    return processor
+
+
+def test_lines_are_buffered_until_flushed(capsys):
+    logger = configure_logging(NORMAL)
+    logger.info("first")
+    logger.info("second")
+    assert capsys.readouterr().out == ""
+
+    flush_logs()
+    assert capsys.readouterr().out == "first\nsecond\n"
+
+
+def test_buffer_is_written_when_full(capsys):
+    [handler] = configure_logging(NORMAL).handlers
+    assert isinstance(handler, BufferedConsoleHandler)
+    handler.capacity = 2
+
+    get_logger("child").info("one")
+    assert capsys.readouterr().out == ""
+    get_logger("child").info("two")
+    assert capsys.readouterr().out == "one\ntwo\n"
+
+
+def test_item_lines_follow_verbosity(project, tmp_path, capsys):
+    run_tasks(project, tmp_path, NORMAL)
+    assert "✓ code-review.md" in capsys.readouterr().out
+
+    run_tasks(project, tmp_path, QUIET)
+    assert capsys.readouterr().out == ""
+
+
+def test_large_runs_summarize_item_lines(project, tmp_path, capsys, monkeypatch):
+    monkeypatch.setattr(build_logging, "ITEM_DETAIL_LIMIT", 1)
+
+    run_tasks(project, tmp_path, NORMAL)
+    out = capsys.readouterr().out
+    assert "✓ code-review.md" not in out
+    assert "📋 2 files: 2 new (per-item lines hidden; use --verbose)" in out
+
+    run_tasks(project, tmp_path, VERBOSE)
+    assert "✓ code-review.md" in capsys.readouterr().out
+
+
+def test_report_records_status_counts_and_entries(project, tmp_path):
+    processor = run_tasks(project, tmp_path, QUIET)
+
+    report = json.loads((tmp_path / "report.json").read_text())
+    assert report["succeeded"] is True
+    [collection] = report["collections"]
+    assert collection == processor.last_report
+    assert collection["statusCounts"] == {"new": 2}
+    assert [entry["id"] for entry in collection["entries"]] == ["code-review", "release-notes"]
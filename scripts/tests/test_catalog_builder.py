@@ -0,0 +1,93 @@
+"""Single-walk discovery and the build-catalog entry point."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from catalog_builder import CatalogBuilder, PROCESSOR_REGISTRY, load_processor
+from conftest import write_files
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+
+EXTRA_FILES = {
+    ".krci-ai/agents/notes.md": "# Agent notes\n",
+    ".krci-ai/tasks/nested/deploy.md": "# Deploy Task\n",
+    ".krci-ai/tasks/schema.json": "{}\n",
+    ".krci-ai/tasks/todo.txt": "later\n",
+    ".krci-ai/templates/report.yaml": "name: report\n",
+    ".krci-ai/data/guides/style.md": "# Style Guide\n",
+    ".krci-ai/data/schema.json": "{}\n",
+    ".krci-ai/checklists/release.md": "# Release checklist\n",
+    ".krci-ai/README.md": "# Framework\n",
+}
+
+
+@pytest.fixture
+def builder(project, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_files(project, EXTRA_FILES)
+    return CatalogBuilder(project, tmp_path / "out")
+
+
+def relative(project, files):
+    return [path.relative_to(project).as_posix() for path in files]
+
+
+def test_scan_routes_files_to_their_processor(project, builder):
+    scanned = builder.scan()
+
+    assert {key: relative(project, files) for key, files in scanned.items()} == {
+        "agents": [".krci-ai/agents/reviewer.yaml"],
+        "tasks": [".krci-ai/tasks/code-review.md", ".krci-ai/tasks/nested/deploy.md",
+                  ".krci-ai/tasks/release-notes.md", ".krci-ai/tasks/schema.json"],
+        "templates": [".krci-ai/templates/report.yaml", ".krci-ai/templates/review-report-template.md"],
+        "data": [".krci-ai/data/engineering-principles.md", ".krci-ai/data/guides/style.md"],
+    }
+
+
+def test_scan_matches_each_processors_own_discovery(project, builder):
+    scanned = builder.scan()
+
+    for key, processor in builder.processors.items():
+        source_dir = processor.find_source_directory(project)
+        assert scanned[key] == list(processor.discover_files(source_dir)), key
+
+
+def test_scan_covers_content_roots_of_different_layouts(project, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # Tasks only exist in the krci-input copy, so they come from a second root
+    write_files(project, {"krci-input/.krci-ai/tasks/imported.md": "# Imported Task\n"})
+    builder = CatalogBuilder(project, tmp_path / "out", only=["agents", "tasks"])
+
+    scanned = builder.scan()
+
+    assert relative(project, scanned["agents"]) == [".krci-ai/agents/reviewer.yaml"]
+    assert relative(project, scanned["tasks"]) == ["krci-input/.krci-ai/tasks/imported.md"]
+
+
+def run_script(script, cwd, *args):
+    subprocess.run([sys.executable, str(SCRIPTS_DIR / script), "--deterministic", "--quiet", *args],
+                   cwd=cwd, check=True, capture_output=True)
+
+
+def test_build_catalog_matches_the_standalone_processors(project, tmp_path):
+    write_files(project, EXTRA_FILES)
+
+    run_script("build-catalog.py", project, "--output-dir", str(tmp_path / "catalog"))
+    for script, _, output_name in PROCESSOR_REGISTRY.values():
+        run_script(script, project, "--output", str(tmp_path / "standalone" / output_name))
+
+    for key, (_, _, output_name) in PROCESSOR_REGISTRY.items():
+        catalog = (tmp_path / "catalog" / output_name).read_bytes()
+        assert catalog == (tmp_path / "standalone" / output_name).read_bytes(), key
+
+
+def test_build_runs_every_processor_on_the_scanned_files(project, builder, tmp_path):
+    assert builder.build()
+
+    for key, processor in builder.processors.items():
+        standalone = load_processor(key)
+        assert standalone.run(tmp_path / "standalone" / PROCESSOR_REGISTRY[key][2], project)
+        assert processor.processed_items == standalone.processed_items, key
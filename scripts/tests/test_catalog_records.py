@@ -0,0 +1,68 @@
+"""Slotted catalog records with mapping-style access."""
+
+import json
+import pickle
+
+import pytest
+
+from catalog_records import MISSING, AgentRecord, TaskRecord, to_json_value
+
+
+def test_round_trips_key_order_and_extra_keys():
+    item = {"path": "p.md", "id": "a", "custom": 1, "name": "A", "description": None}
+
+    record = TaskRecord.from_dict(item)
+
+    assert record.to_dict() == item
+    # Record fields come first in output order, then unknown keys
+    assert list(record) == ["id", "name", "description", "path", "custom"]
+
+
+def test_missing_fields_are_absent_but_null_is_kept():
+    record = TaskRecord(id="a", description=None)
+
+    assert "name" not in record and "description" in record
+    assert record.get("name", "fallback") == "fallback"
+    assert record.get("description", "fallback") is None
+    with pytest.raises(KeyError):
+        record["name"]
+    assert len(record) == 2
+
+
+def test_setting_unknown_keys_goes_to_extra():
+    record = TaskRecord(id="a")
+    record["name"] = "A"
+    record["rating"] = 5
+
+    assert record.name == "A"
+    assert record.extra == {"rating": 5}
+    assert record.items() == [("id", "a"), ("name", "A"), ("rating", 5)]
+
+
+def test_records_are_slotted():
+    with pytest.raises(AttributeError):
+        TaskRecord().anything = 1
+
+
+def test_categories_are_interned():
+    first = TaskRecord(categories=["".join(["Develop", "ment"])])
+    second = TaskRecord.from_dict({"categories": ["".join(["Develo", "pment"])]})
+    second["categories"] = ["".join(["Devel", "opment"])]
+
+    assert first.categories[0] is second.categories[0]
+
+
+def test_records_serialize_like_dicts():
+    item = {"id": "a-v1", "name": "A", "commands": {"help": "Show help"}, "extra": "kept"}
+    record = AgentRecord.from_dict(item)
+
+    assert json.dumps(record, default=to_json_value) == json.dumps(item)
+    with pytest.raises(TypeError):
+        to_json_value(object())
+
+
+def test_missing_survives_pickling():
+    record = pickle.loads(pickle.dumps(TaskRecord(id="a")))
+
+    assert record.name is MISSING
+    assert record.to_dict() == {"id": "a"}
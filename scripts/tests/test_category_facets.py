@@ -0,0 +1,65 @@
+"""Per-collection category counts and the catalog facet matrix."""
+
+import json
+
+from catalog_builder import CatalogBuilder, load_processor
+from category_facets import FacetMatrixBuilder, category_counts, category_item_ids, item_categories
+
+TASKS = [
+    {"id": "b", "categories": ["Marketing", " Development "]},
+    {"id": "a", "categories": ["Development", "Development", "", 3]},
+    {"id": "c", "categories": "Development"},
+    {"categories": ["Marketing"]},
+]
+
+
+def test_item_categories_are_trimmed_and_distinct():
+    assert item_categories(TASKS[1]) == ["Development"]
+    assert item_categories(TASKS[2]) == []
+
+
+def test_counts_and_ids_are_sorted_by_category():
+    assert category_counts(TASKS) == {"Development": 2, "Marketing": 2}
+    # Items without an id are counted but cannot be listed
+    assert category_item_ids(TASKS) == {"Development": ["a", "b"], "Marketing": ["b"]}
+
+
+def test_matrix_keeps_registry_order_and_omits_zero_counts():
+    facets = FacetMatrixBuilder()
+    facets.add_collection("agents", [{"id": "x", "categories": ["Marketing"]}])
+    facets.add_collection("tasks", TASKS)
+    facets.add_collection("data", [])
+
+    built = facets.build()
+    assert built["types"] == ["agents", "tasks", "data"]
+    assert built["totals"] == {"agents": 1, "tasks": 4, "data": 0}
+    assert built["matrix"] == {"Development": {"tasks": 2}, "Marketing": {"agents": 1, "tasks": 2}}
+    assert built["counts"] == {"Development": 2, "Marketing": 3}
+    assert built["items"]["tasks"] == {"Development": ["a", "b"], "Marketing": ["b"]}
+    assert built["items"]["data"] == {}
+
+
+def test_collection_metadata_has_counts_but_no_ids(project, tmp_path):
+    output_file = tmp_path / "data.json"
+    output_file.write_text(json.dumps({"dataFiles": [
+        {"id": "engineering-principles", "path": ".krci-ai/data/engineering-principles.md",
+         "categories": ["Development", "Quality"]},
+    ]}))
+
+    assert load_processor("data").run(output_file, project)
+
+    metadata = json.loads(output_file.read_text())["metadata"]
+    assert metadata["categories"] == ["Development", "Quality"]
+    assert metadata["categoryCounts"] == {"Development": 1, "Quality": 1}
+    assert "categoryItems" not in metadata
+
+
+def test_catalog_build_writes_facets(project, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    builder = CatalogBuilder(project, tmp_path / "out")
+    assert builder.build()
+
+    facets = json.loads((tmp_path / "out" / "facets.json").read_text())
+    assert facets["types"] == list(builder.processors)
+    assert set(facets["items"]) == set(builder.processors)
+    assert facets["totals"]["tasks"] == 2
@@ -0,0 +1,144 @@
+"""Reading content from directories, archives and git refs."""
+
+import json
+import os
+import subprocess
+import tarfile
+import zipfile
+
+import pytest
+
+from catalog_builder import load_processor
+from content_source import (ArchiveSource, ContentSource, GitSource, IndexedSource, SourceError,
+                            open_content_source, safe_member_path, strip_wrapper)
+from file_discovery import IGNORE_FILE_NAME
+
+
+def write_tar(archive, project, prefix=""):
+    with tarfile.open(archive, "w:" + archive.name.rpartition(".tar")[2].lstrip(".")) as tar:
+        for path in sorted(project.rglob("*")):
+            if path.is_file():
+                tar.add(path, arcname=prefix + path.relative_to(project).as_posix())
+    return archive
+
+
+def write_zip(archive, project):
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        for path in sorted(project.rglob("*")):
+            if path.is_file():
+                zip_file.write(path, path.relative_to(project).as_posix())
+    return archive
+
+
+def run_items(key, source, tmp_path):
+    processor = load_processor(key)
+    processor.source = source
+    output_file = tmp_path / f"{key}-{len(list(tmp_path.iterdir()))}.json"
+    assert processor.run(output_file, source.root)
+    source.close()
+    return json.loads(output_file.read_text())[processor.get_items_key()]
+
+
+def test_safe_member_path():
+    assert safe_member_path("./a//b/../c.md") == "a/c.md"
+    assert safe_member_path("a\\b.md") == "a/b.md"
+    for unsafe in ("/etc/passwd", "../x.md", "a/../../x.md", "."):
+        assert safe_member_path(unsafe) is None
+
+
+def test_strip_wrapper():
+    assert strip_wrapper(["krci-ai-main/.krci-ai/a.md", "krci-ai-main/README.md"]) == "krci-ai-main/"
+    assert strip_wrapper([".krci-ai/a.md", ".krci-ai/b.md"]) == ""
+    assert strip_wrapper(["main/a.md", "README.md"]) == ""
+
+
+@pytest.mark.parametrize("name", ["content.tar", "content.tar.gz", "content.tar.xz", "content.zip"])
+@pytest.mark.parametrize("key", ["agents", "tasks", "data"])
+def test_archives_build_like_the_directory(project, tmp_path, name, key):
+    archive = tmp_path / name
+    if name.endswith(".zip"):
+        write_zip(archive, project)
+    else:
+        write_tar(archive, project, prefix="krci-ai-main/")
+
+    source = open_content_source(archive)
+
+    assert isinstance(source, ArchiveSource)
+    assert source.is_streamed == name.endswith((".gz", ".xz"))
+    assert run_items(key, source, tmp_path) == run_items(key, ContentSource(project), tmp_path)
+
+
+def test_archive_krciignore_is_honored(project, tmp_path):
+    (project / ".krci-ai/tasks" / IGNORE_FILE_NAME).write_text("release-*.md\n")
+    source = ArchiveSource(write_tar(tmp_path / "content.tar.gz", project))
+
+    assert [item["id"] for item in run_items("tasks", source, tmp_path)] == ["code-review"]
+
+
+def test_archive_members_read_back(project, tmp_path):
+    source = ArchiveSource(write_tar(tmp_path / "content.tar", project))
+    task = source.root / ".krci-ai/tasks/code-review.md"
+
+    assert source.read_bytes(task) == (project / ".krci-ai/tasks/code-review.md").read_bytes()
+    assert source.is_dir(source.root / ".krci-ai/tasks")
+    assert source.stat(task).st_size == len(source.read_bytes(task))
+    with pytest.raises(FileNotFoundError):
+        source.read_bytes(source.root / ".krci-ai/tasks/missing.md")
+    source.close()
+
+
+def test_corrupt_archives_raise_source_errors(tmp_path):
+    archive = tmp_path / "content.tar.gz"
+    archive.write_bytes(b"not a tarball")
+
+    with pytest.raises(SourceError):
+        ArchiveSource(archive).index()
+
+
+def git(repository, *args, env=None):
+    subprocess.run(["git", "-C", str(repository), "-c", "user.name=Test", "-c", "user.email=test@example.com",
+                    *args], check=True, capture_output=True, env=env)
+
+
+@pytest.fixture
+def repository(project):
+    git(project, "init", "-q")
+    git(project, "add", "-A")
+    git(project, "commit", "-q", "-m", "content", env={**os.environ, "GIT_COMMITTER_DATE": "2024-01-01T00:00:00Z"})
+    return project
+
+
+def test_git_refs_are_read_without_a_checkout(repository, tmp_path):
+    (repository / ".krci-ai/tasks/triage.md").write_text("# Triage Task\n")
+    git(repository, "add", "-A")
+    git(repository, "commit", "-q", "-m", "add triage")
+    # Uncommitted changes are not part of any ref
+    (repository / ".krci-ai/tasks/release-notes.md").unlink()
+
+    assert [item["id"] for item in run_items("tasks", GitSource(repository), tmp_path)] == [
+        "code-review", "release-notes", "triage"]
+    assert [item["id"] for item in run_items("tasks", open_content_source(repository, "HEAD~1"), tmp_path)] == [
+        "code-review", "release-notes"]
+
+
+def test_git_files_report_the_commit_time(repository):
+    source = GitSource(repository)
+
+    assert source.stat(source.root / ".krci-ai/tasks/code-review.md").st_mtime == 1704067200
+    source.close()
+
+
+def test_unknown_refs_raise_source_errors(repository):
+    with pytest.raises(SourceError):
+        GitSource(repository, "no-such-ref").index()
+    with pytest.raises(SourceError):
+        open_content_source(repository / ".krci-ai", "HEAD")
+
+
+def test_indexed_sources_must_implement_member_access(tmp_path):
+    class ListingOnly(IndexedSource):
+        def list_members(self):
+            return []
+
+    with pytest.raises(TypeError):
+        ListingOnly(tmp_path)
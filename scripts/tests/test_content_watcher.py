@@ -0,0 +1,91 @@
+"""Watch mode: change detection, routing and incremental output patching."""
+
+import json
+
+from catalog_builder import load_processor
+from content_watcher import ChangeBatch, ContentWatcher, PollingWatcher, WatchTarget
+
+
+def items_by_id(output_file, items_key):
+    return {item["id"]: item for item in json.loads(output_file.read_text())[items_key]}
+
+
+def data_target(project, tmp_path):
+    processor = load_processor("data")
+    output_file = tmp_path / "data.json"
+    assert processor.run(output_file, project)
+    return WatchTarget(processor, processor.find_source_directory(project), output_file, project)
+
+
+def test_patch_output_updates_adds_and_removes_items(project, tmp_path):
+    target = data_target(project, tmp_path)
+    data_dir = target.source_dir
+    (data_dir / "engineering-principles.md").write_text("# Engineering Principles\n\nShip small changes.\n")
+    (data_dir / "glossary.md").write_text("# Glossary\n\nTerms used across the framework.\n")
+
+    assert target.processor.patch_output(target.output_file, [data_dir / "engineering-principles.md",
+                                                              data_dir / "glossary.md"])
+    assert target.processor.item_status_counts() == {"new": 1, "updated": 1}
+    items = items_by_id(target.output_file, "dataFiles")
+    # Curated fields of existing items are preserved, as in a full run
+    assert items["engineering-principles"]["description"] == "Prefer simple designs over clever ones."
+    assert items["glossary"]["description"] == "Terms used across the framework."
+
+    (data_dir / "glossary.md").unlink()
+    assert target.processor.patch_output(target.output_file, [data_dir / "glossary.md"])
+    assert target.processor.item_status_counts() == {"removed": 1}
+    assert set(items_by_id(target.output_file, "dataFiles")) == {"engineering-principles"}
+
+
+def test_patch_output_matches_a_full_run(project, tmp_path):
+    target = data_target(project, tmp_path)
+    (target.source_dir / "glossary.md").write_text("# Glossary\n\nTerms.\n")
+    target.processor.patch_output(target.output_file, [target.source_dir / "glossary.md"])
+
+    full_output = tmp_path / "full.json"
+    assert load_processor("data").run(full_output, project)
+
+    assert items_by_id(target.output_file, "dataFiles") == items_by_id(full_output, "dataFiles")
+
+
+def test_polling_watcher_reports_changed_and_removed_files(project, tmp_path):
+    target = data_target(project, tmp_path)
+    watcher = PollingWatcher([target], interval=0)
+    edited = target.source_dir / "engineering-principles.md"
+    added = target.source_dir / "glossary.md"
+
+    edited.write_text("# Engineering Principles\n\nA longer, edited body.\n")
+    added.write_text("# Glossary\n")
+    assert watcher.wait(0).paths == {edited, added}
+
+    added.unlink()
+    assert watcher.wait(0).paths == {added}
+    assert not watcher.wait(0)
+
+
+def test_changes_are_routed_to_the_owning_target(project, tmp_path):
+    tasks = load_processor("tasks")
+    targets = [
+        data_target(project, tmp_path),
+        WatchTarget(tasks, tasks.find_source_directory(project), tmp_path / "tasks.json", project),
+    ]
+    watcher = ContentWatcher(targets, force_polling=True)
+    task_file = project / ".krci-ai/tasks/code-review.md"
+    data_file = project / ".krci-ai/data/engineering-principles.md"
+
+    routed = watcher.route(ChangeBatch(paths={task_file, data_file, project / ".krci-ai/tasks/notes.txt"}))
+
+    assert routed == {0: {data_file}, 1: {task_file}}
+    assert watcher.owns(targets[1], project / ".krci-ai")
+    assert not watcher.owns(targets[1], project / ".krci-ai/data")
+
+
+def test_directory_changes_rebuild_the_owning_target(project, tmp_path):
+    target = data_target(project, tmp_path)
+    watcher = ContentWatcher([target], force_polling=True)
+    (target.source_dir / "guides").mkdir()
+    (target.source_dir / "guides" / "style.md").write_text("# Style Guide\n\nWrite clearly.\n")
+
+    watcher.apply(ChangeBatch(rescan_dirs={target.source_dir / "guides"}))
+
+    assert "style" in items_by_id(target.output_file, "dataFiles")
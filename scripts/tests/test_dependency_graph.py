@@ -0,0 +1,129 @@
+"""Cross-reference collection and the catalog dependency graph."""
+
+import json
+
+import pytest
+
+from catalog_builder import CatalogBuilder, load_processor
+from content_watcher import ChangeBatch, ContentWatcher
+from dependency_graph import DependencyGraphBuilder, normalize_reference
+
+
+@pytest.fixture
+def builder(project, tmp_path, monkeypatch):
+    # Catalog-wide stages keep their caches in the working directory
+    monkeypatch.chdir(tmp_path)
+    return CatalogBuilder(project, tmp_path / "out")
+
+
+def edges(graph):
+    """(source, target) node descriptions of every forward edge."""
+    names = [f"{graph['types'][type_index]}/{item_id}" for type_index, item_id in graph["nodes"]]
+    return {(names[source], names[target]) for source, targets in enumerate(graph["forward"]) for target in targets}
+
+
+@pytest.mark.parametrize("target", ["./.krci-ai/tasks/create-pitch-deck.md", "tasks/create-pitch-deck.md",
+                                    "create-pitch-deck", "{project_root}/.krci-ai/tasks/create-pitch-deck.md"])
+def test_normalize_reference(target):
+    assert normalize_reference("tasks", target) == "create-pitch-deck"
+
+
+def test_nested_paths_keep_their_directory():
+    assert normalize_reference("data", "krci-ai/core-sdlc-framework.md") == "krci-ai/core-sdlc-framework"
+
+
+def test_references_resolve_by_path_then_unique_stem():
+    graph = DependencyGraphBuilder()
+    graph.add_collection("data", [{"id": "a", "path": ".krci-ai/data/guides/style.md"},
+                                  {"id": "b", "path": ".krci-ai/data/one/shared.md"},
+                                  {"id": "c", "path": ".krci-ai/data/two/shared.md"}], {})
+    graph.add_collection("tasks", [{"id": "t", "path": ".krci-ai/tasks/t.md"}],
+                         {"t": {"data": ["guides/style.md", "style.md", "one/shared.md", "shared.md"],
+                                "checklists": ["x.md"]}})
+
+    dangling = graph.link()
+
+    assert graph.forward[3] == {0, 1}
+    assert graph.reverse[0] == {3} and graph.reverse[1] == {3}
+    # An ambiguous stem and an unknown kind are reported, not guessed
+    assert dangling == ["tasks/t: missing data dependency 'shared.md'",
+                        "tasks/t: unknown reference kind 'checklists' (x.md)"]
+
+
+def test_catalog_build_writes_the_graph(builder, tmp_path):
+    assert builder.build()
+
+    graph = json.loads((tmp_path / "out" / "graph.json").read_text())
+    assert edges(graph) == {
+        ("agents/reviewer-v1", "tasks/code-review"),
+        ("tasks/code-review", "data/engineering-principles"),
+        ("tasks/code-review", "templates/review-report-template"),
+    }
+
+
+def test_dangling_references_fail_the_build_unless_allowed(project, builder, tmp_path):
+    (project / ".krci-ai/tasks/triage.md").write_text("---\ndependencies:\n  data:\n    - missing.md\n---\n# Triage\n")
+
+    assert not builder.build()
+    assert builder.dangling == ["tasks/triage: missing data dependency 'missing.md'"]
+    # The other catalog-wide stages still run
+    for name in ("graph.json", "search-index.json", "facets.json", "details/tasks/triage.json"):
+        assert (tmp_path / "out" / name).exists(), name
+
+    builder.allow_dangling = True
+    assert builder.build()
+    assert (tmp_path / "out" / "graph.json").exists()
+
+
+def test_malformed_frontmatter_records_no_references(project, builder, tmp_path):
+    (project / ".krci-ai/tasks/bad-front.md").write_text("---\nname: [unclosed\n---\n# Bad Front\n")
+
+    assert builder.build()
+
+    tasks = builder.processors["tasks"]
+    assert "bad-front" in [item["id"] for item in tasks.processed_items]
+    assert "bad-front" not in tasks.item_references
+    assert any(warning.startswith("bad-front.md: No dependencies recorded") for warning in tasks.warnings)
+
+
+def test_standalone_runs_do_not_collect_references(project, tmp_path):
+    (project / ".krci-ai/tasks/bad-front.md").write_text("---\nname: [unclosed\n---\n# Bad Front\n")
+
+    processor = load_processor("tasks")
+    assert processor.run(tmp_path / "tasks.json", project)
+
+    assert processor.item_references == {}
+    assert processor.warnings == []
+
+
+def test_same_named_items_keep_their_own_references(project, builder, tmp_path):
+    tasks_dir = project / ".krci-ai/tasks"
+    for folder, kind, target in [("a", "data", "engineering-principles.md"),
+                                 ("b", "templates", "review-report-template.md")]:
+        (tasks_dir / folder).mkdir()
+        (tasks_dir / folder / "foo.md").write_text(f"---\ndependencies:\n  {kind}:\n    - {target}\n---\n# Foo\n")
+
+    assert builder.build()
+
+    graph = json.loads((tmp_path / "out" / "graph.json").read_text())
+    names = [f"{graph['types'][type_index]}/{item_id}" for type_index, item_id in graph["nodes"]]
+    tasks_type = graph["types"].index("tasks")
+    first_task = next(node for node, (type_index, _) in enumerate(graph["nodes"]) if type_index == tasks_type)
+    targets = {}
+    for offset, item in enumerate(builder.processors["tasks"].processed_items):
+        targets[item["path"]] = [names[target] for target in graph["forward"][first_task + offset]]
+    assert targets[".krci-ai/tasks/a/foo.md"] == ["data/engineering-principles"]
+    assert targets[".krci-ai/tasks/b/foo.md"] == ["templates/review-report-template"]
+
+
+def test_watch_refreshes_details_despite_dangling_references(project, builder, tmp_path):
+    assert builder.build()
+    watcher = ContentWatcher(builder.watch_targets(), force_polling=True, on_change=builder.refresh_catalog)
+    task_file = project / ".krci-ai/tasks/code-review.md"
+    task_file.write_text("---\ndependencies:\n  data:\n    - missing.md\n---\n# Code Review\n\nEdited body.\n")
+
+    watcher.apply(ChangeBatch(paths={task_file}))
+
+    assert builder.dangling == ["tasks/code-review: missing data dependency 'missing.md'"]
+    payload = json.loads((tmp_path / "out/details/tasks/code-review.json").read_text())
+    assert "Edited body." in payload["html"]
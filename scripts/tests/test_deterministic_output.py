@@ -0,0 +1,110 @@
+"""Deterministic builds and skipped writes of unchanged output."""
+
+import json
+import os
+
+from catalog_builder import load_processor
+from output_writer import write_if_changed
+
+
+def run_deterministic(project, output_file, key="tasks"):
+    processor = load_processor(key)
+    processor.deterministic = True
+    assert processor.run(output_file, project)
+    return processor
+
+
+def generated_at(output_file):
+    return json.loads(output_file.read_text())["metadata"]["generatedAt"]
+
+
+def test_write_if_changed_skips_identical_content(tmp_path):
+    output_file = tmp_path / "out" / "tasks.json"
+
+    assert write_if_changed(output_file, b"{}")
+    os.utime(output_file, ns=(0, 0))
+    assert not write_if_changed(output_file, b"{}")
+    assert output_file.stat().st_mtime_ns == 0
+
+    assert write_if_changed(output_file, b"{ }")
+    assert output_file.read_bytes() == b"{ }"
+
+
+def test_repeated_runs_write_identical_bytes(project, tmp_path):
+    first, second = tmp_path / "first.json", tmp_path / "second.json"
+    run_deterministic(project, first)
+    run_deterministic(project, second)
+
+    assert first.read_bytes() == second.read_bytes()
+
+
+def test_generated_at_comes_from_the_newest_source(project, tmp_path, monkeypatch):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    for number, source in enumerate(sorted((project / ".krci-ai/tasks").iterdir())):
+        os.utime(source, (0, 1_700_000_000 + number))
+
+    output_file = tmp_path / "tasks.json"
+    run_deterministic(project, output_file)
+
+    assert generated_at(output_file) == "2023-11-14T22:13:21Z"
+
+
+def test_source_date_epoch_takes_precedence(project, tmp_path, monkeypatch):
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "0")
+
+    output_file = tmp_path / "tasks.json"
+    run_deterministic(project, output_file)
+
+    assert generated_at(output_file) == "1970-01-01T00:00:00Z"
+
+
+def test_unchanged_content_keeps_timestamp_and_file(project, tmp_path, monkeypatch):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    output_file = tmp_path / "tasks.json"
+    run_deterministic(project, output_file)
+    first_timestamp = generated_at(output_file)
+    os.utime(output_file, ns=(0, 0))
+
+    # A touched source moves the newest mtime, but the items are the same
+    os.utime(project / ".krci-ai/tasks/code-review.md")
+    run_deterministic(project, output_file)
+
+    assert generated_at(output_file) == first_timestamp
+    assert output_file.stat().st_mtime_ns == 0
+
+
+def test_changed_content_gets_a_new_timestamp(project, tmp_path, monkeypatch):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    tasks = project / ".krci-ai/tasks"
+    for source in tasks.iterdir():
+        os.utime(source, (0, 1_600_000_000))
+    output_file = tmp_path / "tasks.json"
+    run_deterministic(project, output_file)
+
+    added = tasks / "triage.md"
+    added.write_text("# Triage Task\n")
+    os.utime(added, (0, 1_700_000_000))
+    run_deterministic(project, output_file)
+
+    assert generated_at(output_file) == "2023-11-14T22:13:20Z"
+
+
+def test_patches_that_only_delete_keep_the_source_epoch(project, tmp_path, monkeypatch):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    tasks = project / ".krci-ai/tasks"
+    for source in tasks.iterdir():
+        os.utime(source, (0, 1_700_000_000))
+    output_file = tmp_path / "tasks.json"
+    run_deterministic(project, output_file)
+
+    (tasks / "release-notes.md").unlink()
+    outputs = []
+    for _ in range(2):
+        # A fresh processor, as after a watch restart, only knows the epoch from the output
+        processor = load_processor("tasks")
+        processor.deterministic = True
+        assert processor.patch_output(output_file, [tasks / "release-notes.md"])
+        outputs.append(output_file.read_bytes())
+
+    assert generated_at(output_file) == "2023-11-14T22:13:20Z"
+    assert outputs[0] == outputs[1]
@@ -0,0 +1,110 @@
+""".krciignore matching and single-walk source discovery."""
+
+from pathlib import Path
+
+import pytest
+
+from conftest import write_files
+from file_discovery import IgnoreRules, is_source_file, iter_source_files
+
+
+def relative(paths, root: Path):
+    return [path.relative_to(root).as_posix() for path in paths]
+
+
+@pytest.fixture
+def content(tmp_path: Path) -> Path:
+    """A .krci-ai tree with drafts, nested directories and non-source files."""
+    return write_files(tmp_path / ".krci-ai", {
+        "tasks/b.md": "b",
+        "tasks/a.md": "a",
+        "tasks/notes.txt": "not a source",
+        "tasks/drafts/c.md": "c",
+        "tasks/nested/d.yaml": "d",
+        "tasks/nested/e.md": "e",
+        "templates/t.md": "t",
+        "README.md": "top-level file",
+    })
+
+
+def test_walk_yields_matching_files_in_sorted_order(content):
+    files = list(iter_source_files(content / "tasks", {".md", ".yaml"}))
+
+    assert relative(files, content) == ["tasks/a.md", "tasks/b.md", "tasks/drafts/c.md",
+                                        "tasks/nested/d.yaml", "tasks/nested/e.md"]
+    assert files == sorted(files)
+
+
+def test_top_level_dirs_limit_the_walk(content):
+    files = iter_source_files(content, {".md"}, top_level_dirs={"templates"})
+
+    assert relative(files, content) == ["templates/t.md"]
+
+
+@pytest.mark.parametrize("patterns, expected", [
+    # A bare name matches at any depth
+    ("e.md", ["a.md", "b.md", "drafts/c.md", "nested/d.yaml"]),
+    # A glob on names
+    ("*.yaml", ["a.md", "b.md", "drafts/c.md", "nested/e.md"]),
+    # A trailing slash only matches directories
+    ("drafts/", ["a.md", "b.md", "nested/d.yaml", "nested/e.md"]),
+    ("a.md/", ["a.md", "b.md", "drafts/c.md", "nested/d.yaml", "nested/e.md"]),
+    # Patterns with a slash are relative to the ignore file
+    ("nested/*.md", ["a.md", "b.md", "drafts/c.md", "nested/d.yaml"]),
+    ("/b.md", ["a.md", "drafts/c.md", "nested/d.yaml", "nested/e.md"]),
+    # Negation re-includes what an earlier pattern ignored
+    ("*.md\n!b.md", ["b.md", "nested/d.yaml"]),
+    # Comments and blank lines are skipped
+    ("# drafts/\n\n", ["a.md", "b.md", "drafts/c.md", "nested/d.yaml", "nested/e.md"]),
+])
+def test_ignore_patterns(content, patterns, expected):
+    (content / "tasks" / ".krciignore").write_text(patterns)
+
+    files = iter_source_files(content / "tasks", {".md", ".yaml"})
+
+    assert relative(files, content / "tasks") == expected
+
+
+def test_parent_ignore_file_applies_to_a_single_content_directory(content):
+    (content / ".krciignore").write_text("tasks/drafts/\n")
+
+    single = relative(iter_source_files(content / "tasks", {".md"}), content)
+    catalog = relative(iter_source_files(content, {".md"}, top_level_dirs={"tasks"}), content)
+
+    assert "tasks/drafts/c.md" not in single
+    assert single == catalog
+
+
+def test_nested_ignore_file_takes_precedence(content):
+    (content / "tasks" / ".krciignore").write_text("*.md\n")
+    (content / "tasks" / "nested" / ".krciignore").write_text("!e.md\n")
+
+    files = iter_source_files(content / "tasks", {".md"})
+
+    assert relative(files, content / "tasks") == ["nested/e.md"]
+
+
+def test_ignore_file_itself_is_never_a_source(content):
+    (content / "tasks" / ".krciignore").write_text("# nothing ignored\n")
+
+    files = iter_source_files(content / "tasks", {".krciignore", ".md"})
+
+    assert ".krciignore" not in [path.name for path in files]
+
+
+def test_empty_ignore_file_has_no_rules(tmp_path):
+    ignore_file = tmp_path / ".krciignore"
+    ignore_file.write_text("# only a comment\n\n")
+
+    assert IgnoreRules.load(ignore_file) is None
+    assert IgnoreRules.load(tmp_path / "missing") is None
+
+
+def test_is_source_file_agrees_with_the_walk(content):
+    (content / ".krciignore").write_text("drafts/\n*.yaml\n")
+    root = content / "tasks"
+    walked = set(iter_source_files(root, {".md", ".yaml"}))
+
+    candidates = [path for path in root.rglob("*") if path.is_file()] + [content / "templates/t.md"]
+    for path in candidates:
+        assert is_source_file(path, root, {".md", ".yaml"}) == (path in walked), path
@@ -0,0 +1,111 @@
+"""Markdown rendering and the pre-rendered item detail payloads."""
+
+import json
+
+import pytest
+
+from catalog_builder import CatalogBuilder
+from content_watcher import ChangeBatch, ContentWatcher
+from item_details import ItemDetailsWriter, detail_file_name, markdown_body
+from markdown_render import render_markdown
+
+
+def render(text):
+    return render_markdown(text).html
+
+
+def test_headings_get_unique_anchors_and_an_outline():
+    document = render_markdown("# Code *Review*\n\n## Steps\n\n## Steps\n")
+
+    assert document.html == ('<h1 id="code-review">Code <em>Review</em></h1>\n'
+                             '<h2 id="steps">Steps</h2>\n<h2 id="steps-1">Steps</h2>')
+    assert document.outline == [{"level": 1, "text": "Code Review", "id": "code-review"},
+                                {"level": 2, "text": "Steps", "id": "steps"},
+                                {"level": 2, "text": "Steps", "id": "steps-1"}]
+
+
+def test_instruction_tags_are_stripped_outside_code():
+    document = render_markdown("<instructions>\nFollow **these** steps.\n</instructions>\n\n"
+                               "```xml\n<example>\n```\n")
+
+    assert document.instruction_tags == ["instructions"]
+    assert document.html == ("<p>Follow <strong>these</strong> steps.</p>\n"
+                             '<pre><code class="language-xml">&lt;example&gt;\n</code></pre>')
+
+
+def test_lists_tables_and_quotes():
+    assert render("- one\n- two `x<y`\n\n3. three\n") == (
+        "<ul>\n<li>one</li>\n<li>two <code>x&lt;y</code></li>\n</ul>\n<ol start=\"3\">\n<li>three</li>\n</ol>")
+    assert render("| A | B |\n|:--|--:|\n| 1 | 2 |\n") == (
+        '<table>\n<thead>\n<tr><th style="text-align: left">A</th><th style="text-align: right">B</th></tr>\n'
+        '</thead>\n<tbody>\n<tr><td style="text-align: left">1</td><td style="text-align: right">2</td></tr>\n'
+        "</tbody>\n</table>")
+    assert render("> quoted\n> text\n") == "<blockquote>\n<p>quoted\ntext</p>\n</blockquote>"
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("<script>alert(1)</script>", "<p>&lt;script&gt;alert(1)&lt;/script&gt;</p>"),
+    ("[ok](https://example.com)", '<p><a href="https://example.com">ok</a></p>'),
+    ("[bad](javascript:alert(1))", "<p>[bad](javascript:alert(1))</p>"),
+])
+def test_raw_html_and_unsafe_links_are_escaped(text, expected):
+    assert render(text) == expected
+
+
+def test_markdown_body_drops_frontmatter():
+    assert markdown_body("---\nname: x\n---\n# Body\n") == "# Body\n"
+    assert markdown_body("# Body\n") == "# Body\n"
+
+
+def test_detail_file_names_are_path_safe():
+    assert detail_file_name("krci-ai/core-sdlc") == "krci-ai-core-sdlc.json"
+    assert detail_file_name("../..") == "item.json"
+
+
+def detail_writer(project, tmp_path):
+    return ItemDetailsWriter(tmp_path / "out", "tasks", project / ".krci-ai/tasks", ".krci-ai/tasks",
+                             tmp_path / "cache")
+
+
+ITEMS = [{"id": "code-review", "name": "Code Review", "path": ".krci-ai/tasks/code-review.md"},
+         {"id": "release-notes", "name": "Release Notes", "path": ".krci-ai/tasks/release-notes.md"}]
+
+
+def test_renders_are_cached_and_stale_payloads_removed(project, tmp_path):
+    first = detail_writer(project, tmp_path)
+    assert first.write(ITEMS) == 2
+    assert (first.written, first.cache.misses) == (2, 2)
+
+    second = detail_writer(project, tmp_path)
+    assert second.write(ITEMS[:1]) == 1
+    assert (second.written, second.unchanged, second.removed, second.cache.hits) == (0, 1, 1, 1)
+    assert [path.name for path in second.directory.iterdir()] == ["code-review.json"]
+
+    payload = json.loads((second.directory / "code-review.json").read_text())
+    assert payload["collection"] == "tasks"
+    assert payload["html"].startswith('<h1 id="code-review-task">')
+
+
+def test_items_without_a_readable_source_are_skipped(project, tmp_path):
+    writer = detail_writer(project, tmp_path)
+
+    assert writer.write([{"id": "gone", "path": ".krci-ai/tasks/gone.md"},
+                         {"id": "elsewhere", "path": "other/x.md"}, ITEMS[0], dict(ITEMS[0])]) == 1
+
+
+def test_watch_changes_refresh_the_catalog_outputs(project, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    builder = CatalogBuilder(project, tmp_path / "out")
+    assert builder.build()
+    watcher = ContentWatcher(builder.watch_targets(), force_polling=True, on_change=builder.refresh_catalog)
+    detail_file = tmp_path / "out/details/tasks/code-review.json"
+    added = project / ".krci-ai/tasks/triage.md"
+    added.write_text("# Triage Task\n\nSort incoming issues.\n")
+    (project / ".krci-ai/tasks/code-review.md").write_text("# Code Review Task\n\nEdited body.\n")
+
+    watcher.apply(ChangeBatch(paths={added, project / ".krci-ai/tasks/code-review.md"}))
+
+    assert "Edited body." in json.loads(detail_file.read_text())["html"]
+    assert (tmp_path / "out/details/tasks/triage.json").exists()
+    graph = json.loads((tmp_path / "out/graph.json").read_text())
+    assert "triage" in [item_id for _, item_id in graph["nodes"]]
@@ -0,0 +1,164 @@
+"""Matching source files to existing items by path, id or stem."""
+
+import json
+
+from catalog_builder import load_processor
+from item_index import ItemIndex, normalize_item_path
+
+
+def test_normalize_item_path():
+    assert normalize_item_path(".krci-ai\\data//./one/../two/x.md") == ".krci-ai/data/two/x.md"
+
+
+def test_keys_win_over_aliases():
+    index = ItemIndex()
+    index.add("data/a.md", "A", ["a"])
+    index.add("data/sub/b.md", "B", ["a-b", "b"])
+
+    assert index.find("data/a.md") == "A"
+    assert index.find("data/moved/b.md", "b") == "B"
+    assert index.find("data/moved/c.md", "c") is None
+    assert index.resolve("data/moved/b.md") is None
+
+
+def test_duplicate_keys_keep_the_first_item():
+    index = ItemIndex()
+
+    assert index.add("data/a.md", "first")
+    assert not index.add("data/a.md", "second")
+    assert index.get("data/a.md") == "first"
+    assert index.collisions == ["data/a.md"]
+    assert len(index) == 1
+
+
+def test_shared_aliases_match_nothing():
+    index = ItemIndex()
+    index.add("one/shared.md", "one", ["shared"])
+    index.add("two/shared.md", "two", ["shared"])
+    index.add("three/shared.md", "three", ["shared"])
+
+    assert index.find("moved/shared.md", "shared") is None
+    assert index.ambiguous == {"shared"}
+
+
+def write_existing(project, items):
+    output_file = project / "public/data/data.json"
+    output_file.parent.mkdir(parents=True)
+    output_file.write_text(json.dumps({"dataFiles": items, "metadata": {}}), encoding="utf-8")
+    return output_file
+
+
+def test_same_named_files_in_different_folders_keep_their_own_items(project):
+    data_dir = project / ".krci-ai/data"
+    for folder in ("one", "two"):
+        (data_dir / folder).mkdir()
+        (data_dir / folder / "shared.md").write_text("# Shared\n\nA body line that is long enough.\n")
+    output_file = write_existing(project, [
+        {"id": "shared", "path": ".krci-ai/data/one/shared.md", "description": "Curated one"},
+        {"id": "shared", "path": ".krci-ai/data/two/shared.md", "description": "Curated two"},
+    ])
+
+    processor = load_processor("data")
+    assert processor.run(output_file, project)
+
+    descriptions = {item["path"]: item["description"] for item in json.loads(output_file.read_text())["dataFiles"]}
+    assert descriptions[".krci-ai/data/one/shared.md"] == "Curated one"
+    assert descriptions[".krci-ai/data/two/shared.md"] == "Curated two"
+
+
+def test_moved_files_match_by_unique_stem(project):
+    output_file = write_existing(project, [
+        {"id": "engineering-principles", "path": ".krci-ai/data/old/engineering-principles.md",
+         "description": "Curated"},
+    ])
+
+    assert load_processor("data").run(output_file, project)
+
+    [item] = json.loads(output_file.read_text())["dataFiles"]
+    assert (item["path"], item["description"]) == (".krci-ai/data/engineering-principles.md", "Curated")
+
+
+def test_duplicate_existing_entries_are_reported(project):
+    entry = {"id": "engineering-principles", "path": ".krci-ai/data/engineering-principles.md"}
+    output_file = write_existing(project, [entry, entry])
+
+    processor = load_processor("data")
+    processor.load_existing_data(output_file)
+
+    assert processor.warnings == ["data.json: Duplicate existing entries for "
+                                  "'.krci-ai/data/engineering-principles.md', keeping the first"]
+
+
+def test_aliases_skip_items_claimed_by_a_live_source():
+    index = ItemIndex()
+    index.add("tasks/a/foo.md", "A", ["foo"])
+
+    assert index.resolve("tasks/b/foo.md", "foo") == "tasks/a/foo.md"
+    assert index.resolve("tasks/b/foo.md", "foo", claimed={"tasks/a/foo.md"}) is None
+
+
+def same_stem_project(project):
+    tasks_dir = project / ".krci-ai/tasks"
+    (tasks_dir / "a").mkdir()
+    (tasks_dir / "a" / "foo.md").write_text("# Foo Task\n")
+    output_file = project / "public/data/tasks.json"
+    output_file.parent.mkdir(parents=True)
+    output_file.write_text(json.dumps({"tasks": [
+        {"id": "foo", "name": "Curated Foo", "description": "Curated description",
+         "categories": ["Development"], "path": ".krci-ai/tasks/a/foo.md"},
+    ]}), encoding="utf-8")
+    (tasks_dir / "b").mkdir()
+    (tasks_dir / "b" / "foo.md").write_text("# Foo Task\n")
+    return output_file
+
+
+def tasks_by_path(output_file):
+    return {item["path"]: item for item in json.loads(output_file.read_text())["tasks"]}
+
+
+def test_new_files_do_not_take_over_a_same_named_item(project):
+    output_file = same_stem_project(project)
+
+    processor = load_processor("tasks")
+    assert processor.run(output_file, project)
+
+    items = tasks_by_path(output_file)
+    assert items[".krci-ai/tasks/a/foo.md"]["description"] == "Curated description"
+    assert items[".krci-ai/tasks/b/foo.md"]["description"] != "Curated description"
+    assert items[".krci-ai/tasks/b/foo.md"]["categories"] == []
+    statuses = {entry["file"]: entry["status"] for entry in processor.item_log}
+    assert statuses[str(project / ".krci-ai/tasks/a/foo.md")] == "preserved"
+    assert statuses[str(project / ".krci-ai/tasks/b/foo.md")] == "new"
+
+
+def test_watch_patches_keep_a_same_named_item(project):
+    output_file = same_stem_project(project)
+    added = project / ".krci-ai/tasks/b/foo.md"
+    added.unlink()
+    processor = load_processor("tasks")
+    assert processor.run(output_file, project)
+    added.write_text("# Foo Task\n")
+
+    assert processor.patch_output(output_file, [added])
+
+    items = tasks_by_path(output_file)
+    assert set(items) == {".krci-ai/tasks/a/foo.md", ".krci-ai/tasks/b/foo.md",
+                          ".krci-ai/tasks/code-review.md", ".krci-ai/tasks/release-notes.md"}
+    assert items[".krci-ai/tasks/a/foo.md"]["name"] == "Curated Foo"
+    assert processor.item_status_counts() == {"new": 1}
+
+
+def test_moved_files_keep_their_item_in_watch_mode(project):
+    output_file = same_stem_project(project)
+    (project / ".krci-ai/tasks/b/foo.md").unlink()
+    processor = load_processor("tasks")
+    assert processor.run(output_file, project)
+    old, new = project / ".krci-ai/tasks/a/foo.md", project / ".krci-ai/tasks/c/foo.md"
+    new.parent.mkdir()
+    old.rename(new)
+
+    assert processor.patch_output(output_file, [old, new])
+
+    items = tasks_by_path(output_file)
+    assert ".krci-ai/tasks/a/foo.md" not in items
+    assert items[".krci-ai/tasks/c/foo.md"]["name"] == "Curated Foo"
@@ -0,0 +1,95 @@
+"""Streaming collection writer and reader."""
+
+import json
+import os
+
+import pytest
+
+from catalog_records import TaskRecord
+from json_stream import CollectionReader, CollectionWriter
+
+ITEMS = [
+    {"id": "a", "name": "Ünïcode \"quoted\"\nline", "score": 12.5, "tags": [], "nested": {"x": [1, {}]}},
+    {"id": "b", "name": "B", "score": -3e-07, "tags": ["t"], "nested": None},
+]
+METADATA = {"total": 2, "categories": ["Development"]}
+
+
+def write_collection(output_file, items=ITEMS, metadata=METADATA):
+    with CollectionWriter(output_file) as writer:
+        writer.write_items("tasks", items)
+        writer.write_value("metadata", metadata)
+    return writer
+
+
+@pytest.mark.parametrize("items", [ITEMS, []])
+def test_writer_matches_json_dump(tmp_path, items):
+    output_file = tmp_path / "tasks.json"
+    write_collection(output_file, items)
+
+    expected = json.dumps({"tasks": items, "metadata": METADATA}, indent=2, ensure_ascii=False)
+    assert output_file.read_text(encoding="utf-8") == expected
+
+
+def test_writer_encodes_records(tmp_path):
+    output_file = tmp_path / "tasks.json"
+    write_collection(output_file, [TaskRecord.from_dict(item) for item in ITEMS])
+
+    assert json.loads(output_file.read_text())["tasks"] == ITEMS
+
+
+def test_unchanged_output_is_not_replaced(tmp_path):
+    output_file = tmp_path / "tasks.json"
+    assert write_collection(output_file).changed
+    os.utime(output_file, ns=(0, 0))
+
+    assert not write_collection(output_file).changed
+    assert output_file.stat().st_mtime_ns == 0
+    assert list(tmp_path.iterdir()) == [output_file]
+
+
+def test_failed_writes_leave_the_previous_output(tmp_path):
+    output_file = tmp_path / "tasks.json"
+    write_collection(output_file)
+    before = output_file.read_bytes()
+
+    def failing_items():
+        yield ITEMS[0]
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        write_collection(output_file, failing_items())
+
+    assert output_file.read_bytes() == before
+    assert list(tmp_path.iterdir()) == [output_file]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64 * 1024])
+def test_reader_yields_items_then_metadata(tmp_path, chunk_size):
+    input_file = tmp_path / "tasks.json"
+    input_file.write_text(json.dumps({"tasks": ITEMS, "metadata": METADATA}, indent=2), encoding="utf-8")
+
+    reader = CollectionReader(input_file, "tasks", chunk_size=chunk_size)
+
+    assert list(reader) == ITEMS
+    assert reader.rest == {"metadata": METADATA}
+
+
+def test_reader_handles_compact_and_empty_documents(tmp_path):
+    input_file = tmp_path / "tasks.json"
+    input_file.write_text('{"metadata":{"total":0},"tasks":[]}')
+    reader = CollectionReader(input_file, "tasks", chunk_size=2)
+    assert list(reader) == []
+    assert reader.rest == {"metadata": {"total": 0}}
+
+    input_file.write_text("{}")
+    assert list(CollectionReader(input_file, "tasks")) == []
+
+
+@pytest.mark.parametrize("text", ['{"tasks": [1, 2', '{"tasks": [1 2]}', '[]', '{"tasks": [1], 3: 4}'])
+def test_reader_rejects_malformed_documents(tmp_path, text):
+    input_file = tmp_path / "tasks.json"
+    input_file.write_text(text)
+
+    with pytest.raises(json.JSONDecodeError):
+        list(CollectionReader(input_file, "tasks", chunk_size=4))
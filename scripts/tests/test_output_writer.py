@@ -0,0 +1,156 @@
+"""Catalog output layouts and encodings."""
+
+import gzip
+import json
+
+import output_writer
+from catalog_builder import load_processor
+from output_writer import (OutputEncoding, ShardingOptions, compress, content_hash, serialize, slugify,
+                           to_columnar, write_encoded, write_sharded_output)
+
+ITEMS = [
+    {"id": "a", "categories": ["Development"]},
+    {"id": "b", "categories": ["Development", "Marketing"]},
+    {"id": "c", "categories": []},
+    {"id": "d", "categories": ["Dev/Ops"]},
+    {"id": "e", "categories": ["dev ops"]},
+]
+
+
+def read_json(path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_fixed_size_shards_cover_all_items_in_order(tmp_path):
+    manifest_file = write_sharded_output(tmp_path / "tasks.json", "tasks", ITEMS, {"categories": ["Development"]},
+                                         ShardingOptions(shard_size=2))
+    manifest = read_json(manifest_file)
+
+    assert manifest_file == tmp_path / "tasks" / "manifest.json"
+    assert [shard["file"] for shard in manifest["shards"]] == ["shard-000.json", "shard-001.json", "shard-002.json"]
+    assert [shard["count"] for shard in manifest["shards"]] == [2, 2, 1]
+    assert (manifest["total"], manifest["shardBy"], manifest["shardSize"]) == (5, "size", 2)
+
+    items = []
+    for shard in manifest["shards"]:
+        data = (tmp_path / "tasks" / shard["file"]).read_bytes()
+        assert (shard["bytes"], shard["hash"]) == (len(data), content_hash(data))
+        items.extend(json.loads(data)["tasks"])
+    assert items == ITEMS
+
+
+def test_category_shards_repeat_multi_category_items(tmp_path):
+    manifest = read_json(write_sharded_output(tmp_path / "tasks.json", "tasks", ITEMS, {},
+                                              ShardingOptions(by_category=True)))
+    shards = {shard["file"]: shard for shard in manifest["shards"]}
+
+    def shard_ids(name):
+        return [item["id"] for item in read_json(tmp_path / "tasks" / name)["tasks"]]
+
+    assert shard_ids("category-development.json") == ["a", "b"]
+    assert shard_ids("category-marketing.json") == ["b"]
+    # Categories are sorted, and items without one come last
+    assert list(shards)[-1] == "category-uncategorized.json"
+    assert shards["category-uncategorized.json"]["category"] is None
+    # Categories with the same slug get distinct files
+    assert shards["category-dev-ops.json"]["category"] == "Dev/Ops"
+    assert shards["category-dev-ops-2.json"]["category"] == "dev ops"
+
+
+def test_stale_shards_are_removed_when_the_layout_changes(tmp_path):
+    output_file = tmp_path / "tasks.json"
+    write_sharded_output(output_file, "tasks", ITEMS, {}, ShardingOptions(shard_size=1))
+    (tmp_path / "tasks" / "notes.txt").write_text("kept")
+
+    write_sharded_output(output_file, "tasks", ITEMS, {}, ShardingOptions(shard_size=10))
+
+    assert sorted(path.name for path in (tmp_path / "tasks").iterdir()) == ["manifest.json", "notes.txt",
+                                                                             "shard-000.json"]
+
+
+def test_slugify():
+    assert slugify("Framework Core") == "framework-core"
+    assert slugify("  C++ / Rust ") == "c-rust"
+    assert slugify("!!!") == "uncategorized"
+
+
+def from_columnar(data, items_key):
+    """Rebuild row-oriented items from the columnar layout."""
+    table = data[items_key]
+    items = []
+    for row in table["rows"]:
+        item = {}
+        for column, value in zip(table["columns"], row):
+            if column == "categories" and isinstance(value, list):
+                value = [table["categoryTable"][index] for index in value]
+            item[column] = value
+        items.append(item)
+    return items
+
+
+def test_columnar_layout_round_trips():
+    data = {"tasks": [{"id": "a", "name": "A", "categories": ["Z", "Y"]},
+                      {"id": "b", "categories": ["Y"], "extra": 1}],
+            "metadata": {"totalTasks": 2}}
+
+    columnar = to_columnar(data, "tasks")
+
+    assert list(columnar) == ["tasks", "metadata"]
+    assert columnar["tasks"]["columns"] == ["id", "name", "categories", "extra"]
+    assert columnar["tasks"]["categoryTable"] == ["Y", "Z"]
+    assert columnar["tasks"]["rows"][1] == ["b", None, [0], 1]
+    assert from_columnar(columnar, "tasks") == [
+        {"id": "a", "name": "A", "categories": ["Z", "Y"], "extra": None},
+        {"id": "b", "name": None, "categories": ["Y"], "extra": 1},
+    ]
+
+
+def test_serialize_matches_json_dump_and_minifies():
+    data = {"name": "Ünïcode", "items": [1, {"a": None}]}
+
+    assert serialize(data) == json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    assert serialize(data, minify=True) == '{"name":"Ünïcode","items":[1,{"a":null}]}'.encode("utf-8")
+
+
+def test_gzip_output_is_reproducible():
+    data = b'{"tasks":[]}' * 100
+
+    assert compress(data, "gzip") == compress(data, "gzip")
+    assert gzip.decompress(compress(data, "gzip")) == data
+
+
+def test_compressed_siblings_share_the_source_mtime(tmp_path):
+    output_file = tmp_path / "tasks.json"
+
+    sizes = write_encoded(output_file, b'{"tasks":[]}', ["gzip"])
+
+    sibling = tmp_path / "tasks.json.gz"
+    assert set(sizes) == {"tasks.json", "tasks.json.gz"}
+    assert gzip.decompress(sibling.read_bytes()) == output_file.read_bytes()
+    assert sibling.stat().st_mtime_ns == output_file.stat().st_mtime_ns
+
+
+def test_unavailable_codec_is_skipped(tmp_path, monkeypatch):
+    monkeypatch.setattr(output_writer, "brotli", None)
+
+    sizes = write_encoded(tmp_path / "tasks.json", b"{}", ["brotli"])
+
+    assert list(sizes) == ["tasks.json"]
+    assert not (tmp_path / "tasks.json.br").exists()
+
+
+def test_processor_writes_minified_columnar_and_compressed_output(project, tmp_path):
+    pretty_file = tmp_path / "pretty" / "tasks.json"
+    assert load_processor("tasks").run(pretty_file, project)
+
+    processor = load_processor("tasks")
+    processor.encoding = OutputEncoding(minify=True, columnar=True, compress=["gzip"])
+    output_file = tmp_path / "encoded" / "tasks.json"
+    assert processor.run(output_file, project)
+
+    pretty = json.loads(pretty_file.read_text())
+    assert b"\n" not in output_file.read_bytes()
+    assert json.loads(output_file.read_text())["tasks"] == pretty["tasks"]
+    columnar = json.loads((tmp_path / "encoded" / "tasks.columnar.json").read_text())
+    assert from_columnar(columnar, "tasks") == pretty["tasks"]
+    assert gzip.decompress((tmp_path / "encoded" / "tasks.json.gz").read_bytes()) == output_file.read_bytes()
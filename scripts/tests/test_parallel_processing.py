@@ -0,0 +1,57 @@
+"""--jobs process pool: output and diagnostics match a sequential run."""
+
+import json
+
+import pytest
+
+from catalog_builder import load_processor
+from conftest import AGENT_YAML
+from parallel_processing import resolve_jobs
+
+
+def run(key, project, output_file, jobs):
+    processor = load_processor(key)
+    processor.jobs = jobs
+    succeeded = processor.run(output_file, project)
+    return succeeded, processor
+
+
+def add_sources(project, key, count):
+    """Add numbered source files, so the pool has work for several workers."""
+    directory = project / ".krci-ai" / key
+    for number in range(count):
+        if key == "agents":
+            (directory / f"agent-{number}.yaml").write_text(AGENT_YAML.replace("reviewer-v1", f"agent-{number}"))
+        else:
+            (directory / f"extra-{number}.md").write_text(f"# Extra {number}\n\nBody of item {number}.\n")
+
+
+@pytest.mark.parametrize("key", ["agents", "tasks", "templates", "data"])
+def test_pool_output_matches_sequential_run(key, project, tmp_path):
+    add_sources(project, key, 6)
+    _, sequential = run(key, project, tmp_path / "sequential.json", jobs=1)
+    _, pooled = run(key, project, tmp_path / "pooled.json", jobs=2)
+
+    items_key = sequential.get_items_key()
+    expected = json.loads((tmp_path / "sequential.json").read_text())[items_key]
+    assert json.loads((tmp_path / "pooled.json").read_text())[items_key] == expected
+
+
+def test_worker_errors_are_reported_in_discovery_order(project, tmp_path):
+    agents = project / ".krci-ai/agents"
+    (agents / "a-broken.yaml").write_text("persona: {}\n")
+    (agents / "z-broken.yaml").write_text("persona: {}\n")
+
+    succeeded, sequential = run("agents", project, tmp_path / "sequential.json", jobs=1)
+    assert not succeeded
+    succeeded, pooled = run("agents", project, tmp_path / "pooled.json", jobs=2)
+    assert not succeeded
+
+    assert pooled.errors == sequential.errors
+    assert [error.split(":")[0] for error in pooled.errors] == ["Error processing a-broken.yaml",
+                                                                "Error processing z-broken.yaml"]
+
+
+def test_resolve_jobs():
+    assert resolve_jobs(3) == 3
+    assert resolve_jobs(0) >= 1
@@ -0,0 +1,52 @@
+"""Per-run processing context."""
+
+from pathlib import Path
+
+import pytest
+
+from catalog_builder import load_processor
+from processing_context import ProcessingContext
+
+
+@pytest.fixture
+def context(tmp_path):
+    source_root = tmp_path / ".krci-ai" / "data"
+    return ProcessingContext("Data", source_root, tmp_path, tmp_path / "data.json")
+
+
+@pytest.mark.parametrize("relative,prefix", [
+    ("guide.md", ".krci-ai/data"),
+    ("sub/deeper/guide.md", ".krci-ai/data"),
+    ("sub/guide.md", None),
+])
+def test_relative_path_matches_calculate_relative_path(context, relative, prefix):
+    processor = load_processor("data")
+    file_path = context.source_root / relative
+
+    assert context.relative_path(file_path, prefix) == processor.calculate_relative_path(
+        file_path, context.source_root, prefix)
+
+
+def test_files_outside_the_source_root_fall_back_to_the_name(context):
+    assert context.relative_path(Path("/elsewhere/guide.md"), ".krci-ai/data") == ".krci-ai/data/guide.md"
+    assert context.relative_path(Path("/elsewhere/guide.md")) == "guide.md"
+
+
+def test_directory_prefixes_are_computed_once(context):
+    context.relative_path(context.source_root / "sub" / "a.md", "p")
+    context.relative_path(context.source_root / "sub" / "b.md", "p")
+
+    assert context.directory_prefixes == {(context.source_root / "sub", "p"): "p/sub"}
+
+
+def test_run_resolves_the_source_directory_once(project, tmp_path, monkeypatch):
+    processor = load_processor("data")
+    calls = []
+    find_source_directory = processor.find_source_directory
+    monkeypatch.setattr(processor, "find_source_directory",
+                        lambda root: calls.append(root) or find_source_directory(root))
+
+    assert processor.run(tmp_path / "data.json", project)
+
+    assert calls == [project]
+    assert processor.context.source_root == project / ".krci-ai/data"
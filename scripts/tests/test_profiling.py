@@ -0,0 +1,59 @@
+"""Run profiling: phases, per-file stats and report files."""
+
+import json
+
+from catalog_builder import load_processor
+from profiling import ProfileOptions, RunProfiler
+
+
+def run_data(project, tmp_path, profile=None):
+    processor = load_processor("data")
+    if profile:
+        processor.profile = profile
+    assert processor.run(tmp_path / "data.json", project)
+    return processor
+
+
+def test_profiled_runs_write_a_report_and_chrome_trace(project, tmp_path):
+    directory = tmp_path / "profile"
+    processor = run_data(project, tmp_path, ProfileOptions(enabled=True, directory=directory, chrome_trace=True))
+
+    report = json.loads((directory / "datafiles.profile.json").read_text())
+    assert {"discover", "process", "write"} <= {phase["name"] for phase in report["phases"]}
+    assert report["files"]["processed"] == 1
+    assert report["files"]["bytesRead"] > 0
+    assert report["outputBytes"] == (tmp_path / "data.json").stat().st_size
+    assert report["slowest"][0]["file"].endswith("engineering-principles.md")
+
+    trace = json.loads((directory / "datafiles.trace.json").read_text())
+    assert {event["cat"] for event in trace["traceEvents"]} == {"phase", "file"}
+    assert processor.profiler.enabled
+
+
+def test_unprofiled_runs_collect_no_per_file_stats(project, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    processor = run_data(project, tmp_path)
+
+    assert processor.profiler.files == []
+    assert processor.profiler.counters == {}
+    assert not any(key.startswith(("time.", "cpu.", "io.")) for key in processor.run_stats)
+    assert not (tmp_path / ".krci-profile").exists()
+
+
+def test_phases_are_timed_even_without_profiling():
+    profiler = RunProfiler("Tasks")
+    with profiler.phase("scan"):
+        pass
+
+    assert [phase["name"] for phase in profiler.phases] == ["scan"]
+    profiler.add_file("a.md", {"time.process": 1.0})
+    assert profiler.files == []
+
+
+def test_slowest_files_are_ranked_and_capped():
+    profiler = RunProfiler("Tasks", ProfileOptions(enabled=True, slowest=2))
+    for name, seconds in [("a.md", 0.1), ("b.md", 0.3), ("c.md", 0.2)]:
+        profiler.add_file(name, {"time.process": seconds, "io.bytes_read": 10})
+
+    assert [entry["file"] for entry in profiler.slowest_files()] == ["b.md", "c.md"]
+    assert profiler.report()["files"]["bytesRead"] == 30
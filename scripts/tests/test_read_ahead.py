@@ -0,0 +1,102 @@
+"""Bounded, ordered read-ahead of source files."""
+
+import json
+import threading
+
+from catalog_builder import load_processor
+from content_source import SourceError
+from read_ahead import ReadAhead, ReadAheadOptions
+
+
+def source_files(tmp_path, sizes):
+    files = []
+    for number, size in enumerate(sizes):
+        path = tmp_path / f"{number}.md"
+        path.write_bytes(b"x" * size)
+        files.append(path)
+    return files
+
+
+def test_disabled_by_default(tmp_path):
+    [path] = source_files(tmp_path, [10])
+
+    with ReadAhead([path]) as read_ahead:
+        assert read_ahead.executor is None
+        assert read_ahead.take(path) is None
+
+
+def test_files_are_handed_out_in_order(tmp_path):
+    files = source_files(tmp_path, [1, 2, 3, 4, 5])
+
+    with ReadAhead(files, ReadAheadOptions(depth=2)) as read_ahead:
+        assert read_ahead.take(files[1]) is None
+        assert [len(read_ahead.take(path)) for path in files] == [1, 2, 3, 4, 5]
+
+    assert (read_ahead.stats.files, read_ahead.stats.bytes) == (5, 15)
+
+
+def test_depth_bounds_the_reads_in_flight(tmp_path):
+    files = source_files(tmp_path, [100] * 6)
+    release = threading.Event()
+
+    def slow_reader(path):
+        release.wait()
+        return path.read_bytes()
+
+    with ReadAhead(files, ReadAheadOptions(depth=3), slow_reader) as read_ahead:
+        assert [path for path, _ in read_ahead.pending] == files[:3]
+        release.set()
+
+
+def test_buffered_bytes_bound_new_reads(tmp_path):
+    files = source_files(tmp_path, [100] * 8)
+    release = threading.Event()
+
+    def gated_reader(path):
+        release.wait()
+        return path.read_bytes()
+
+    with ReadAhead(files, ReadAheadOptions(depth=4, max_bytes=150), gated_reader) as read_ahead:
+        # No size is known before the first read finishes, so the depth is filled
+        release.set()
+        for _, future in read_ahead.pending:
+            future.result()
+        read_ahead.take(files[0])
+        # 300 bytes are still buffered, so nothing new starts
+        assert [path for path, _ in read_ahead.pending] == files[1:4]
+
+        for path in files[1:4]:
+            read_ahead.take(path)
+        # One read is always allowed; a second only while the estimate is below the limit
+        assert [path for path, _ in read_ahead.pending] == files[4:6]
+
+    assert read_ahead.stats.peak_bytes == 400
+
+
+def test_failed_reads_are_left_to_the_processor(tmp_path):
+    files = source_files(tmp_path, [1, 1])
+
+    def reader(path):
+        if path == files[0]:
+            raise SourceError("member vanished")
+        raise OSError("permission denied")
+
+    with ReadAhead(files, ReadAheadOptions(depth=2), reader) as read_ahead:
+        assert [read_ahead.take(path) for path in files] == [None, None]
+
+    assert read_ahead.stats.failed == 2
+
+
+def test_prefetched_runs_match_plain_runs(project, tmp_path):
+    plain_file = tmp_path / "plain.json"
+    assert load_processor("data").run(plain_file, project)
+    (project / ".krci-ai/data/glossary.md").write_text("# Glossary\n\nTerms used across the framework.\n")
+    assert load_processor("data").run(plain_file, project)
+
+    processor = load_processor("data")
+    processor.read_ahead = ReadAheadOptions(depth=4)
+    prefetched_file = tmp_path / "prefetched.json"
+    assert processor.run(prefetched_file, project)
+
+    assert json.loads(prefetched_file.read_text())["dataFiles"] == json.loads(plain_file.read_text())["dataFiles"]
+    assert processor.read_ahead_stats.files == 2
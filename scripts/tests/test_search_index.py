@@ -0,0 +1,120 @@
+"""Prebuilt catalog search indexes."""
+
+import base64
+
+import pytest
+
+from search_index import (NGRAM_FIELDS, CatalogIndexBuilder, NgramIndexBuilder, SearchIndexBuilder, delta_decode,
+                          delta_encode, encode_bitset, field_text, tokenize)
+
+TASKS = [
+    {"id": "code-review", "name": "Code Review", "description": "Review a change", "categories": ["Development"]},
+    {"id": "release-notes", "name": "Release Notes", "description": "Summarize a release",
+     "categories": ["Development", "Marketing"]},
+]
+AGENTS = [
+    {"id": "pmm-v1", "name": "Madison Marketer", "description": "Product marketing", "role": "PMM",
+     "categories": [" Marketing "], "commands": {"brief": "Create a release brief"}},
+]
+
+
+def decode_bitset(encoded: str):
+    bits = base64.b64decode(encoded)
+    return [doc_id for doc_id in range(len(bits) * 8) if bits[doc_id >> 3] & (1 << (doc_id & 7))]
+
+
+def build_index():
+    index = SearchIndexBuilder()
+    index.add_collection("tasks", TASKS)
+    index.add_collection("agents", AGENTS)
+    return index.build()
+
+
+def test_tokenize_case_folds_and_splits_on_punctuation():
+    assert tokenize("Pain-Gains_Reveals: ÉCOLE 2.0") == ["pain", "gains", "reveals", "école", "2", "0"]
+
+
+def test_documents_are_numbered_in_collection_order():
+    index = build_index()
+
+    assert index["types"] == ["tasks", "agents"]
+    assert index["documents"] == [[0, "code-review"], [0, "release-notes"], [1, "pmm-v1"]]
+    assert index["typeRanges"] == {"tasks": [0, 2], "agents": [2, 3]}
+
+
+def test_terms_map_to_ascending_document_ids():
+    terms = build_index()["terms"]
+
+    assert terms["release"] == [1]
+    assert terms["marketing"] == [1, 2]
+    assert terms["pmm"] == [2]
+    # Fields outside the search fields are not indexed
+    assert "brief" not in terms
+    assert list(terms) == sorted(terms)
+
+
+def test_categories_are_trimmed_bitsets():
+    categories = build_index()["categories"]
+
+    assert {name: decode_bitset(bits) for name, bits in categories.items()} == {
+        "Development": [0, 1],
+        "Marketing": [1, 2],
+    }
+
+
+def test_encode_bitset_sets_one_bit_per_document():
+    assert decode_bitset(encode_bitset([0, 3, 9], 10)) == [0, 3, 9]
+    assert encode_bitset([], 0) == ""
+
+
+def build_ngram_index():
+    index = NgramIndexBuilder()
+    index.add_collection("tasks", TASKS)
+    index.add_collection("agents", AGENTS)
+    return index
+
+
+def brute_force(items, query):
+    """The client-side substring search the n-gram index replaces."""
+    query = query.lower()
+    return [doc_id for doc_id, item in enumerate(items)
+            if any(query in field_text(item.get(field)).lower() for field in NGRAM_FIELDS)]
+
+
+@pytest.mark.parametrize("query", ["", "r", "re", "rel", "release", "Review a", "brief", "MARKET", "xyz",
+                                   "notesum", "e r"])
+def test_ngram_search_matches_substring_search(query):
+    index = build_ngram_index()
+
+    assert index.search(query) == brute_force(TASKS + AGENTS, query)
+
+
+def test_grams_never_span_two_fields():
+    index = build_ngram_index()
+
+    # Name "Code Review" and description "Review a change" joined would match "review review"
+    assert "w r" not in index.postings
+    assert index.search("review review") == []
+
+
+def test_grams_are_gap_encoded():
+    index = build_ngram_index()
+    grams = index.build()["grams"]
+
+    assert index.build()["n"] == 3
+    assert delta_decode(grams["rel"]) == index.postings["rel"] == [1, 2]
+    assert grams["rel"] == [1, 1]
+
+
+def test_delta_encoding_round_trips():
+    assert delta_encode([2, 5, 6, 40]) == [2, 3, 1, 34]
+    assert delta_decode(delta_encode([2, 5, 6, 40])) == [2, 5, 6, 40]
+
+
+def test_index_builders_must_implement_indexing():
+    class Unbuildable(CatalogIndexBuilder):
+        def index_item(self, doc_id, item):
+            pass
+
+    with pytest.raises(TypeError):
+        Unbuildable(["name"])
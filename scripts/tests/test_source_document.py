@@ -0,0 +1,71 @@
+"""Shared, forward-only reads of one source file."""
+
+from source_document import DESCRIPTION_SCAN_LINES, SourceDocument
+
+BODY = "# Code Review\n\nShort.\n<role>\nPurpose: something long enough to qualify\n" \
+       "Review the change against the team's engineering principles.\n"
+
+
+def document(tmp_path, text, name="task.md"):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return SourceDocument(path)
+
+
+def test_description_skips_headers_tags_and_short_lines(tmp_path):
+    doc = document(tmp_path, BODY)
+
+    assert doc.description() == "Review the change against the team's engineering principles."
+
+
+def test_frontmatter_and_description_share_one_pass(tmp_path):
+    doc = document(tmp_path, "---\nname: Code Review\n---\n" + BODY + "tail\n" * 1000)
+
+    assert doc.frontmatter() == {"name": "Code Review"}
+    assert doc.description() == "Review the change against the team's engineering principles."
+    # Reading stopped at the description; the tail was never read
+    assert doc.bytes_read < 200
+
+
+def test_description_without_frontmatter_starts_at_the_top(tmp_path):
+    doc = document(tmp_path, "---\nnot closed, and long enough to be a description\n")
+
+    assert doc.frontmatter() is None
+    assert doc.description() == "not closed, and long enough to be a description"
+
+
+def test_fenced_code_is_not_a_description(tmp_path):
+    doc = document(tmp_path, "```yaml\nkey: a value that is long enough to qualify\n```\n"
+                             "The real description follows the code block.\n")
+
+    assert doc.description() == "The real description follows the code block."
+
+
+def test_description_scan_is_bounded(tmp_path):
+    doc = document(tmp_path, "# Title\n" * DESCRIPTION_SCAN_LINES + "A description that comes too late.\n")
+
+    assert doc.description() == ""
+    # Plus the first line, read once more after probing for frontmatter
+    assert doc.bytes_read == len("# Title\n") * (DESCRIPTION_SCAN_LINES + 1)
+
+
+def test_non_markdown_files_have_no_frontmatter(tmp_path):
+    doc = document(tmp_path, "---\nname: x\n---\n", name="agent.yaml")
+
+    assert doc.frontmatter() is None
+
+
+def test_read_ahead_data_is_used_without_opening_the_file(tmp_path):
+    doc = SourceDocument(tmp_path / "missing.md", data=BODY.encode("utf-8"))
+
+    assert doc.description() == "Review the change against the team's engineering principles."
+
+
+def test_results_are_memoized(tmp_path):
+    doc = document(tmp_path, BODY)
+    doc.description()
+    bytes_read = doc.bytes_read
+    doc.close()
+
+    assert doc.description() == "Review the change against the team's engineering principles."
+    assert doc.bytes_read == bytes_read
@@ -0,0 +1,92 @@
+"""Declarative batch validation and deduplicated diagnostics."""
+
+import pytest
+
+import validation_rules
+from catalog_records import TaskRecord
+from validation_rules import (CATEGORIES_TYPE, CATEGORY_CASE, CATEGORY_DUPLICATE, CATEGORY_EMPTY,
+                              CATEGORY_TYPE, CATEGORY_WHITESPACE, ERROR, PATH_PREFIX, REQUIRED_FIELD,
+                              WARNING, CategoryPolicy, DiagnosticLog, RuleSet)
+
+
+def item(**fields):
+    return {"id": "a", "name": "A", "description": "D", **fields}
+
+
+def validate(items, rules=None):
+    log = DiagnosticLog()
+    valid = (rules or RuleSet(path_prefix=".krci-ai/tasks/")).compile().validate(
+        [(f"{number}.md", entry) for number, entry in enumerate(items)], log)
+    return valid, log
+
+
+def findings(log):
+    return [(d.rule, d.severity, d.message, d.count) for d in log.entries.values()]
+
+
+@pytest.mark.parametrize("make", [dict, TaskRecord.from_dict])
+def test_missing_required_fields_reject_the_item(make):
+    valid, log = validate([make({"id": "a", "name": ""}), make(item())])
+
+    assert valid == [False, True]
+    assert findings(log) == [
+        (REQUIRED_FIELD, ERROR, "Missing required field 'name'", 1),
+        (REQUIRED_FIELD, ERROR, "Missing required field 'description'", 1),
+    ]
+
+
+def test_path_prefix_is_a_warning():
+    valid, log = validate([item(path=".krci-ai/tasks/a.md"), item(path="tasks/b.md")])
+
+    assert valid == [True, True]
+    assert findings(log) == [(PATH_PREFIX, WARNING, "Path should start with '.krci-ai/tasks/'", 1)]
+
+
+def test_category_findings():
+    valid, log = validate([item(categories=[" Development", "Development", "", 3, "devops", "QA"]),
+                           item(categories="Development")])
+
+    assert valid == [True, True]
+    assert {rule for rule, *_ in findings(log)} == {CATEGORY_WHITESPACE, CATEGORY_DUPLICATE, CATEGORY_EMPTY,
+                                                    CATEGORY_TYPE, CATEGORY_CASE, CATEGORIES_TYPE}
+    assert log.rendered(ERROR)[-1] == "1.md: Categories must be a list [categories-type]"
+
+
+def test_categories_are_normalized_per_item():
+    items = [item(categories=["Zeta ", "Alpha"]), item(categories=["Zeta ", "Alpha"])]
+
+    validate(items)
+
+    assert items[0]["categories"] == items[1]["categories"] == ["Alpha", "Zeta"]
+    assert items[0]["categories"] is not items[1]["categories"]
+
+
+def test_normalization_and_case_checks_can_be_disabled():
+    items = [item(categories=["zeta", "Alpha"])]
+
+    valid, log = validate(items, RuleSet(categories=CategoryPolicy(title_case=False, normalize=False)))
+
+    assert items[0]["categories"] == ["zeta", "Alpha"]
+    assert len(log) == 0
+
+
+def test_category_lists_are_checked_once():
+    rules = RuleSet().compile()
+    for _ in range(3):
+        rules.validate([("a.md", item(categories=["Development"]))], DiagnosticLog())
+
+    assert list(rules.category_results) == [("Development",)]
+
+
+def test_diagnostics_are_deduplicated_with_sample_sources(monkeypatch):
+    monkeypatch.setattr(validation_rules, "SOURCE_SAMPLE_LIMIT", 2)
+
+    _, log = validate([item(name="")] * 4)
+
+    [diagnostic] = log.entries.values()
+    assert diagnostic.count == 4
+    assert diagnostic.render() == ("Missing required field 'name' [required-field] - "
+                                   "4 items: 0.md, 1.md and 2 more")
+    assert log.to_report() == [{"rule": REQUIRED_FIELD, "severity": ERROR,
+                                "message": "Missing required field 'name'", "count": 4,
+                                "sources": ["0.md", "1.md"]}]
@@ -0,0 +1,83 @@
+"""YAML backend selection and frontmatter-only reads."""
+
+import importlib
+import io
+
+import pytest
+import yaml
+
+import yaml_loader
+from catalog_builder import load_processor
+from yaml_loader import load_yaml, read_frontmatter_block
+
+
+class LineReader:
+    """A readline()-only stream that records how many lines were consumed."""
+
+    def __init__(self, text):
+        self.lines = io.StringIO(text)
+        self.calls = 0
+
+    def readline(self):
+        self.calls += 1
+        return self.lines.readline()
+
+
+def test_frontmatter_block_stops_at_the_closing_delimiter():
+    reader = LineReader("---\nname: Code Review\ntags: [a]\n---\n# Body\n" + "more body\n" * 100)
+
+    assert read_frontmatter_block(reader) == "name: Code Review\ntags: [a]\n"
+    assert reader.calls == 4
+
+
+def test_files_without_frontmatter_return_none():
+    assert read_frontmatter_block(io.StringIO("# Title\n---\nname: x\n---\n")) is None
+    # An unclosed block is body text, not frontmatter
+    assert read_frontmatter_block(io.StringIO("---\nname: x\n")) is None
+    assert read_frontmatter_block(io.StringIO("")) is None
+
+
+def test_empty_frontmatter_block():
+    assert read_frontmatter_block(io.StringIO("---\n---\nbody\n")) == ""
+
+
+def test_pure_python_escape_hatch(monkeypatch):
+    try:
+        monkeypatch.setenv("KRCI_YAML_PURE_PYTHON", "1")
+        importlib.reload(yaml_loader)
+        assert (yaml_loader.SafeLoader, yaml_loader.YAML_BACKEND) == (yaml.SafeLoader, "pure-python")
+
+        monkeypatch.delenv("KRCI_YAML_PURE_PYTHON")
+        importlib.reload(yaml_loader)
+        if hasattr(yaml, "CSafeLoader"):
+            assert (yaml_loader.SafeLoader, yaml_loader.YAML_BACKEND) == (yaml.CSafeLoader, "libyaml")
+    finally:
+        importlib.reload(yaml_loader)
+
+
+def test_both_backends_parse_alike(project, monkeypatch):
+    agent_file = project / ".krci-ai/agents/reviewer.yaml"
+    default = load_yaml(agent_file.read_text())
+    try:
+        monkeypatch.setenv("KRCI_YAML_PURE_PYTHON", "1")
+        importlib.reload(yaml_loader)
+        assert yaml_loader.load_yaml(agent_file.read_text()) == default
+    finally:
+        monkeypatch.delenv("KRCI_YAML_PURE_PYTHON")
+        importlib.reload(yaml_loader)
+
+
+def test_safe_loading_rejects_python_tags():
+    with pytest.raises(yaml.YAMLError):
+        load_yaml("!!python/object/apply:os.system ['true']")
+
+
+def test_processors_count_parses_per_backend_path(project, tmp_path):
+    agents = load_processor("agents")
+    assert agents.run(tmp_path / "agents.json", project)
+    assert agents.run_stats["yaml.documents"] == 1
+
+    tasks = load_processor("tasks")
+    tasks.collect_references = True
+    assert tasks.run(tmp_path / "tasks.json", project)
+    assert tasks.run_stats["yaml.frontmatter"] == 1
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Validation Rules
+
+Declarative validation rules per content type (required fields, path prefix,
+category policy), compiled once per processor and run over a whole batch of
+processed items in one pass.
+
+Findings are collected as structured diagnostics: each has a rule id and a
+severity and is deduplicated by rule and message, so a problem shared by
+thousands of items is reported once with a count and a few example sources.
+"""
+
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from catalog_records import MISSING, CatalogRecord
+
+
+ERROR = "error"
+WARNING = "warning"
+
+# Example sources listed per diagnostic; the count covers all of them
+SOURCE_SAMPLE_LIMIT = 5
+
+# Rule ids
+REQUIRED_FIELD = "required-field"
+PATH_PREFIX = "path-prefix"
+CATEGORIES_TYPE = "categories-type"
+CATEGORY_TYPE = "category-type"
+CATEGORY_EMPTY = "category-empty"
+CATEGORY_DUPLICATE = "category-duplicate"
+CATEGORY_WHITESPACE = "category-whitespace"
+CATEGORY_CASE = "category-case"
+
+
+@dataclass(frozen=True)
+class CategoryPolicy:
+    """How item categories are checked and normalized."""
+    # Warn about categories that are all lower or all upper case
+    title_case: bool = True
+    # Store the trimmed, deduplicated, sorted list on the item
+    normalize: bool = True
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    """Validation rules for one content type; see compile()."""
+    # Fields that must be present and non-empty; a missing one rejects the item
+    required_fields: Tuple[str, ...] = ("id", "name", "description")
+    # Expected start of the item's 'path' (a warning when it differs)
+    path_prefix: Optional[str] = None
+    categories: CategoryPolicy = field(default_factory=CategoryPolicy)
+
+    def compile(self) -> "CompiledRules":
+        return CompiledRules(self)
+
+
+@dataclass
+class Diagnostic:
+    """One deduplicated finding: how often it occurred and where (first few sources)."""
+    rule: str
+    severity: str
+    message: str
+    count: int = 0
+    sources: List[str] = field(default_factory=list)
+
+    def render(self) -> str:
+        if self.count == 1:
+            return f"{self.sources[0]}: {self.message} [{self.rule}]"
+        listed = ", ".join(self.sources)
+        more = f" and {self.count - len(self.sources)} more" if self.count > len(self.sources) else ""
+        return f"{self.message} [{self.rule}] - {self.count} items: {listed}{more}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"rule": self.rule, "severity": self.severity, "message": self.message,
+                "count": self.count, "sources": self.sources}
+
+
+class DiagnosticLog:
+    """
+    Diagnostics of one validation run, deduplicated by (rule, message).
+
+    Sources can be any objects (e.g. paths); `label` turns the few that are
+    listed into strings, so the others are never formatted.
+    """
+
+    def __init__(self, label: Callable[[Any], str] = str):
+        self.label = label
+        self.entries: Dict[Tuple[str, str], Diagnostic] = {}
+
+    def add(self, rule: str, severity: str, message: str, source: Any) -> None:
+        diagnostic = self.entries.get((rule, message))
+        if diagnostic is None:
+            diagnostic = self.entries[(rule, message)] = Diagnostic(rule, severity, message)
+        diagnostic.count += 1
+        if len(diagnostic.sources) < SOURCE_SAMPLE_LIMIT:
+            diagnostic.sources.append(self.label(source))
+
+    def rendered(self, severity: str) -> List[str]:
+        return [d.render() for d in self.entries.values() if d.severity == severity]
+
+    def to_report(self) -> List[Dict[str, Any]]:
+        return [d.to_dict() for d in self.entries.values()]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+# (rule, severity, message) findings of one category list
+Finding = Tuple[str, str, str]
+
+
+class CompiledRules:
+    """
+    A RuleSet prepared for batch validation.
+
+    Messages are built once at compile time, and category lists are checked
+    once per distinct list: items mostly repeat a few category combinations,
+    so a large batch costs little more than a dict lookup per item.
+    """
+
+    def __init__(self, rules: RuleSet):
+        self.rules = rules
+        self.required_messages = tuple(f"Missing required field '{name}'" for name in rules.required_fields)
+        self.path_prefix = rules.path_prefix
+        self.path_message = f"Path should start with '{rules.path_prefix}'"
+        self.normalize = rules.categories.normalize
+        self.category_results: Dict[Tuple[Any, ...], Tuple[List[Any], List[Finding]]] = {}
+        # Every field the rules read, fetched per item in one call (see field_getter)
+        self.fields = (*rules.required_fields, "path", "categories")
+        self.getters: Dict[type, Callable[[Any], Tuple[Any, ...]]] = {}
+
+    def field_getter(self, item_type: type) -> Callable[[Any], Tuple[Any, ...]]:
+        """Getter returning self.fields of an item, with MISSING for absent fields."""
+        getter = self.getters.get(item_type)
+        if getter is None:
+            if issubclass(item_type, CatalogRecord) and item_type.KEY_SET.issuperset(self.fields):
+                getter = attrgetter(*self.fields)
+            else:
+                fields = self.fields
+                getter = lambda item: tuple(item.get(name, MISSING) for name in fields)
+            self.getters[item_type] = getter
+        return getter
+
+    def validate(self, batch: Sequence[Tuple[Any, Any]], log: DiagnosticLog) -> List[bool]:
+        """
+        Validate (source, item) pairs, recording findings in the log.
+
+        Items missing a required field are rejected. Other errors are
+        recorded (and fail the build) but keep the item, as do warnings.
+
+        Returns:
+            Whether each item is valid, in batch order
+        """
+        valid = []
+        add = log.add
+        path_prefix = self.path_prefix
+        for source, item in batch:
+            *required, path, categories = self.field_getter(type(item))(item)
+
+            # MISSING is falsy, so absent and empty fields fail alike
+            if not all(required):
+                for value, message in zip(required, self.required_messages):
+                    if not value:
+                        add(REQUIRED_FIELD, ERROR, message, source)
+                valid.append(False)
+                continue
+            valid.append(True)
+
+            if path_prefix is not None and path and not path.startswith(path_prefix):
+                add(PATH_PREFIX, WARNING, self.path_message, source)
+
+            if categories is not MISSING:
+                normalized, findings = self.check_categories(categories)
+                for rule, severity, message in findings:
+                    add(rule, severity, message, source)
+                if normalized is not None and self.normalize and normalized != categories:
+                    # Each item gets its own list, as items may be edited later
+                    item["categories"] = list(normalized)
+        return valid
+
+    def check_categories(self, categories: Any) -> Tuple[Optional[List[Any]], List[Finding]]:
+        """Findings and normalized form of a category list (None when it is not a list)."""
+        if not isinstance(categories, list):
+            return None, [(CATEGORIES_TYPE, ERROR, "Categories must be a list")]
+        try:
+            key = tuple(categories)
+            cached = self.category_results.get(key)
+        except TypeError:  # Unhashable entries (e.g. nested lists) are checked uncached
+            key, cached = None, None
+        if cached is None:
+            cached = self.evaluate_categories(categories)
+            if key is not None:
+                self.category_results[key] = cached
+        return cached
+
+    def evaluate_categories(self, categories: List[Any]) -> Tuple[List[Any], List[Finding]]:
+        findings: List[Finding] = []
+        unique = set()
+        duplicates = set()
+
+        for index, category in enumerate(categories):
+            if not isinstance(category, str):
+                findings.append((CATEGORY_TYPE, ERROR, f"Category at index {index} is not a string: {type(category)}"))
+                continue
+
+            trimmed = category.strip()
+            if not trimmed:
+                findings.append((CATEGORY_EMPTY, ERROR, f"Category at index {index} is empty or whitespace-only"))
+                continue
+
+            if trimmed in unique:
+                duplicates.add(trimmed)
+            else:
+                unique.add(trimmed)
+
+            if trimmed != category:
+                findings.append((CATEGORY_WHITESPACE, WARNING, f"Category '{category}' has leading/trailing whitespace"))
+
+            if self.rules.categories.title_case and (trimmed.lower() == trimmed or trimmed.upper() == trimmed):
+                findings.append((CATEGORY_CASE, WARNING, f"Category '{category}' should use Title Case"))
+
+        if duplicates:
+            findings.append((CATEGORY_DUPLICATE, ERROR, f"Duplicate categories found: {', '.join(sorted(duplicates))}"))
+
+        return sorted(unique), findings
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+YAML Loader
+
+Fast YAML parsing for the content processors: uses the libyaml-backed
+CSafeLoader when PyYAML was built with it, falling back to the pure-Python
+SafeLoader, and parses markdown frontmatter without reading file bodies.
+"""
+
+import os
+from typing import Any, Optional, TextIO, Union
+
+import yaml
+
+# KRCI_YAML_PURE_PYTHON is an escape hatch for comparing backends or working
+# around libyaml differences
+if hasattr(yaml, "CSafeLoader") and not os.environ.get("KRCI_YAML_PURE_PYTHON"):
+    SafeLoader = yaml.CSafeLoader
+    YAML_BACKEND = "libyaml"
+else:
+    SafeLoader = yaml.SafeLoader
+    YAML_BACKEND = "pure-python"
+
+FRONTMATTER_DELIMITER = "---"
+
+
+def load_yaml(stream: Union[str, bytes, TextIO]) -> Any:
+    """Parse a YAML document with the fastest available safe loader."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def read_frontmatter_block(stream: TextIO) -> Optional[str]:
+    """
+    Read only the frontmatter block from a text stream.
+
+    Stops at the closing delimiter, so the markdown body is never read.
+    Only readline() is used, so any line reader can be passed.
+
+    Returns:
+        The raw YAML between the delimiters, or None if there is no frontmatter
+    """
+    if stream.readline().strip() != FRONTMATTER_DELIMITER:
+        return None
+
+    block = []
+    line = stream.readline()
+    while line:
+        if line.strip() == FRONTMATTER_DELIMITER:
+            return "".join(block)
+        block.append(line)
+        line = stream.readline()
+
+    # No closing delimiter: not frontmatter
+    return None